@@ -0,0 +1,85 @@
+'''
+Micro-benchmark of Aroon Indicator kernels: Scan / Deque / Block Max.
+
+---
+
+Used to tune kernel selection thresholds in `ti_function_set/aroon.py`
+( `_SCAN_MAX_PERIOD`, `_SPECIALIZE_MAX_PERIOD` ).
+
+```bash
+python -m benchmarks.bench_aroon_kernels [data_size] [repeats]
+```
+'''
+
+import sys
+import time
+
+import numpy as np
+
+from technical_indicator_lib.ti_function_set.aroon import (
+    AROON_KERNEL_SCAN,
+    AROON_KERNEL_DEQUE,
+    AROON_KERNEL_BLOCK,
+    _build_aroon_specialized,
+    _get_aroon_kernel, )
+
+
+# -----------------------------------------------------------------------------------
+
+PERIODS: tuple = (2, 4, 8, 14, 16, 20, 25, 32, 48, 64, 100, 128, 200, 256, 500, 1000)
+
+KERNELS: dict = {
+        'scan':  AROON_KERNEL_SCAN,
+        'deque': AROON_KERNEL_DEQUE,
+        'block': AROON_KERNEL_BLOCK, }
+
+# -----------------------------------------------------------------------------------
+
+def _best_time(func, repeats: int) -> float:
+    '''
+    Returns best wall time of `repeats` calls, in seconds.
+    '''
+    func()  # Warm up ( JIT compilation ).
+
+    best_time: float = float('inf')
+
+    for _ in range(repeats):
+        start_time: float = time.perf_counter()
+        func()
+        best_time = min(best_time, time.perf_counter() - start_time)
+
+    return best_time
+
+def main(data_size: int = 2_000_000, repeats: int = 5) -> None:
+
+    rng:        np.random.Generator     = np.random.default_rng(0)
+    data_arr:   np.ndarray[np.float32]  = (100.0 + np.cumsum(rng.standard_normal(data_size))).astype(np.float32)
+    result_arr: np.ndarray[np.float32]  = np.empty_like(data_arr)
+
+    print(f'Aroon kernels, data_size = {data_size:,}, best of {repeats} ( ms ):')
+    print(f'{"period":>8}' + ''.join(f'{name:>10}' for name in KERNELS) + f'{"spec":>10}')
+
+    for period in PERIODS:
+        row: str = f'{period:>8}'
+
+        for kernel_id in KERNELS.values():
+            run_time: float = _best_time(
+                lambda: _get_aroon_kernel(data_arr, period, 0, data_size, result_arr, kernel_id),
+                repeats)
+            row += f'{run_time * 1000.0:>10.2f}'
+
+        if period <= 64:
+            kernel_spec     = _build_aroon_specialized(period)
+            run_time: float = _best_time(lambda: kernel_spec(data_arr), repeats)
+            row += f'{run_time * 1000.0:>10.2f}'
+
+        print(row)
+
+    return
+
+# -----------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:3]))
+
+# -----------------------------------------------------------------------------------
@@ -1,9 +1,31 @@
+import warnings
+
 from setuptools import setup, find_packages
 
+
+def get_ext_modules() -> list:
+    '''
+    AOT compiled extension ( numba.pycc ), optional.
+    Without numba at build time, library works in JIT mode only.
+    Any other failure to import / compile the kernels ( e.g. Numba typing or lowering error ) 
+        is reported as a warning, package is installed in JIT mode.
+    '''
+    try:
+        from technical_indicator_lib._aot_build import cc
+    except ImportError:
+        return []
+    except Exception as exc:
+        warnings.warn(f'AOT extension is skipped, JIT mode only: {type(exc).__name__}: {exc}')
+        return []
+    
+    return [cc.distutils_extension()]
+
+
 setup(
     name =         'ti_lib',
     version =      '0.0.1',
     packages =     find_packages(),
+    ext_modules =  get_ext_modules(),
     description =  'Technicla Indicator Lib',
     author =       'Dmitry Klimenko',
     author_email = 'klimenko.dnk@gmail.com',
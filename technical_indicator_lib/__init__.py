@@ -14,6 +14,16 @@ CONTAINS 4 MAIN TYPES OF FUNCTIONS:
 - Single Value Calulation ( VTSF ). Functions starts with 'vtsf_' prefix. Returns just a single selected value of the indicator. Suitable for streaming values, or to get just the last value.
 - Functions for use inside CUDA codespace only. Functions starts with 'cuda_v_' Returns just a single selected value of the indicator.
 
+---
+
+NOTES:
+------
+- Multi-core functions ( `_parallel`, `_batch*`, `_sweep` suffixes ) use the Numba threading layer. 
+    With 'workqueue' layer do NOT call them concurrently from several threads.
+- NumPy / dispatch functions ( `_np`, `_dispatch` suffixes, `get_pcnt_ch_p1()`, `get_pcnt_ch_mul()`, `get_pcnt_ch_v()`, `get_rsi_mask_lt()` ) 
+    are Python functions, they can NOT be called from inside `@numba.njit` functions.
+- Tile sizes of multi-core and bfloat16 kernels are shared, see `ti_function_set/_constants.py`.
+
 '''
 
 # -----------------------------------------------------------------------------------
@@ -35,15 +45,31 @@ VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date_
 from .ti_function_set import (
     get_shift,
     get_aroon,
+    get_aroon_dispatch,
     get_bb,
+    get_bb_dispatch,
     get_lr_exp_dev,
+    get_lr_exp_dev_np,
     get_lr_exp_dev_mini,
     get_lr_slope,
+    get_lr_slope_np,
+    get_lr_slope_dispatch,
     get_mabop_oc,
+    get_mabop_oc_dispatch,
     get_ones,
+    get_ones_view,
     get_pcnt_ch,
+    get_pcnt_ch_np,
+    get_pcnt_ch_p1,
+    get_pcnt_ch_mul,
+    get_pcnt_ch_v,
     get_rsi,
-    get_william_oc, )
+    get_rsi_np,
+    get_rsi_u8,
+    get_rsi_mask_lt,
+    get_william_oc,
+    get_william_oc_into,
+    get_william_oc_np, )
 
 
 # --- TECHNICAL INDICATORS - TSF ( Thread Safe Functions ): -------------------------
@@ -53,14 +79,61 @@ from .ti_function_set import (
 from .ti_function_set import (
     get_aroon_tsf           as tsf_aroon,
     get_bb_tsf              as tsf_bb,
+    get_bb_full_tsf         as tsf_bb_full,
     get_lr_exp_dev_mini_tsf as tsf_lr_exp_dev_mini,
     get_lr_slope_tsf        as tsf_lr_slope,
     get_mabop_oc_tsf        as tsf_mabop_oc,
     get_ones_tsf            as tsf_ones,
     get_pcnt_ch_tsf         as tsf_pcnt_ch,
     get_rsi_tsf             as tsf_rsi,
+    get_shift_tsf           as tsf_shift,
     get_william_oc_tsf      as tsf_william_oc, )
 
+# NOTE: Multi-core versions of TSF, calculated in parallel ( numba.prange ).
+
+from .ti_function_set import (
+    get_aroon_tsf_parallel           as tsf_aroon_parallel,
+    get_bb_tsf_parallel              as tsf_bb_parallel,
+    get_lr_exp_dev_mini_tsf_parallel as tsf_lr_exp_dev_mini_parallel,
+    get_lr_slope_tsf_parallel        as tsf_lr_slope_parallel,
+    get_mabop_oc_tsf_parallel        as tsf_mabop_oc_parallel,
+    get_pcnt_ch_tsf_parallel         as tsf_pcnt_ch_parallel,
+    get_william_oc_tsf_parallel      as tsf_william_oc_parallel, )
+
+# NOTE: bfloat16 input versions of TSF ( `as_bf16()` ), half of memory traffic.
+
+from .ti_function_set import (
+    get_bb_tsf_bf16              as tsf_bb_bf16,
+    get_lr_exp_dev_mini_tsf_bf16 as tsf_lr_exp_dev_mini_bf16, )
+
+# NOTE: int16 tick input versions of TSF ( `as_q16()` ), fixed tick size instruments.
+
+from .ti_function_set import (
+    get_william_oc_tsf_q16       as tsf_william_oc_q16, )
+
+# --- TECHNICAL INDICATORS - BATCH ( Multi-Asset ): ---------------------------------
+
+# NOTE: 2D input ( n_assets, n_bars ), rows are calculated in parallel ( numba.prange ).
+
+from .ti_function_set import (
+    get_aroon_batch,
+    get_pcnt_ch_batch,
+    get_rsi_batch, )
+
+# NOTE: 2D input ( n_bars, n_symbols ), symbols on the fast axis ( SIMD lanes ), tsf.
+
+from .ti_function_set import (
+    get_lr_exp_dev_batch_symbols as tsf_lr_exp_dev_batch_symbols,
+    get_rsi_batch_symbols        as tsf_rsi_batch_symbols, )
+
+# NOTE: Many parameter values on the same data, result row per value ( tsf, parallel ).
+
+from .ti_function_set import (
+    get_lr_exp_dev_batch_tsf as tsf_lr_exp_dev_batch,
+    get_pcnt_ch_multi_tsf    as tsf_pcnt_ch_multi,
+    get_william_oc_multi_tsf as tsf_william_oc_multi,
+    get_william_oc_sweep     as tsf_william_oc_sweep, )
+
 # --- TECHNICAL INDICATORS - V TSF ( Single Value , Thread Safe Functions ): --------
 
 # NOTE: Safe to use in multi-threaded environments.
@@ -76,8 +149,14 @@ from .ti_function_set import (
     get_ones_vtsf            as vtsf_ones,
     get_pcnt_ch_vtsf         as vtsf_pcnt_ch,
     get_rsi_vtsf             as vtsf_rsi,
+    get_rsi_state_step       as vtsf_rsi_step,
     get_william_oc_vtsf      as vtsf_william_oc, )
 
+# NOTE: Multi-index versions of V TSF, indexes are calculated in parallel ( numba.prange ).
+
+from .ti_function_set import (
+    get_bb_vtsf_batch        as vtsf_bb_batch, )
+
 
 # --- Techinical Indicators - V GPU -------------------------------------------------
 
@@ -95,6 +174,101 @@ from .ti_function_set import (
     get_william_oc_vtsf_cuda      as cuda_v_william_oc,    
 )
 
+# NOTE: CUDA device functions, call per thread from your own kernels.
+
+from .ti_function_set import (
+    get_william_oc_vtsf_cuda_dev  as cuda_dev_william_oc, )
+
+# NOTE: Kernels for many indexes, one thread block per value ( see docstrings for launch ).
+
+from .ti_function_set import (
+    get_bb_vtsf_cuda_block        as cuda_v_bb_block, )
+
+# --- Techinical Indicators - GPU ( Full Array ) -----------------------------------
+
+# NOTE: Host functions, calculate the whole array with a single kernel launch.
+
+from .ti_function_set import (
+    get_aroon_cuda      as cuda_aroon,
+    get_bb_cuda         as cuda_bb,
+    get_lr_exp_dev_cuda as cuda_lr_exp_dev,
+    get_lr_slope_cuda   as cuda_lr_slope,
+    get_pcnt_ch_cuda    as cuda_pcnt_ch,
+    get_william_oc_cuda as cuda_william_oc, )
+
+# --- Techinical Indicators - AOT ( Ahead Of Time compiled ) ------------------------
+
+# NOTE: No first-call JIT compilation, if `ti_aot` extension is built 
+#           ( by setup.py, or `python -m technical_indicator_lib._aot_build` ).
+#       Falls back to JIT functions, if extension is not available.
+#       AOT functions can NOT be called from inside `@numba.njit` functions.
+
+try:
+    from .ti_aot import (
+        get_aroon                as aot_aroon,
+        get_aroon_tsf            as aot_tsf_aroon,
+        get_aroon_vtsf           as aot_vtsf_aroon,
+        get_bb                   as aot_bb,
+        get_bb_tsf               as aot_tsf_bb,
+        get_bb_full_tsf          as aot_tsf_bb_full,
+        get_bb_vtsf              as aot_vtsf_bb,
+        get_lr_exp_dev           as aot_lr_exp_dev,
+        get_lr_exp_dev_mini      as aot_lr_exp_dev_mini,
+        get_lr_exp_dev_mini_tsf  as aot_tsf_lr_exp_dev_mini,
+        get_lr_exp_dev_mini_vtsf as aot_vtsf_lr_exp_dev_mini,
+        get_lr_slope             as aot_lr_slope,
+        get_lr_slope_tsf         as aot_tsf_lr_slope,
+        get_lr_slope_vtsf        as aot_vtsf_lr_slope,
+        get_mabop_oc             as aot_mabop_oc,
+        get_mabop_oc_tsf         as aot_tsf_mabop_oc,
+        get_mabop_oc_vtsf        as aot_vtsf_mabop_oc,
+        get_ones                 as aot_ones,
+        get_ones_tsf             as aot_tsf_ones,
+        get_ones_vtsf            as aot_vtsf_ones,
+        get_william_oc           as aot_william_oc,
+        get_william_oc_into      as aot_william_oc_into,
+        get_william_oc_tsf       as aot_tsf_william_oc,
+        get_william_oc_tsf_q16   as aot_tsf_william_oc_q16,
+        get_william_oc_vtsf      as aot_vtsf_william_oc, )
+except ImportError:
+    aot_aroon                = get_aroon
+    aot_tsf_aroon            = tsf_aroon
+    aot_vtsf_aroon           = vtsf_aroon
+    aot_bb                   = get_bb
+    aot_tsf_bb               = tsf_bb
+    aot_tsf_bb_full          = tsf_bb_full
+    aot_vtsf_bb              = vtsf_bb
+    aot_lr_exp_dev           = get_lr_exp_dev
+    aot_lr_exp_dev_mini      = get_lr_exp_dev_mini
+    aot_tsf_lr_exp_dev_mini  = tsf_lr_exp_dev_mini
+    aot_vtsf_lr_exp_dev_mini = vtsf_lr_exp_dev_mini
+    aot_lr_slope             = get_lr_slope
+    aot_tsf_lr_slope         = tsf_lr_slope
+    aot_vtsf_lr_slope        = vtsf_lr_slope
+    aot_mabop_oc             = get_mabop_oc
+    aot_tsf_mabop_oc         = tsf_mabop_oc
+    aot_vtsf_mabop_oc        = vtsf_mabop_oc
+    aot_ones                 = get_ones
+    aot_tsf_ones             = tsf_ones
+    aot_vtsf_ones            = vtsf_ones
+    aot_william_oc           = get_william_oc
+    aot_william_oc_into      = get_william_oc_into
+    aot_tsf_william_oc       = tsf_william_oc
+    aot_tsf_william_oc_q16   = tsf_william_oc_q16
+    aot_vtsf_william_oc      = vtsf_william_oc
+
+# --- DATA ARRAYS: -----------------------------------------------------------------
+
+# NOTE: All TI functions are compiled for float32, C-contiguous ( `[::1]` ) arrays only.
+#       Use `as_aligned_f32()` to convert input once ( e.g. float64, strided column ), 
+#           copy is made only when needed. Result is 64 bytes aligned ( cache line ).
+
+from ._ti_methods import (
+    aligned_f32,
+    as_aligned_f32,
+    as_bf16,
+    as_q16, )
+
 # --- TI - TYPES and TI-ID ENUM: ----------------------------------------------------
 
 from .ti_type_ID import (
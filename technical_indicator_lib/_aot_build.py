@@ -0,0 +1,202 @@
+'''
+AOT ( Ahead Of Time ) compiled TI functions, built with `numba.pycc`.
+
+---
+
+Builds `technical_indicator_lib.ti_aot` extension module,
+so the exported functions are called without first-call JIT compilation.
+
+Extension is built by `setup.py` ( if numba is available at build time ),
+or in place with:
+
+```bash
+python -m technical_indicator_lib._aot_build
+```
+
+NOTE: AOT functions are plain Python callables, NOT Numba dispatchers,
+    i.e. they can NOT be called from inside other `@numba.njit` functions.
+'''
+
+from numba.pycc import CC
+
+from .ti_function_set.aroon import (
+    get_aroon,
+    get_aroon_tsf,
+    get_aroon_vtsf, )
+
+from .ti_function_set.bb import (
+    get_bb,
+    get_bb_tsf,
+    get_bb_full_tsf,
+    get_bb_vtsf, )
+
+from .ti_function_set.lr_exp_dev import (
+    get_lr_exp_dev,
+    get_lr_exp_dev_mini,
+    get_lr_exp_dev_mini_tsf,
+    get_lr_exp_dev_mini_vtsf, )
+
+from .ti_function_set.lr_slope import (
+    get_lr_slope,
+    get_lr_slope_tsf,
+    get_lr_slope_vtsf, )
+
+from .ti_function_set.mabop_oc import (
+    get_mabop_oc,
+    get_mabop_oc_tsf,
+    get_mabop_oc_vtsf, )
+
+from .ti_function_set.ones import (
+    get_ones,
+    get_ones_tsf,
+    get_ones_vtsf, )
+
+from .ti_function_set.william_oc import (
+    get_william_oc,
+    get_william_oc_into,
+    get_william_oc_tsf,
+    get_william_oc_tsf_q16,
+    get_william_oc_vtsf, )
+
+
+# -----------------------------------------------------------------------------------
+
+_name_:           str = 'AOT Build - TI Lib'
+__version__:      str = '0.0.5'
+__version_date__: str = '2026-10-15'
+VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
+
+# --- VERSION HISTORY: --------------------------------------------------------------
+
+# v0.0.1 @ 2026-10-15 : Initial Release. Aroon functions.
+# v0.0.2 @ 2026-10-15 : Bollinger Bands functions.
+#                       Linear Regression - Deviation from expected value functions.
+# v0.0.3 @ 2026-10-15 : Linear Regression Slope, MA BOP OC and ONES functions.
+# v0.0.4 @ 2026-10-15 : William %R OC functions ( deque kernel ).
+# v0.0.5 @ 2026-10-15 : William %R OC into ( preallocated result ) and int16 tick input functions.
+#
+
+# -----------------------------------------------------------------------------------
+
+cc = CC('ti_aot')
+
+# --- AROON: ------------------------------------------------------------------------
+
+@cc.export('get_aroon', 'f4[::1](f4[::1], i4)')
+def _aot_get_aroon(data_arr, period):
+    return get_aroon(data_arr, period)
+
+@cc.export('get_aroon_tsf', 'void(f4[::1], i4, i4, f4[::1])')
+def _aot_get_aroon_tsf(data_arr, period, data_size, result_arr):
+    get_aroon_tsf(data_arr, period, data_size, result_arr)
+
+@cc.export('get_aroon_vtsf', 'f4(f4[::1], i4, i4)')
+def _aot_get_aroon_vtsf(data_arr, period, data_indx):
+    return get_aroon_vtsf(data_arr, period, data_indx)
+
+# --- BOLLINGER BANDS: --------------------------------------------------------------
+
+@cc.export('get_bb', 'f4[::1](f4[::1], i4)')
+def _aot_get_bb(data, period):
+    return get_bb(data, period)
+
+@cc.export('get_bb_tsf', 'void(f4[::1], i4, i4, f4[::1])')
+def _aot_get_bb_tsf(data, period, data_size, result_arr):
+    get_bb_tsf(data, period, data_size, result_arr)
+
+@cc.export('get_bb_full_tsf', 'void(f4[::1], i4, i4, f4[::1], f4[::1], f4[::1], f4[::1], f4[::1])')
+def _aot_get_bb_full_tsf(data, period, data_size, upper_arr, mid_arr, lower_arr, bandw_arr, pctb_arr):
+    get_bb_full_tsf(data, period, data_size, upper_arr, mid_arr, lower_arr, bandw_arr, pctb_arr)
+
+@cc.export('get_bb_vtsf', 'f4(f4[::1], i4, i4)')
+def _aot_get_bb_vtsf(data, period, data_indx):
+    return get_bb_vtsf(data, period, data_indx)
+
+# --- LR_EXP_DEV: -------------------------------------------------------------------
+
+@cc.export('get_lr_exp_dev', 'f4[::1](f4[::1], i4, i4)')
+def _aot_get_lr_exp_dev(data_arr, period, expected_period):
+    return get_lr_exp_dev(data_arr, period, expected_period)
+
+@cc.export('get_lr_exp_dev_mini', 'f4[::1](f4[::1], i4)')
+def _aot_get_lr_exp_dev_mini(data_arr, period_mix):
+    return get_lr_exp_dev_mini(data_arr, period_mix)
+
+@cc.export('get_lr_exp_dev_mini_tsf', 'void(f4[::1], i4, i4, f4[::1])')
+def _aot_get_lr_exp_dev_mini_tsf(data_arr, period_mix, data_size, result_arr):
+    get_lr_exp_dev_mini_tsf(data_arr, period_mix, data_size, result_arr)
+
+@cc.export('get_lr_exp_dev_mini_vtsf', 'f4(f4[::1], i4, i4)')
+def _aot_get_lr_exp_dev_mini_vtsf(data_arr, period_mix, data_indx):
+    return get_lr_exp_dev_mini_vtsf(data_arr, period_mix, data_indx)
+
+# --- LR_SLOPE: ---------------------------------------------------------------------
+
+@cc.export('get_lr_slope', 'f4[::1](f4[::1], i4)')
+def _aot_get_lr_slope(data_arr, period):
+    return get_lr_slope(data_arr, period)
+
+@cc.export('get_lr_slope_tsf', 'void(f4[::1], i4, i4, f4[::1])')
+def _aot_get_lr_slope_tsf(data_arr, period, data_size, result_arr):
+    get_lr_slope_tsf(data_arr, period, data_size, result_arr)
+
+@cc.export('get_lr_slope_vtsf', 'f4(f4[::1], i4, i4)')
+def _aot_get_lr_slope_vtsf(data_arr, period, data_indx):
+    return get_lr_slope_vtsf(data_arr, period, data_indx)
+
+# --- MABOP_OC: ---------------------------------------------------------------------
+
+@cc.export('get_mabop_oc', 'f4[::1](f4[::1], i4)')
+def _aot_get_mabop_oc(data_arr, period):
+    return get_mabop_oc(data_arr, period)
+
+@cc.export('get_mabop_oc_tsf', 'void(f4[::1], i4, i4, f4[::1])')
+def _aot_get_mabop_oc_tsf(data_arr, period, data_size, result_arr):
+    get_mabop_oc_tsf(data_arr, period, data_size, result_arr)
+
+@cc.export('get_mabop_oc_vtsf', 'f4(f4[::1], i4, i4)')
+def _aot_get_mabop_oc_vtsf(data_arr, period, data_indx):
+    return get_mabop_oc_vtsf(data_arr, period, data_indx)
+
+# --- ONES: -------------------------------------------------------------------------
+
+@cc.export('get_ones', 'f4[::1](f4[::1], i4)')
+def _aot_get_ones(data, period):
+    return get_ones(data, period)
+
+@cc.export('get_ones_tsf', 'void(f4[::1], i4, i4, f4[::1])')
+def _aot_get_ones_tsf(data, period, data_size, result_arr):
+    get_ones_tsf(data, period, data_size, result_arr)
+
+@cc.export('get_ones_vtsf', 'f4(f4[::1], i4, i4)')
+def _aot_get_ones_vtsf(data_arr, period, data_indx):
+    return get_ones_vtsf(data_arr, period, data_indx)
+
+# --- WILLIAM_OC: -------------------------------------------------------------------
+
+@cc.export('get_william_oc', 'f4[::1](f4[::1], i4)')
+def _aot_get_william_oc(data_arr, period):
+    return get_william_oc(data_arr, period)
+
+@cc.export('get_william_oc_into', 'f4[::1](f4[::1], i4, f4[::1])')
+def _aot_get_william_oc_into(data_arr, period, out_arr):
+    return get_william_oc_into(data_arr, period, out_arr)
+
+@cc.export('get_william_oc_tsf', 'void(f4[::1], i4, i4, f4[::1])')
+def _aot_get_william_oc_tsf(data, period, data_size, result_arr):
+    get_william_oc_tsf(data, period, data_size, result_arr)
+
+@cc.export('get_william_oc_tsf_q16', 'void(i2[::1], i4, i4, f4[::1])')
+def _aot_get_william_oc_tsf_q16(data_q16, period, data_size, result_arr):
+    get_william_oc_tsf_q16(data_q16, period, data_size, result_arr)
+
+@cc.export('get_william_oc_vtsf', 'f4(f4[::1], i4, i4)')
+def _aot_get_william_oc_vtsf(data, period, data_indx):
+    return get_william_oc_vtsf(data, period, data_indx)
+
+# -----------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    cc.compile()
+
+# -----------------------------------------------------------------------------------
@@ -1,16 +1,22 @@
+from __future__ import annotations
+
 import numpy as np
 
 
 # -----------------------------------------------------------------------------------
 
 _name_:           str = 'Private Functions - TI Lib'
-__version__:      str = '0.0.1'
-__version_date__: str = '2024-09-16'
+__version__:      str = '0.0.2'
+__version_date__: str = '2026-10-15'
 VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}' 
 
 # --- VERSION HISTORY: --------------------------------------------------------------
 
 # v0.0.1 @ 2024-09-16 : Initial Release.
+# v0.0.2 @ 2026-10-15 : 64-byte aligned arrays: aligned_empty(), aligned_f32(), as_aligned_f32().
+#                       Added extend_data_array_inplace() - capacity buffer, no copy per call.
+#                       Added as_bf16() - float32 to bfloat16 ( uint16 ) compressed arrays.
+#                       Added as_q16() - fixed tick size data to int16 ticks.
 #
 
 # -----------------------------------------------------------------------------------
@@ -19,6 +25,140 @@ VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date_
 #
 # -----------------------------------------------------------------------------------
 
+# NOTE: TI functions signatures are `'C'` contiguous and `aligned = True`, 
+#       but numpy only guarantees 16-byte alignment of the data pointer.
+#       64-byte ( cache line / AVX-512 ) aligned buffers let LLVM use aligned vector loads.
+
+DEFAULT_ALIGN: int = 64
+
+def aligned_empty(  data_size: int, 
+                    dtype:     np.dtype = np.float32,
+                    align:     int      = DEFAULT_ALIGN,
+                        ) -> np.ndarray:
+    '''
+    Allocate uninitialized array with aligned data pointer.
+    
+    Parameters:
+    -----------
+    data_size: (`int`)      : Number of elements.
+    dtype:     (`np.dtype`) : Data type.
+    align:     (`int`)      : Alignment in bytes.
+    
+    Returns:
+    --------
+    (`np.ndarray`) : Uninitialized array, `arr.ctypes.data % align == 0`.
+    '''
+    itemsize: int        = np.dtype(dtype).itemsize
+    buf:      np.ndarray = np.empty(data_size * itemsize + align, dtype = np.uint8)
+    offset:   int        = (-buf.ctypes.data) % align
+    
+    return buf[offset : offset + data_size * itemsize].view(dtype)
+
+def aligned_f32(data_size: int, 
+                align:     int = DEFAULT_ALIGN,
+                    ) -> np.ndarray[np.float32]:
+    '''
+    Allocate uninitialized `np.float32` array with aligned data pointer.
+    
+    Parameters:
+    -----------
+    data_size: (`int`) : Number of elements.
+    align:     (`int`) : Alignment in bytes.
+    
+    Returns:
+    --------
+    (`np.ndarray[np.float32]`) : Uninitialized array.
+    '''
+    return aligned_empty(data_size, np.float32, align)
+
+def as_aligned_f32( data_arr: np.ndarray, 
+                    align:    int = DEFAULT_ALIGN,
+                        ) -> np.ndarray[np.float32]:
+    '''
+    Return `data_arr` as `np.float32`, C-contiguous, aligned array.
+    Copy is made only if `data_arr` does not satisfy it already.
+    
+    Parameters:
+    -----------
+    data_arr: (`np.ndarray`) : Input data array.
+    align:    (`int`)        : Alignment in bytes.
+    
+    Returns:
+    --------
+    (`np.ndarray[np.float32]`) : Aligned data array.
+    '''
+    if (data_arr.dtype == np.float32 
+            and data_arr.flags['C_CONTIGUOUS'] 
+            and data_arr.ctypes.data % align == 0):
+        return data_arr
+    
+    res_arr:    np.ndarray[np.float32] = aligned_f32(len(data_arr), align)
+    res_arr[:] = data_arr
+    
+    return res_arr
+
+# -----------------------------------------------------------------------------------
+
+def as_bf16(data_arr: np.ndarray) -> np.ndarray[np.uint16]:
+    '''
+    Convert `data_arr` to bfloat16, stored as `np.uint16` ( high 16 bits of float32 ).
+    Rounded to nearest even, ~3 significant digits ( 8 bit mantissa ).
+    Half of float32 memory traffic, for `*_bf16` TI functions.
+    
+    Parameters:
+    -----------
+    data_arr: (`np.ndarray`) : Input data array.
+    
+    Returns:
+    --------
+    (`np.ndarray[np.uint16]`) : bfloat16 data array ( aligned ).
+    '''
+    bits_arr: np.ndarray[np.uint32] = np.ascontiguousarray(data_arr, dtype = np.float32).view(np.uint32)
+    
+    # Round to nearest even: add 0x7FFF + lowest kept bit, then truncate.
+    bits_arr = bits_arr + np.uint32(0x7FFF) + ((bits_arr >> np.uint32(16)) & np.uint32(1))
+    
+    res_arr:    np.ndarray[np.uint16] = aligned_empty(len(bits_arr), np.uint16)
+    res_arr[:] = bits_arr >> np.uint32(16)
+    
+    return res_arr
+
+# -----------------------------------------------------------------------------------
+
+def as_q16( data_arr: np.ndarray, 
+            tick:     float,
+            offset:   float | None = None,
+                ) -> np.ndarray[np.int16]:
+    '''
+    Convert `data_arr` to int16 fixed-point ticks: `round((data - offset) / tick)`.
+    For fixed tick size instruments ( equities / futures ), for `*_q16` TI functions.
+    Half of float32 memory traffic, exact while `(max - min) / tick <= 65535`, 
+    values outside of int16 range are clipped.
+    
+    Parameters:
+    -----------
+    data_arr: (`np.ndarray`) : Input data array.
+    tick:     (`float`)      : Tick size ( price step ).
+    offset:   (`float`)      : Value of tick 0. Default: middle of the data range.
+    
+    Returns:
+    --------
+    (`np.ndarray[np.int16]`) : Ticks array ( aligned ).
+    '''
+    data_arr = np.asarray(data_arr, dtype = np.float64)
+    
+    if offset is None:
+        offset = 0.5 * (data_arr.min() + data_arr.max()) if len(data_arr) else 0.0
+    
+    ticks_arr: np.ndarray[np.float64] = np.rint((data_arr - offset) / tick)
+    
+    res_arr:    np.ndarray[np.int16] = aligned_empty(len(ticks_arr), np.int16)
+    res_arr[:] = np.clip(ticks_arr, -32768, 32767)
+    
+    return res_arr
+
+# -----------------------------------------------------------------------------------
+
 def extend_data_array(  data_arr:         np.ndarray[float], 
                         desired_data_len: int, 
                             ) -> np.ndarray[float]:
@@ -32,11 +172,52 @@ def extend_data_array(  data_arr:         np.ndarray[float],
     
     Returns:
     --------
-    (`np.ndarray[float]`) : Extended data array.    
+    (`np.ndarray[float]`) : Extended data array ( aligned, same dtype ).    
     '''
-    if len(data_arr) < desired_data_len:        
-        data_arr = np.append(data_arr, np.zeros(desired_data_len - len(data_arr)))
+    data_size: int = len(data_arr)
+    
+    if data_size < desired_data_len:
+        res_arr: np.ndarray[float] = aligned_empty(desired_data_len, data_arr.dtype)
+        res_arr[:data_size] = data_arr
+        res_arr[data_size:] = 0.0
+        data_arr            = res_arr
     
     return data_arr
 
+# -----------------------------------------------------------------------------------
+
+def extend_data_array_inplace(  buf_arr:          np.ndarray[float],
+                                used_len:         int,
+                                desired_data_len: int,
+                                    ) -> np.ndarray[float]:
+    '''
+    Extend data inside preallocated capacity buffer.
+    
+    Zero-fills `buf_arr[used_len : desired_data_len]`, 
+    without any allocation or copy while capacity is enough.
+    Otherwise buffer is reallocated with doubled capacity ( like `list.append` ),
+    so streaming extension costs amortized O(1) per element.
+    
+    Parameters:
+    -----------
+    buf_arr:          (`np.ndarray[float]`) : Capacity buffer, `buf_arr[:used_len]` is valid data.
+    used_len:         (`int`)               : Length of valid data.
+    desired_data_len: (`int`)               : Desired data length.
+    
+    Returns:
+    --------
+    (`np.ndarray[float]`) : Capacity buffer ( same, or reallocated ).
+        `result[:desired_data_len]` is the extended data.
+    '''
+    capacity: int = len(buf_arr)
+    
+    if desired_data_len > capacity:
+        res_arr: np.ndarray[float] = aligned_empty(max(desired_data_len, 2 * capacity), buf_arr.dtype)
+        res_arr[:used_len] = buf_arr[:used_len]
+        buf_arr            = res_arr
+    
+    buf_arr[used_len:desired_data_len] = 0.0
+    
+    return buf_arr
+
 # -----------------------------------------------------------------------------------
\ No newline at end of file
@@ -22,62 +22,118 @@ VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date_
 
 # --- SUPPORTING FUNCTIONS: ---------------------------------------------------------
 
-from .shift import get_shift
+from .shift import (
+    get_shift,
+    get_shift_tsf, )
 
 # --- TECHNICAL INDICATORS FUNCTIONS: -----------------------------------------------
 
 from .aroon import (
     get_aroon, 
+    get_aroon_dispatch,
     get_aroon_tsf,
+    get_aroon_tsf_parallel,
+    get_aroon_batch,
     get_aroon_vtsf,
-    get_aroon_vtsf_cuda, )
+    get_aroon_vtsf_cuda,
+    get_aroon_cuda_kernel,
+    build_aroon_cuda_kernel,
+    get_aroon_cuda, )
 
 from .bb import (
     get_bb,
+    get_bb_dispatch,
     get_bb_tsf,
+    get_bb_tsf_parallel,
+    get_bb_tsf_bf16,
+    get_bb_full_tsf,
     get_bb_vtsf,
-    get_bb_vtsf_cuda, )
+    get_bb_vtsf_batch,
+    get_bb_vtsf_cuda,
+    get_bb_range_cuda,
+    get_bb_cuda,
+    get_bb_vtsf_cuda_block, )
 
 from .lr_exp_dev import (
     get_lr_exp_dev,
+    get_lr_exp_dev_np,
     get_lr_exp_dev_mini,
     get_lr_exp_dev_mini_tsf,
+    get_lr_exp_dev_mini_tsf_parallel,
+    get_lr_exp_dev_mini_tsf_bf16,
+    get_lr_exp_dev_batch_tsf,
+    get_lr_exp_dev_batch_symbols,
     get_lr_exp_dev_mini_vtsf,
-    get_lr_exp_dev_mini_vtsf_cuda, )
+    get_lr_exp_dev_mini_vtsf_cuda,
+    get_lr_exp_dev_range_cuda,
+    get_lr_exp_dev_cuda, )
     
 from .lr_slope import (
     get_lr_slope,
+    get_lr_slope_np,
+    get_lr_slope_dispatch,
     get_lr_slope_tsf,
+    get_lr_slope_tsf_parallel,
     get_lr_slope_vtsf,
-    get_lr_slope_vtsf_cuda, )
+    get_lr_slope_vtsf_cuda,
+    get_lr_slope_range_cuda,
+    get_lr_slope_cuda, )
 
 from .mabop_oc import (
     get_mabop_oc,
+    get_mabop_oc_dispatch,
     get_mabop_oc_tsf,
+    get_mabop_oc_tsf_parallel,
     get_mabop_oc_vtsf,
     get_mabop_oc_vtsf_cuda, )
 
 from .ones import (
     get_ones,
+    get_ones_view,
     get_ones_tsf,
     get_ones_vtsf, )
 
 from .pcnt_ch import (
     get_pcnt_ch,
+    get_pcnt_ch_np,
+    get_pcnt_ch_p1,
+    get_pcnt_ch_mul,
+    get_pcnt_ch_v,
     get_pcnt_ch_tsf,
+    get_pcnt_ch_tsf_parallel,
+    get_pcnt_ch_batch,
+    get_pcnt_ch_multi_tsf,
     get_pcnt_ch_vtsf,
-    get_pcnt_ch_vtsf_cuda, )
+    get_pcnt_ch_vtsf_cuda,
+    get_pcnt_ch_range_cuda,
+    get_pcnt_ch_cuda, )
 
 from .rsi import (
     get_rsi,
+    get_rsi_np,
+    get_rsi_u8,
+    get_rsi_mask_lt,
     get_rsi_tsf,
+    get_rsi_batch,
+    get_rsi_batch_symbols,
     get_rsi_vtsf,
-    get_rsi_vtsf_cuda, )
+    get_rsi_state_step,
+    get_rsi_vtsf_cuda,
+    get_rsi_indexes_cuda, )
 
 from .william_oc import (
     get_william_oc,
+    get_william_oc_into,
+    get_william_oc_np,
     get_william_oc_tsf,
+    get_william_oc_tsf_parallel,
+    get_william_oc_tsf_q16,
+    get_william_oc_multi_tsf,
+    get_william_oc_sweep,
     get_william_oc_vtsf,
-    get_william_oc_vtsf_cuda, )
+    get_william_oc_vtsf_cuda,
+    get_william_oc_vtsf_cuda_dev,
+    get_william_oc_range_cuda,
+    get_william_oc_cuda, )
 
 # -----------------------------------------------------------------------------------
\ No newline at end of file
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+
+# -----------------------------------------------------------------------------------
+
+_name_:           str = 'Shared Constants - TI Lib'
+__version__:      str = '0.0.1'
+__version_date__: str = '2026-10-15'
+VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}' 
+
+# --- VERSION HISTORY: --------------------------------------------------------------
+
+# v0.0.1 @ 2026-10-15 : Initial Release - tile sizes of multi-core / bfloat16 kernels.
+#
+
+# -----------------------------------------------------------------------------------
+#
+#               SHARED CONSTANTS FOR TI FUNCTIONS
+#
+# -----------------------------------------------------------------------------------
+
+# NOTE: Per core working sets, sized for a 512 KB - 2 MB L2 cache.
+
+L2_TILE_SIZE:      int = 65536     # Values per tile of `numba.prange()` kernels, ( float32 ) 256 KB - fits L2 cache.
+L2_BF16_TILE_SIZE: int = 16384     # Values per decompressed bfloat16 tile, ( float32 ) 64 KB - fits L2 cache.
@@ -1,3 +1,9 @@
+from __future__ import annotations
+
+import functools
+import os
+import warnings
+
 import numpy as np
 import numba
 from numba import cuda
@@ -6,13 +12,26 @@ from numba import cuda
 # -----------------------------------------------------------------------------------
 
 _name_:           str = 'Aroon - TI Lib'
-__version__:      str = '0.0.1'
-__version_date__: str = '2024-09-16'
+__version__:      str = '0.0.2'
+__version_date__: str = '2026-10-15'
 VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}' 
 
 # --- VERSION HISTORY: --------------------------------------------------------------
 
 # v0.0.1 @ 2024-09-16 : Initial Release.
+# v0.0.2 @ 2026-10-15 : Rolling High / Low via monotonic deques - O(N) instead of O(N * period).
+#                       Added get_aroon_tsf_parallel() - multi-core version of get_aroon_tsf().
+#                       Branchless High / Low scan in get_aroon_vtsf().
+#                       Added get_aroon_cuda_kernel() - one GPU thread per output index.
+#                       Added build_aroon_cuda_kernel() - shared memory tiled GPU kernel.
+#                       Added get_aroon_dispatch() - kernels specialized by period ( compile cache ).
+#                       Single window scan helper for all Scan versions ( CPU and GPU ).
+#                       float32 only arithmetic in result calculation ( no float64 widening ).
+#                       Block Max kernel ( Prefix / Suffix extremes ) for period >= 128.
+#                       Kernel selection by period: Scan ( <= 8 ) / Block Max ( TI_AROON_KERNEL override ).
+#                       Added get_aroon_batch() - multi-asset, parallel by rows.
+#                       NumPy error model in all Aroon kernels.
+#                       Specialized Scan limit ( period <= 32 ) re-measured against Block Max.
 #
 
 # --- CALCULATION DESCRIPTION: -----------------------------------------------------
@@ -34,29 +53,484 @@ VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date_
 
 # -----------------------------------------------------------------------------------
 #
-#                 AROON - NUMBA:
+#           AROON - WINDOW SCAN ( Private, shared by all Scan versions ):
 #
 # -----------------------------------------------------------------------------------
 
-_spec_func_numba = numba.types.Array(numba.float32, 1, 'C')(
-                    numba.types.Array(numba.float32, 1, 'C', readonly = True, aligned = True),  # data_arr
-                    numba.int32)                                                                # period
+# NOTE: Single copy of the window scan, inlined into the callers at Numba IR level.
+#       Branchless select ( cmov / blend ) instead of `if` blocks,
+#       financial series make those branches unpredictable.
+
+_signature_window_scan = numba.types.UniTuple(numba.int32, 2)(
+                            numba.types.Array(numba.float32, 1, 'C', readonly = True, aligned = True),  # data_arr
+                            numba.int32,                                                                # start_indx
+                            numba.int32, )                                                              # period
 
-_locals_func_numba = {
+_locals_window_scan = {
+        'high_index': numba.int32,
+        'low_index':  numba.int32,
+        'high_val':   numba.float32,
+        'low_val':    numba.float32,
+        'data_temp':  numba.float32, }
+
+@numba.njit(_signature_window_scan,
+            cache       = True, 
+            fastmath    = True, 
+            nogil       = True,
+            boundscheck = False,
+            error_model = 'numpy',
+            inline      = 'always',
+            locals      = _locals_window_scan, )
+def _aroon_window_scan(
+                        data_arr:   np.ndarray[np.float32],
+                        start_indx: np.int32,
+                        period:     np.int32,
+                            ) -> tuple[np.int32, np.int32]:
+    '''
+    Scan window `data_arr[start_indx : start_indx + period]`.
+    
+    Returns:
+    --------
+    (`tuple[np.int32, np.int32]`) : ( high_index, low_index ), relative to `start_indx`.
+        Earliest index is returned for equal values.
+    '''
+    
+    high_index: np.int32   = 0
+    low_index:  np.int32   = 0
+    data_temp:  np.float32 = data_arr[start_indx]
+    high_val:   np.float32 = data_temp
+    low_val:    np.float32 = data_temp
+    
+    for j in range(1, period):   # from 1 to period, because first data is already calculated.
+        data_temp  = data_arr[start_indx + j]
+        is_high    = data_temp > high_val
+        is_low     = data_temp < low_val
+        high_val   = data_temp if is_high else high_val
+        high_index = j         if is_high else high_index
+        low_val    = data_temp if is_low  else low_val
+        low_index  = j         if is_low  else low_index
+    
+    return high_index, low_index
+
+@cuda.jit(device = True)
+def _aroon_window_scan_cuda(
+                            data_arr:   np.ndarray[np.float32],
+                            start_indx: np.int32,
+                            period:     np.int32,
+                                ) -> tuple[np.int32, np.int32]:
+    '''
+    Scan window `data_arr[start_indx : start_indx + period]`.
+    CUDA Device Function, `data_arr` can be a global or shared memory array.
+    
+    Returns:
+    --------
+    (`tuple[np.int32, np.int32]`) : ( high_index, low_index ), relative to `start_indx`.
+        Earliest index is returned for equal values.
+    '''
+    
+    high_index: int   = 0
+    low_index:  int   = 0
+    data_temp:  float = data_arr[start_indx]
+    high_val:   float = data_temp
+    low_val:    float = data_temp
+    
+    for j in range(1, period):   # from 1 to period, because first data is already calculated.
+        data_temp = data_arr[start_indx + j]
+        if data_temp > high_val:
+            high_val   = data_temp
+            high_index = j
+        
+        if data_temp < low_val:
+            low_val    = data_temp
+            low_index  = j
+    
+    return high_index, low_index
+
+# -----------------------------------------------------------------------------------
+#
+#           AROON - SCAN KERNEL ( Private ):
+#
+# -----------------------------------------------------------------------------------
+
+# NOTE: Straight window scan, O(N * period), but without any bookkeeping.
+#       Fastest kernel for small periods.
+
+_signature_kernel = numba.void(
+                    numba.types.Array(numba.float32, 1, 'C', readonly = True,  aligned = True),     # data_arr
+                    numba.int32,                                                                    # period
+                    numba.int32,                                                                    # i_start
+                    numba.int32,                                                                    # i_end
+                    numba.types.Array(numba.float32, 1, 'C', readonly = False, aligned = True), )   # result_arr
+
+_locals_scan = {
         'period_multiplier': numba.float32,
-        'high_index':        numba.int32,
-        'low_index':         numba.int32,
+        'i_first':           numba.int32,
+        'temp_res':          numba.float32, }
+
+@numba.njit(_signature_kernel,
+            cache        = True, 
+            fastmath     = True, 
+            nogil        = True,
+            boundscheck  = False,
+            error_model  = 'numpy',
+            locals       = _locals_scan, )
+def _get_aroon_scan(
+                    data_arr:   np.ndarray[np.float32],
+                    period:     np.int32,
+                    i_start:    np.int32,
+                    i_end:      np.int32,
+                    result_arr: np.ndarray[np.float32],
+                        ) -> None:
+    '''
+    Aroon Indicator kernel, based on straight window scan.
+    
+    Function updates `result_arr[i_start : i_end]` with Aroon Indicator values.
+    Values of the first period ( i < period ) are NOT touched.
+    '''
+    
+    period_multiplier: np.float32 = np.float32(1.0) / np.float32(period)
+    i_first:           np.int32   = max(i_start, period)
+    
+    for i in range(i_first, i_end):
+        high_index, low_index = _aroon_window_scan(data_arr, i - period + 1, period)
+        
+        temp_res: np.float32 = period_multiplier * np.float32(low_index - high_index)
+        result_arr[i]        = temp_res
+    
+    return
+
+# -----------------------------------------------------------------------------------
+#
+#           AROON - MONOTONIC DEQUE KERNEL ( Private ):
+#
+# -----------------------------------------------------------------------------------
+
+# NOTE: Rolling High / Low are tracked with two monotonic deques of indices.
+#       Each index is pushed and popped at most once, so the whole array is
+#       processed in O(N) regardless of the period.
+#       Numba has no collections.deque, so deques are ring buffers
+#       with power of two capacity ( >= period ), addressed by `& dq_mask`.
+#       Values equal to the tail are NOT popped, so the head keeps the
+#       earliest High / Low in the window, same as the straight scan ( `>` / `<` ).
+#       Kernel works on the range [i_start .. i_end), so independent chunks
+#       can be processed in parallel ( each chunk warms up on `period - 1` values ).
+
+_locals_deque = {
+        'period_multiplier': numba.float32,
+        'dq_size':           numba.int32,
+        'dq_mask':           numba.int32,
+        'hi_head':           numba.int32,
+        'hi_tail':           numba.int32,
+        'lo_head':           numba.int32,
+        'lo_tail':           numba.int32,
+        'i_warm':            numba.int32,
         'i_shft':            numba.int32,
-        'high_val':          numba.float32,
-        'low_val':           numba.float32, }
+        'data_temp':         numba.float32,
+        'temp_res':          numba.float32, }
 
+@numba.njit(_signature_kernel,
+            cache        = True, 
+            fastmath     = True, 
+            nogil        = True,
+            boundscheck  = False,
+            error_model  = 'numpy',
+            locals       = _locals_deque, )
+def _get_aroon_deque(
+                    data_arr:   np.ndarray[np.float32],
+                    period:     np.int32,
+                    i_start:    np.int32,
+                    i_end:      np.int32,
+                    result_arr: np.ndarray[np.float32],
+                        ) -> None:
+    '''
+    Aroon Indicator kernel, based on monotonic deques ( rolling argmax / argmin ).
+    
+    Function updates `result_arr[i_start : i_end]` with Aroon Indicator values.
+    Values of the first period ( i < period ) are NOT touched.
+    
+    Parameters:
+    -----------
+    data_arr:   (`np.ndarray[np.float32]`) : array of values.
+    period:     (`np.int32`)               : period of Aroon Indicator.
+        Warning: **( period >= 2 )**
+    i_start:    (`np.int32`)               : first index to calculate.
+    i_end:      (`np.int32`)               : end index ( exclusive ).
+    result_arr: (`np.ndarray[np.float32]`) : array of Aroon Indicator.
+        Warning: **( len(result_arr) >= i_end )**
+    '''
+    
+    period_multiplier: np.float32 = np.float32(1.0) / np.float32(period)
+    
+    dq_size: np.int32 = 1
+    while dq_size < period:
+        dq_size <<= 1
+    dq_mask: np.int32 = dq_size - 1
+    
+    hi_dq: np.ndarray[np.int32] = np.empty(dq_size, dtype = np.int32)   # Indices of decreasing values.
+    lo_dq: np.ndarray[np.int32] = np.empty(dq_size, dtype = np.int32)   # Indices of increasing values.
+    
+    hi_head: np.int32 = 0
+    hi_tail: np.int32 = 0
+    lo_head: np.int32 = 0
+    lo_tail: np.int32 = 0
+    
+    i_warm: np.int32 = max(0, i_start - period + 1)    # Window of the first output.
+    
+    for i in range(i_warm, i_end):
+        data_temp: np.float32 = data_arr[i]
+        i_shft:    np.int32   = i - period + 1   # First index of the window.
+        
+        # Drop the index that left the window ( at most one per step ).
+        if hi_tail > hi_head and hi_dq[hi_head & dq_mask] < i_shft:
+            hi_head += 1
+        if lo_tail > lo_head and lo_dq[lo_head & dq_mask] < i_shft:
+            lo_head += 1
+        
+        # Drop dominated values from the tail, then push current index.
+        while hi_tail > hi_head and data_arr[hi_dq[(hi_tail - 1) & dq_mask]] < data_temp:
+            hi_tail -= 1
+        hi_dq[hi_tail & dq_mask] = i
+        hi_tail += 1
+        
+        while lo_tail > lo_head and data_arr[lo_dq[(lo_tail - 1) & dq_mask]] > data_temp:
+            lo_tail -= 1
+        lo_dq[lo_tail & dq_mask] = i
+        lo_tail += 1
+        
+        if i >= period and i >= i_start:
+            temp_res: np.float32 = period_multiplier * np.float32(lo_dq[lo_head & dq_mask] - hi_dq[hi_head & dq_mask])
+            result_arr[i]        = temp_res
+    
+    return
+
+# -----------------------------------------------------------------------------------
+#
+#           AROON - BLOCK MAX KERNEL ( Private ):
+#
+# -----------------------------------------------------------------------------------
+
+# NOTE: van Herk / Gil-Werman block decomposition, with block size = period.
+#       Any window [i - period + 1 .. i] covers the suffix of one block and 
+#       the prefix of the next one, so 
+#           High(window) = max(suffix_high[i - period + 1], prefix_high[i]).
+#       Prefix / Suffix extremes ( with indices ) are precomputed in two linear passes,
+#       after that every output costs O(1) without data dependent branches.
+#       Prefix keeps the earliest index with `>`, Suffix ( right to left ) with `>=`,
+#       and Suffix wins on equal values, so ties resolve like the straight scan.
+
+_locals_blockmax = {
+        'period_multiplier': numba.float32,
+        'i_first':           numba.int32,
+        'base_indx':         numba.int32,
+        'calc_size':         numba.int32,
+        'block_end':         numba.int32,
+        'k':                 numba.int32,
+        'k_shft':            numba.int32,
+        'hi_val':            numba.float32,
+        'lo_val':            numba.float32,
+        'hi_indx':           numba.int32,
+        'lo_indx':           numba.int32,
+        'data_temp':         numba.float32,
+        'temp_res':          numba.float32, }
+
+@numba.njit(_signature_kernel,
+            cache        = True, 
+            fastmath     = True, 
+            nogil        = True,
+            boundscheck  = False,
+            error_model  = 'numpy',
+            locals       = _locals_blockmax, )
+def _get_aroon_blockmax(
+                        data_arr:   np.ndarray[np.float32],
+                        period:     np.int32,
+                        i_start:    np.int32,
+                        i_end:      np.int32,
+                        result_arr: np.ndarray[np.float32],
+                            ) -> None:
+    '''
+    Aroon Indicator kernel, based on Prefix / Suffix block extremes.
+    
+    Function updates `result_arr[i_start : i_end]` with Aroon Indicator values.
+    Values of the first period ( i < period ) are NOT touched.
+    
+    Parameters:
+    -----------
+    data_arr:   (`np.ndarray[np.float32]`) : array of values.
+    period:     (`np.int32`)               : period of Aroon Indicator.
+        Warning: **( period >= 2 )**
+    i_start:    (`np.int32`)               : first index to calculate.
+    i_end:      (`np.int32`)               : end index ( exclusive ).
+    result_arr: (`np.ndarray[np.float32]`) : array of Aroon Indicator.
+        Warning: **( len(result_arr) >= i_end )**
+    '''
+    
+    i_first: np.int32 = max(i_start, period)
+    
+    if i_first >= i_end:
+        return
+    
+    period_multiplier: np.float32 = np.float32(1.0) / np.float32(period)
+    
+    base_indx: np.int32 = i_first - period + 1      # Window start of the first output.
+    calc_size: np.int32 = i_end - base_indx
+    
+    pre_hi_val: np.ndarray[np.float32] = np.empty(calc_size, dtype = np.float32)
+    pre_hi_idx: np.ndarray[np.int32]   = np.empty(calc_size, dtype = np.int32)
+    pre_lo_val: np.ndarray[np.float32] = np.empty(calc_size, dtype = np.float32)
+    pre_lo_idx: np.ndarray[np.int32]   = np.empty(calc_size, dtype = np.int32)
+    suf_hi_val: np.ndarray[np.float32] = np.empty(calc_size, dtype = np.float32)
+    suf_hi_idx: np.ndarray[np.int32]   = np.empty(calc_size, dtype = np.int32)
+    suf_lo_val: np.ndarray[np.float32] = np.empty(calc_size, dtype = np.float32)
+    suf_lo_idx: np.ndarray[np.int32]   = np.empty(calc_size, dtype = np.int32)
+    
+    for block_start in range(0, calc_size, period):
+        block_end: np.int32 = min(block_start + period, calc_size)
+        
+        # Prefix extremes ( left to right ).
+        hi_val:  np.float32 = data_arr[base_indx + block_start]
+        lo_val:  np.float32 = hi_val
+        hi_indx: np.int32   = base_indx + block_start
+        lo_indx: np.int32   = hi_indx
+        
+        for k in range(block_start, block_end):
+            k_shft: np.int32   = base_indx + k
+            data_temp          = data_arr[k_shft]
+            is_high            = data_temp > hi_val
+            is_low             = data_temp < lo_val
+            hi_val             = data_temp if is_high else hi_val
+            hi_indx            = k_shft    if is_high else hi_indx
+            lo_val             = data_temp if is_low  else lo_val
+            lo_indx            = k_shft    if is_low  else lo_indx
+            pre_hi_val[k]      = hi_val
+            pre_hi_idx[k]      = hi_indx
+            pre_lo_val[k]      = lo_val
+            pre_lo_idx[k]      = lo_indx
+        
+        # Suffix extremes ( right to left ).
+        hi_val  = data_arr[base_indx + block_end - 1]
+        lo_val  = hi_val
+        hi_indx = base_indx + block_end - 1
+        lo_indx = hi_indx
+        
+        for k in range(block_end - 1, block_start - 1, -1):
+            k_shft             = base_indx + k
+            data_temp          = data_arr[k_shft]
+            is_high            = data_temp >= hi_val
+            is_low             = data_temp <= lo_val
+            hi_val             = data_temp if is_high else hi_val
+            hi_indx            = k_shft    if is_high else hi_indx
+            lo_val             = data_temp if is_low  else lo_val
+            lo_indx            = k_shft    if is_low  else lo_indx
+            suf_hi_val[k]      = hi_val
+            suf_hi_idx[k]      = hi_indx
+            suf_lo_val[k]      = lo_val
+            suf_lo_idx[k]      = lo_indx
+    
+    for i in range(i_first, i_end):
+        k_shft = i - base_indx              # Window end, relative to base_indx.
+        k      = k_shft - period + 1        # Window start, relative to base_indx.
+        
+        hi_indx = suf_hi_idx[k] if suf_hi_val[k] >= pre_hi_val[k_shft] else pre_hi_idx[k_shft]
+        lo_indx = suf_lo_idx[k] if suf_lo_val[k] <= pre_lo_val[k_shft] else pre_lo_idx[k_shft]
+        
+        temp_res: np.float32 = period_multiplier * np.float32(lo_indx - hi_indx)
+        result_arr[i]        = temp_res
+    
+    return
+
+# -----------------------------------------------------------------------------------
+#
+#           AROON - KERNEL SELECTION ( Private ):
+#
+# -----------------------------------------------------------------------------------
+
+# NOTE: Measured on 2M float32 values ( `benchmarks/bench_aroon_kernels.py` ),
+#       uniform random and random walk data:
+#       - Scan is the fastest up to period ~ 8,
+#       - Block Max on chunks of 8192 outputs ( scratch arrays stay in L1 / L2 cache )
+#           is the fastest above, 2x - 3x faster than the Deque at any period.
+#       Deque is kept for explicit selection ( no scratch arrays ).
+
+AROON_KERNEL_AUTO:  int = 0
+AROON_KERNEL_SCAN:  int = 1
+AROON_KERNEL_DEQUE: int = 2
+AROON_KERNEL_BLOCK: int = 3
+
+_SCAN_MAX_PERIOD: int = 8
+_BLOCKMAX_CHUNK:  int = 8192
+
+_signature_select = numba.void(
+                    numba.types.Array(numba.float32, 1, 'C', readonly = True,  aligned = True),     # data_arr
+                    numba.int32,                                                                    # period
+                    numba.int32,                                                                    # i_start
+                    numba.int32,                                                                    # i_end
+                    numba.types.Array(numba.float32, 1, 'C', readonly = False, aligned = True),     # result_arr
+                    numba.int32, )                                                                  # kernel_id
+
+_locals_kernel = {
+        'chunk_size': numba.int32,
+        'chunk_end':  numba.int32, }
+
+@numba.njit(_signature_select,
+            cache        = True, 
+            fastmath     = True, 
+            nogil        = True,
+            boundscheck  = False,
+            error_model  = 'numpy',
+            locals       = _locals_kernel, )
+def _get_aroon_kernel(
+                        data_arr:   np.ndarray[np.float32],
+                        period:     np.int32,
+                        i_start:    np.int32,
+                        i_end:      np.int32,
+                        result_arr: np.ndarray[np.float32],
+                        kernel_id:  np.int32,
+                            ) -> None:
+    '''
+    Aroon Indicator kernel for `result_arr[i_start : i_end]`.
+    Values of the first period ( i < period ) are NOT touched.
+    
+    `kernel_id`: `AROON_KERNEL_AUTO` - select Scan / Block Max kernel by period,
+        or `AROON_KERNEL_SCAN`, `AROON_KERNEL_DEQUE`, `AROON_KERNEL_BLOCK`.
+    '''
+    
+    if kernel_id == AROON_KERNEL_AUTO:
+        if period <= _SCAN_MAX_PERIOD:
+            kernel_id = AROON_KERNEL_SCAN
+        else:
+            kernel_id = AROON_KERNEL_BLOCK
+    
+    if kernel_id == AROON_KERNEL_SCAN:
+        _get_aroon_scan(data_arr, period, i_start, i_end, result_arr)
+        return
+    
+    if kernel_id == AROON_KERNEL_DEQUE:
+        _get_aroon_deque(data_arr, period, i_start, i_end, result_arr)
+        return
+    
+    chunk_size: np.int32 = max(4 * period, _BLOCKMAX_CHUNK)
+    
+    for chunk_start in range(i_start, i_end, chunk_size):
+        chunk_end: np.int32 = min(chunk_start + chunk_size, i_end)
+        _get_aroon_blockmax(data_arr, period, chunk_start, chunk_end, result_arr)
+    
+    return
+
+# -----------------------------------------------------------------------------------
+#
+#                 AROON - NUMBA:
+#
+# -----------------------------------------------------------------------------------
+
+_spec_func_numba = numba.types.Array(numba.float32, 1, 'C')(
+                    numba.types.Array(numba.float32, 1, 'C', readonly = True, aligned = True),  # data_arr
+                    numba.int32)                                                                # period
 
 @numba.njit(_spec_func_numba,
             cache        = True, 
             fastmath     = True, 
             nogil        = True,
             boundscheck  = False,
-            locals       = _locals_func_numba,
                 )
 def get_aroon(
                 data_arr: np.ndarray[np.float32],
@@ -86,31 +560,121 @@ def get_aroon(
     
     result_arr: np.ndarray[np.float32] = np.empty_like(data_arr, dtype = np.float32)
     
-    result_arr[:period] = 0.0  # Default value for the first period.
-        
-    period_multiplier: np.float32 = 1.0 / np.float32(period)
+    result_arr[:period] = np.float32(0.0)  # Default value for the first period.
+    
+    _get_aroon_kernel(data_arr, period, 0, np.int32(data_arr.shape[0]), result_arr, AROON_KERNEL_AUTO)
+    
+    return result_arr
+
+# -----------------------------------------------------------------------------------
+#
+#          AROON - SPECIALIZED BY PERIOD ( Runtime Codegen ):
+#
+# -----------------------------------------------------------------------------------
+
+# NOTE: With `period` known at compile time, LLVM fully unrolls the window scan
+#       and keeps ( value, index ) pairs in registers. 
+#       Used for small periods only, where the unrolled scan beats Block Max.
+#       Kernels are compiled on the first call with a new period ( not cached on disk ),
+#       and kept in LRU cache of 16 periods, to limit compilation.
+#
+#       Limit is above `_SCAN_MAX_PERIOD`: that one is for the generic scan ( runtime period, not unrolled ).
+#       Measured on 2M float32 values ( uniform random and random walk ), unrolled scan / `get_aroon()` ( Block Max ):
+#       period 9: 2.3 / 18.5 ms, period 16: 4.3 / 15.9 ms, period 32: 9.7 / 14.8 ms, period 33: 10.2 / 14.5 ms,
+#       period 36 .. 48: 80 .. 270 ms - loop is no longer unrolled, 5x - 20x slower than Block Max.
+
+_SPECIALIZE_MAX_PERIOD: int = 32
+
+_ENV_KERNELS: dict = {
+        'auto':  AROON_KERNEL_AUTO,
+        'scan':  AROON_KERNEL_SCAN,
+        'deque': AROON_KERNEL_DEQUE,
+        'block': AROON_KERNEL_BLOCK, }
+
+_ENV_KERNEL_NAME: str = os.environ.get('TI_AROON_KERNEL', 'auto').strip().lower()
+_ENV_KERNEL_ID:   int = _ENV_KERNELS.get(_ENV_KERNEL_NAME, AROON_KERNEL_AUTO)
+
+if _ENV_KERNEL_NAME not in _ENV_KERNELS:
+    warnings.warn(f'TI_AROON_KERNEL = {_ENV_KERNEL_NAME!r} is unknown, '
+                  f'expected one of {list(_ENV_KERNELS)}. Using "auto".')
+
+_spec_func_specialized = numba.types.Array(numba.float32, 1, 'C')(
+                            numba.types.Array(numba.float32, 1, 'C', readonly = True, aligned = True), )  # data_arr
 
-    for i in range(period, len(data_arr)):
+_locals_specialized = {
+        'temp_res': numba.float32, }
+
+@functools.lru_cache(maxsize = 16)
+def _build_aroon_specialized(period: int):
+    '''
+    Build Aroon Indicator kernel `(data_arr) -> result_arr` for the fixed period.
+    '''
+    
+    PERIOD:            int        = period
+    PERIOD_MULTIPLIER: np.float32 = np.float32(1.0) / np.float32(period)
+    
+    @numba.njit(_spec_func_specialized,
+                fastmath    = True,
+                nogil       = True,
+                boundscheck = False,
+                error_model = 'numpy',
+                locals      = _locals_specialized, )
+    def _get_aroon_specialized(data_arr: np.ndarray[np.float32]) -> np.ndarray[np.float32]:
+        
+        result_arr: np.ndarray[np.float32] = np.empty_like(data_arr, dtype = np.float32)
         
-        high_index: np.int32 = 0
-        low_index:  np.int32 = 0
-        i_shft:     np.int32 = i - period + 1        
-        high_val: np.float32 = data_arr[i_shft]
-        low_val:  np.float32 = data_arr[i_shft]
+        result_arr[:PERIOD] = np.float32(0.0)  # Default value for the first period.
         
-        for j in range(1, period):
-            data_temp: np.float32 = data_arr[i_shft + j]
-            if data_temp > high_val:
-                high_val   = data_temp
-                high_index = j
-                
-            if data_temp < low_val:
-                low_val   = data_temp
-                low_index = j
+        for i in range(PERIOD, len(data_arr)):
+            high_index, low_index = _aroon_window_scan(data_arr, i - PERIOD + 1, PERIOD)
             
-        result_arr[i] = period_multiplier * (low_index - high_index)
+            temp_res: np.float32 = PERIOD_MULTIPLIER * np.float32(low_index - high_index)
+            result_arr[i]        = temp_res
         
-        pass
+        return result_arr
+    
+    return _get_aroon_specialized
+
+def get_aroon_dispatch(
+                        data_arr: np.ndarray[np.float32],
+                        period:   int,
+                            ) -> np.ndarray[np.float32]:
+    '''
+    Get Aroon Indicator of the given array.
+    Same results as `get_aroon()`.
+    
+    For `period <= 32` uses Scan kernel compiled for this exact period 
+    ( compiled on the first call with the new period ),
+    otherwise the same kernels as `get_aroon()`.
+    
+    Kernel can be forced by environment variable ( read at import ):
+    `TI_AROON_KERNEL = auto | scan | deque | block`.
+    
+    Parameters:
+    -----------
+    data_arr: (`np.ndarray[np.float32]`) : array of values.
+    period:   (`int`)                    : period of Aroon Indicator.
+        Warning: **( period >= 2 )**
+    
+    Returns:
+    --------
+    (`np.ndarray[np.float32]`) : array of Aroon Indicator.
+    result[i] - in range [-1.0 .. 1.0]
+    '''
+    
+    kernel_id: int = _ENV_KERNEL_ID
+    
+    if kernel_id in (AROON_KERNEL_AUTO, AROON_KERNEL_SCAN) and period <= _SPECIALIZE_MAX_PERIOD:
+        return _build_aroon_specialized(int(period))(data_arr)
+    
+    if kernel_id == AROON_KERNEL_AUTO:
+        return get_aroon(data_arr, period)
+    
+    result_arr: np.ndarray[np.float32] = np.empty_like(data_arr, dtype = np.float32)
+    
+    result_arr[:period] = np.float32(0.0)  # Default value for the first period.
+    
+    _get_aroon_kernel(data_arr, period, 0, data_arr.shape[0], result_arr, kernel_id)
     
     return result_arr
 
@@ -126,21 +690,11 @@ _spec_func_numba =  numba.types.void(
                     numba.int32,                                                                    # data_size
                     numba.types.Array(numba.float32, 1, 'C', readonly = False, aligned = True), )   # result_arr
 
-_locals_func_numba = {
-        'period_multiplier': numba.float32,
-        'high_index':        numba.int32,
-        'low_index':         numba.int32,
-        'i_shft':            numba.int32,
-        'high_val':          numba.float32,
-        'low_val':           numba.float32,
-        'temp_res':          numba.float32, }
-
 @numba.njit(_spec_func_numba,
             cache        = True, 
             fastmath     = True, 
             nogil        = True,
-            boundscheck  = False,
-            locals       = _locals_func_numba,  )
+            boundscheck  = False, )
 def get_aroon_tsf(  
                     data_arr:   np.ndarray[np.float32],
                     period:     np.int32,
@@ -175,34 +729,119 @@ def get_aroon_tsf(
     if data_size < 0:
         data_size = data_arr.shape[0]
     
-    period_multiplier: np.float32 = 1.0 / np.float32(period)
+    result_arr[:period] = np.float32(0.0)  # Default value for the first period.
     
-    for i in range(period):
-        result_arr[i] = 0.0  # Default value for the first period.
+    _get_aroon_kernel(data_arr, period, 0, data_size, result_arr, AROON_KERNEL_AUTO)
+    
+    return
 
-    for i in range(period, data_size):
-        
-        high_index: np.int32 = 0
-        low_index:  np.int32 = 0
-        i_shft:     np.int32 = i - period + 1        
-        high_val: np.float32 = data_arr[i_shft]
-        low_val:  np.float32 = data_arr[i_shft]
-        
-        for j in range(1, period):
-            data_temp: np.float32 = data_arr[i_shft + j]
-            if data_temp > high_val:
-                high_val   = data_temp
-                high_index = j
-                
-            if data_temp < low_val:
-                low_val   = data_temp
-                low_index = j
-        
-        temp_res: np.float32 = period_multiplier * (low_index - high_index)
-        result_arr[i]        = temp_res
+# -----------------------------------------------------------------------------------
+#
+#          AROON (tsf) - Thread Safe Function, Parallel ( Multi-Core )
+#
+# -----------------------------------------------------------------------------------
+
+_locals_tsf_parallel = {
+        'chunk_size': numba.int32,
+        'n_chunks':   numba.int32,
+        'i_start':    numba.int32,
+        'i_end':      numba.int32, }
+
+@numba.njit(_spec_func_numba,
+            cache        = True, 
+            fastmath     = True, 
+            nogil        = True,
+            boundscheck  = False,
+            parallel     = True,
+            locals       = _locals_tsf_parallel, )
+def get_aroon_tsf_parallel(  
+                            data_arr:   np.ndarray[np.float32],
+                            period:     np.int32,
+                            data_size:  np.int32,
+                            result_arr: np.ndarray[np.float32],                  
+                                ) -> None:
+    '''
+    Get Aroon Indicator of the given array.
+    Parallel version of `get_aroon_tsf()`, runs on all cores.
+    
+    Data is split into chunks of `max(4 * period, 4096)` values, 
+    every chunk is calculated independently in `numba.prange()`.
+    Results are identical to `get_aroon_tsf()`.
+    
+    Parameters:
+    -----------
+    data_arr:   (`np.ndarray[np.float32]`) : array of values.
+    period:     (`np.int32`)               : period of Aroon Indicator.
+        Warning: **( period >= 2 )**
+    data_size:  (`np.int32`)               : size of data array.
+    result_arr: (`np.ndarray[np.float32]`) : array of Aroon Indicator.
+        !!! UPDATING array with Arroon Indicator values. !!!
+        Warning: **( len(result_arr) >= data_size )**
+    '''
+    
+    if data_size < 0:
+        data_size = data_arr.shape[0]
+    
+    result_arr[:period] = np.float32(0.0)  # Default value for the first period.
+    
+    chunk_size: np.int32 = max(4 * period, 4096)
+    n_chunks:   np.int32 = (data_size + chunk_size - 1) // chunk_size
+    
+    for c in numba.prange(n_chunks):
+        i_start: np.int32 = c * chunk_size
+        i_end:   np.int32 = min(i_start + chunk_size, data_size)
+        _get_aroon_kernel(data_arr, period, i_start, i_end, result_arr, AROON_KERNEL_AUTO)
     
     return
 
+# -----------------------------------------------------------------------------------
+#
+#          AROON (batch) - Multi-Asset, Parallel ( Multi-Core )
+#
+# -----------------------------------------------------------------------------------
+
+_spec_func_batch = numba.types.Array(numba.float32, 2, 'C')(
+                    numba.types.Array(numba.float32, 2, 'C', readonly = True, aligned = True),  # data_mat
+                    numba.int32, )                                                              # period
+
+@numba.njit(_spec_func_batch,
+            cache        = True, 
+            fastmath     = True, 
+            nogil        = True,
+            boundscheck  = False,
+            parallel     = True, )
+def get_aroon_batch(
+                    data_mat: np.ndarray[np.float32],
+                    period:   np.int32,
+                        ) -> np.ndarray[np.float32]:
+    '''
+    Get Aroon Indicator for many assets in one call.
+    Rows ( assets ) are calculated in parallel in `numba.prange()`,
+    each row gives the same result as `get_aroon()`.
+    
+    Parameters:
+    -----------
+    data_mat: (`np.ndarray[np.float32]`) : 2D array of values, shape ( n_assets, n_bars ).
+        Row-major ( C ), so every row is contiguous.
+    period:   (`np.int32`)               : period of Aroon Indicator.
+        Warning: **( period >= 2 )**
+    
+    Returns:
+    --------
+    (`np.ndarray[np.float32]`) : 2D array of Aroon Indicator, shape ( n_assets, n_bars ).
+    '''
+    
+    n_assets: int = data_mat.shape[0]
+    n_bars:   int = data_mat.shape[1]
+    
+    result_mat: np.ndarray[np.float32] = np.empty((n_assets, n_bars), dtype = np.float32)
+    
+    for a in numba.prange(n_assets):
+        result_mat[a, :period] = np.float32(0.0)  # Default value for the first period.
+        _get_aroon_kernel(data_mat[a], period, 0, n_bars, result_mat[a], AROON_KERNEL_AUTO)
+    
+    return result_mat
+
 # -----------------------------------------------------------------------------------
 #
 #            AROON (vtsf) - Value, Thread Safe Function
@@ -215,21 +854,14 @@ _spec_func_vtsf = numba.types.float32(
                     numba.int32, )
 
 _locals_vtsf = {
-        'period_multiplier': numba.float32,
-        'start_indx':        numba.int32,
-        'end_indx':          numba.int32,
-        'high_index':        numba.int32,
-        'low_index':         numba.int32,
-        'i_shft':            numba.int32,
-        'high_val':          numba.float32,
-        'low_val':           numba.float32,
-        'temp_res':          numba.float32,  }
+        'temp_res': numba.float32,  }
 
 @numba.njit(_spec_func_vtsf,
             cache       = True, 
             fastmath    = True, 
             nogil       = True,
-            boundscheck = False,            
+            boundscheck = False,
+            error_model = 'numpy',
             locals      = _locals_vtsf,)
 def get_aroon_vtsf(
                     data_arr:  np.ndarray[np.float32],
@@ -252,24 +884,9 @@ def get_aroon_vtsf(
     (`np.float32`) : Aroon Indicator Single Value result.
     '''
 
-    high_index:      np.int32   = 0
-    low_index:       np.int32   = 0
-    start_indx_shft: np.int32   = data_indx - period + 1
-    data_temp:       np.float32 = data_arr[start_indx_shft]
-    high_val:        np.float32 = data_temp
-    low_val:         np.float32 = data_temp
-    
-    for i in range(1, period):   # from 1 to period, because first data is already calculated.
-        data_temp = data_arr[start_indx_shft + i]
-        if data_temp > high_val:
-            high_val   = data_temp
-            high_index = i
-        
-        if data_temp < low_val:
-            low_val    = data_temp
-            low_index  = i
+    high_index, low_index = _aroon_window_scan(data_arr, data_indx - period + 1, period)
     
-    temp_res: np.float32 = float((low_index - high_index)) * (1.0 / float(period)) 
+    temp_res: np.float32 = np.float32(low_index - high_index) * (np.float32(1.0) / np.float32(period))
     
     return temp_res
 
@@ -306,26 +923,205 @@ def get_aroon_vtsf_cuda(
         Warning: **( len(res_arr) >= data_size )**
     '''
 
-    high_index:      int   = 0
-    low_index:       int   = 0                            
-    start_indx_shft: int   = data_indx - period + 1
-    data_temp:       float = data_arr[start_indx_shft]
-    high_val:        float = data_temp
-    low_val:         float = data_temp
+    high_index, low_index = _aroon_window_scan_cuda(data_arr, data_indx - period + 1, period)
     
-    for i in range(1, period):   # from 1 to period, because first data is already calculated.
-        data_temp = data_arr[start_indx_shft + i]
-        if data_temp > high_val:
-            high_val   = data_temp
-            high_index = i
+    temp_res: np.float32 = np.float32(low_index - high_index) * (np.float32(1.0) / np.float32(period))
+    res_arr[res_indx] = temp_res
+    
+    return
 
-        if data_temp < low_val:
-            low_val    = data_temp
-            low_index  = i
+# -----------------------------------------------------------------------------------
+#
+#            AROON - GPU Kernel, Full Array:
+#                   One GPU thread per output index.
+#
+# -----------------------------------------------------------------------------------
 
-    temp_res: float   = float((low_index - high_index)) * (1.0 / float(period))    
-    res_arr[res_indx] = temp_res
+@cuda.jit()
+def get_aroon_cuda_kernel(
+                            data_arr:   np.ndarray[np.float32],
+                            period:     np.int32,
+                            result_arr: np.ndarray[np.float32],
+                                ) -> None:
+    '''
+    Get Aroon Indicator array.
+    GPU Kernel, each thread calculates one output index `i = cuda.grid(1)`.
+    
+    Whole `result_arr[]` is filled by a single launch.
+    Neighbouring threads read neighbouring windows, so loads are coalesced.
+    
+    Launch:
+    -------
+    >>> blocks = (n + threads - 1) // threads
+    >>> get_aroon_cuda_kernel[blocks, threads](d_data_arr, period, d_result_arr)
+    
+    Parameters:
+    -----------
+    data_arr:   (`np.ndarray[np.float32]`) : array of values ( device array ).
+    period:     (`np.int32`)               : period of Aroon Indicator.
+        Warning: **( period >= 2 )**
+    result_arr: (`np.ndarray[np.float32]`) : array of Aroon Indicator ( device array ).
+        !!! UPDATING array with Arroon Indicator values. !!!
+        Warning: **( len(result_arr) <= len(data_arr) )**
+    '''
+    
+    i: int = cuda.grid(1)
+    
+    if i >= result_arr.shape[0]:
+        return
+    
+    if i < period:
+        result_arr[i] = 0.0  # Default value for the first period.
+        return
+    
+    high_index, low_index = _aroon_window_scan_cuda(data_arr, i - period + 1, period)
+    
+    result_arr[i] = np.float32(low_index - high_index) * (np.float32(1.0) / np.float32(period))
     
     return
 
-# -----------------------------------------------------------------------------------
\ No newline at end of file
+# -----------------------------------------------------------------------------------
+#
+#            AROON - GPU Kernel, Full Array, Shared Memory Tiling:
+#
+# -----------------------------------------------------------------------------------
+
+# NOTE: Neighbouring threads share `period - 1` values of their windows.
+#       Block loads its tile `data_arr[block_start - period + 1 .. block_end)` 
+#       into shared memory once, and then all windows are scanned from the tile.
+#       Shared array size must be a compile-time constant, so kernels are built 
+#       per ( period, threads_per_block ) and cached.
+
+_CUDA_TILE_MAX_PERIOD: int = 4096   # Tile must fit in 48 KB of shared memory.
+
+_cuda_tiled_kernels: dict = {}
+
+def build_aroon_cuda_kernel(
+                            period:            int,
+                            threads_per_block: int = 128,
+                                ):
+    '''
+    Build ( or get from cache ) shared memory tiled Aroon GPU Kernel 
+    for the given period and block size.
+    
+    Launch:
+    -------
+    >>> kernel = build_aroon_cuda_kernel(period, threads)
+    >>> kernel[blocks, threads](d_data_arr, d_result_arr)
+    
+    Parameters:
+    -----------
+    period:            (`int`) : period of Aroon Indicator.
+        Warning: **( 2 <= period <= 4096 )**
+    threads_per_block: (`int`) : CUDA block size, kernel MUST be launched with it.
+    
+    Returns:
+    --------
+    CUDA Kernel `(data_arr, result_arr) -> None`, 
+        with the same results as `get_aroon_cuda_kernel()`.
+    '''
+    
+    key: tuple = (int(period), int(threads_per_block))
+    kernel     = _cuda_tiled_kernels.get(key)
+    
+    if kernel is not None:
+        return kernel
+    
+    PERIOD:            int   = key[0]
+    THREADS:           int   = key[1]
+    TILE:              int   = THREADS + PERIOD - 1
+    PERIOD_MULTIPLIER: np.float32 = np.float32(1.0) / np.float32(PERIOD)
+    
+    @cuda.jit()
+    def _aroon_tiled_kernel(
+                            data_arr:   np.ndarray[np.float32],
+                            result_arr: np.ndarray[np.float32],
+                                ) -> None:
+        
+        tile = cuda.shared.array(shape = TILE, dtype = numba.float32)
+        
+        tx:          int = cuda.threadIdx.x
+        block_start: int = cuda.blockIdx.x * THREADS
+        tile_start:  int = block_start - PERIOD + 1
+        data_size:   int = data_arr.shape[0]
+        
+        # Cooperative load of the tile, coalesced.
+        for k in range(tx, TILE, THREADS):
+            src_indx: int = tile_start + k
+            if src_indx >= 0 and src_indx < data_size:
+                tile[k] = data_arr[src_indx]
+        
+        cuda.syncthreads()
+        
+        i: int = block_start + tx
+        
+        if i >= result_arr.shape[0]:
+            return
+        
+        if i < PERIOD:
+            result_arr[i] = 0.0  # Default value for the first period.
+            return
+        
+        # Window of `i` is tile[tx .. tx + PERIOD - 1].
+        high_index, low_index = _aroon_window_scan_cuda(tile, tx, PERIOD)
+        
+        result_arr[i] = np.float32(low_index - high_index) * PERIOD_MULTIPLIER
+        
+        return
+    
+    _cuda_tiled_kernels[key] = _aroon_tiled_kernel
+    
+    return _aroon_tiled_kernel
+
+# -----------------------------------------------------------------------------------
+#
+#            AROON - GPU, Full Array ( Host Function ):
+#
+# -----------------------------------------------------------------------------------
+
+def get_aroon_cuda(
+                    data_arr:          np.ndarray[np.float32],
+                    period:            int,
+                    threads_per_block: int = 128,
+                        ) -> np.ndarray[np.float32]:
+    '''
+    Get Aroon Indicator of the given array, calculated on GPU.
+    
+    Launches GPU Kernel once for the whole array:
+        shared memory tiled kernel for `period <= 4096`,
+        otherwise `get_aroon_cuda_kernel()`.
+    
+    Parameters:
+    -----------
+    data_arr:          (`np.ndarray[np.float32]`) : array of values.
+        Host array, or CUDA device array.
+    period:            (`int`)                    : period of Aroon Indicator.
+        Warning: **( period >= 2 )**
+    threads_per_block: (`int`)                    : CUDA block size.
+    
+    Returns:
+    --------
+    (`np.ndarray[np.float32]`) : array of Aroon Indicator.
+        If `data_arr` is a device array, result is a device array too.
+    '''
+    
+    is_device: bool = hasattr(data_arr, '__cuda_array_interface__')
+    d_data_arr      = data_arr if is_device else cuda.to_device(np.ascontiguousarray(data_arr, dtype = np.float32))
+    data_size: int  = d_data_arr.shape[0]
+    d_result_arr    = cuda.device_array(data_size, dtype = np.float32)
+    
+    blocks: int = (data_size + threads_per_block - 1) // threads_per_block
+    
+    if blocks > 0:
+        if period <= _CUDA_TILE_MAX_PERIOD:
+            kernel = build_aroon_cuda_kernel(period, threads_per_block)
+            kernel[blocks, threads_per_block](d_data_arr, d_result_arr)
+        else:
+            get_aroon_cuda_kernel[blocks, threads_per_block](d_data_arr, period, d_result_arr)
+    
+    if is_device:
+        return d_result_arr
+    
+    return d_result_arr.copy_to_host()
+
+# -----------------------------------------------------------------------------------
@@ -1,18 +1,51 @@
+from __future__ import annotations
+
+import functools
+import math
+
 import numpy as np
 import numba
 from numba import cuda
 
+from ._constants import L2_TILE_SIZE, L2_BF16_TILE_SIZE
+
 
 # -----------------------------------------------------------------------------------
 
 _name_:           str = 'BB: Bollinger Bands'
-__version__:      str = '0.0.1'
-__version_date__: str = '2024-09-16'
+__version__:      str = '0.0.2'
+__version_date__: str = '2026-10-15'
 VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}' 
 
 # --- VERSION HISTORY: --------------------------------------------------------------
 
 # v0.0.1 @ 2024-09-16 : Initial Release.
+# v0.0.2 @ 2026-10-15 : Single rolling kernel for get_bb() / get_bb_tsf() ( calculates any sub-range ).
+#                       Added get_bb_tsf_parallel() - multi-core version of get_bb_tsf().
+#                       Rolling sum of squares update as ( x - x_old ) * ( x + x_old ).
+#                       Welford / Chan rolling Mean and M2 instead of sum of squares ( float32 stable ).
+#                       Two pass Mean / M2 in get_bb_vtsf() and get_bb_vtsf_cuda().
+#                       Window sum seeds as slice reductions.
+#                       Branchless clamp of result, flat window ( std == 0 ) now gives 0.0 ( was 3.0 ).
+#                       Reciprocal STD ( 1 / sqrt ) instead of sqrt + division.
+#                       Added get_bb_vtsf_batch() - get_bb_vtsf() for many indexes, multi-core.
+#                       Added get_bb_vtsf_cuda_block() - GPU, one thread block per value.
+#                       Added get_bb_full_tsf() - Upper / Mid / Lower / Bandwidth / %B in one pass.
+#                       Note on input arrays layout ( float32, C-contiguous ).
+#                       Two phase rolling kernel - scalar Mean / M2, packed SIMD sqrt / clamp.
+#                       Added get_bb_dispatch() - kernels specialized by period ( compile cache ).
+#                       get_bb() is a wrapper of get_bb_tsf() ( single implementation ).
+#                       x * x instead of x ** 2.
+#                       Added get_bb_tsf_bf16() - bfloat16 compressed input ( half memory traffic ).
+#                       get_bb_full_tsf() - band offset and 1 / width computed once per value.
+#                       Added get_bb_range_cuda() - GPU grid stride kernel, get_bb_cuda() - host function.
+#                       GPU kernels read `data[]` with cache hinted loads ( `cuda.ldca()`, read only ).
+#                       math.sqrt() everywhere, `diff` typed float32 in get_bb_vtsf() ( no float64 widening ).
+#                       get_bb() is NOT force inlined, NumPy error model ( no division by zero checks ).
+#                       Rolling Mean / M2 in float64, re-seeded every `_BB_SIMD_BLOCK` values ( no drift on long series ).
+#                       get_bb_tsf_parallel() tiles are multiples of `_BB_SIMD_BLOCK` - same results as get_bb_tsf().
+#                       get_bb_full_tsf() - float64 Mean / M2, re-seeded per block too.
+#                       get_bb_vtsf() - float64 two pass Mean / M2 ( `_bb_window_seed()` ), no float32 window sum at high price levels.
 #
 
 # --- CALCULATION DESCRIPTION: -------------------------------------------------------
@@ -21,6 +54,241 @@ VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date_
 #                     BB     = SMA +- 2 * STD
 #                     BB_val = (Close - SMA) / 2 * STD
 
+# NOTE: Compiled for float32, C-contiguous arrays only ( `Array(float32, 1, 'C')` == `float32[::1]` ).
+#       Prepare input with `as_aligned_f32()` - float32, contiguous, 64 bytes aligned.
+
+# -----------------------------------------------------------------------------------
+#
+#               BOLLINGER BANDS - Rolling Kernel ( Private )
+#
+# -----------------------------------------------------------------------------------
+
+_BB_SIMD_BLOCK: int = 1024     # Values per block of the two phase kernel ( 2 x 4 KB scratch ), Mean / M2 re-seeded per block.
+
+@numba.njit(inline = 'always')
+def _bb_window_seed(
+                    data:    np.ndarray[np.float32], 
+                    i_start: np.int32,
+                    period:  np.int32,
+                        ) -> tuple[np.float64, np.float64]:
+    '''
+    Mean and M2 ( sum of squared deviations ) of `data[i_start : i_start + period]`, float64.
+    Two pass - no cancellation.
+    '''
+    
+    mean = np.float64(0.0)
+    for i in range(i_start, i_start + period):
+        mean += np.float64(data[i])
+    mean /= period
+    
+    m2 = np.float64(0.0)
+    for i in range(i_start, i_start + period):
+        data_dev = np.float64(data[i]) - mean
+        m2      += data_dev * data_dev
+    
+    return mean, m2
+
+@numba.njit(inline = 'always')
+def _bb_range(
+                data:       np.ndarray[np.float32], 
+                period:     np.int32,
+                i_first:    np.int32,
+                i_end:      np.int32,
+                result_arr: np.ndarray[np.float32],                  
+                    ) -> None:
+    '''
+    Rolling Bollinger Bands for indexes `[i_first, i_end)`, `i_first >= period`.
+    Inlined into callers, so `period` is folded when it is a compile time constant.
+    
+    Indexes are processed in blocks aligned to `_BB_SIMD_BLOCK`, 
+    every block seeds Mean / M2 on the window before its first index, 
+    so float32 rounding of the rolling update does NOT accumulate across blocks, 
+    and any sub-range split at block boundaries gives the same results.
+    '''
+    
+    multiplier_1 = np.float32(1.0) / np.float32(period)
+    mult_1_f64   = 1.0 / np.float64(period)
+    
+    # Two phases per block: 
+    #   1. Rolling Mean / M2 - loop carried, scalar, only adds and FMAs.
+    #      float64 - at price levels ~1000 float32 M2 loses the window variance to cancellation.
+    #   2. sqrt / clamp - independent per value, in scratch arrays ( no aliasing ),
+    #      so it is vectorized to packed SIMD ( sqrtps, minps / maxps ).
+    var_buf  = np.empty(_BB_SIMD_BLOCK, dtype = np.float32)
+    diff_buf = np.empty(_BB_SIMD_BLOCK, dtype = np.float32)
+    
+    block_start = i_first
+    
+    while block_start < i_end:
+        block_end = min((block_start // _BB_SIMD_BLOCK + 1) * _BB_SIMD_BLOCK, i_end)
+        
+        # Mean and M2 of the window before the first index.
+        mean, m2 = _bb_window_seed(data, block_start - period, period)
+        
+        for i in range(block_start, block_end):
+            data_temp     = np.float64(data[i])
+            data_temp_old = np.float64(data[i - period])
+            
+            # Welford / Chan update - replace x_old with x in the window.
+            data_delta = data_temp - data_temp_old
+            mean_new   = mean + data_delta * mult_1_f64
+            m2        += data_delta * (data_temp - mean_new + data_temp_old - mean)
+            mean       = mean_new
+            
+            var_buf[i - block_start]  = np.float32(m2)
+            diff_buf[i - block_start] = np.float32(data_temp - mean)
+        
+        for k in range(block_end - block_start):
+            accum_var = max(var_buf[k], np.float32(0.0)) * multiplier_1    # M2 can drift below 0.0 on flat data.
+            
+            # Branchless clamp to [-3.0 .. 3.0], flat window ( std == 0.0 ) gives 0.0.
+            inv_std   = np.float32(1.0) / math.sqrt(accum_var) if accum_var > np.float32(0.0) else np.float32(0.0)
+            
+            result_arr[block_start + k] = min(np.float32(3.0), max(np.float32(-3.0), diff_buf[k] * inv_std))
+        
+        block_start = block_end
+    
+    return
+
+_signature_kernel = numba.void(
+                    numba.types.Array(numba.float32, 1, 'C', readonly = True,  aligned = True),     # data
+                    numba.int32,                                                                    # period
+                    numba.int32,                                                                    # i_start
+                    numba.int32,                                                                    # i_end
+                    numba.types.Array(numba.float32, 1, 'C', readonly = False, aligned = True), )   # result_arr
+
+@numba.njit(_signature_kernel,
+            cache        = True, 
+            fastmath     = True, 
+            nogil        = True,
+            boundscheck  = False,
+            error_model  = 'numpy',
+            locals       = {'i_first': numba.int32}, )
+def _get_bb_kernel(
+                    data:       np.ndarray[np.float32], 
+                    period:     np.int32,
+                    i_start:    np.int32,
+                    i_end:      np.int32,
+                    result_arr: np.ndarray[np.float32],                  
+                        ) -> None:
+    '''
+    Rolling Bollinger Bands for indexes `[max(i_start, period), i_end)`.
+    
+    Accumulators are seeded on the window before the first index, 
+    so any sub-range can be calculated independently ( see `get_bb_tsf_parallel()` ).
+    Indexes `< period` are NOT updated.
+    '''
+    
+    i_first: np.int32 = max(i_start, period)
+    
+    if i_first < i_end:
+        _bb_range(data, period, i_first, i_end, result_arr)
+    
+    return
+
+# -----------------------------------------------------------------------------------
+#
+#               BOLLINGER BANDS - Specialized by Period ( Compile Cache )
+#
+# -----------------------------------------------------------------------------------
+
+_spec_func_specialized = numba.types.Array(numba.float32, 1, 'C')(
+                            numba.types.Array(numba.float32, 1, 'C', readonly = True, aligned = True), )  # data
+
+@functools.lru_cache(maxsize = 16)
+def _build_bb_specialized(period: int):
+    '''
+    Build Bollinger Bands kernel `(data) -> result_arr` for the fixed period.
+    '''
+    
+    PERIOD: int = period
+    
+    @numba.njit(_spec_func_specialized,
+                fastmath    = True,
+                nogil       = True,
+                boundscheck = False,
+                error_model = 'numpy', )
+    def _get_bb_specialized(data: np.ndarray[np.float32]) -> np.ndarray[np.float32]:
+        
+        result_arr = np.empty_like(data, dtype = np.float32)
+        
+        result_arr[:PERIOD] = np.float32(0.0)  # Default value for the first period.
+        
+        if PERIOD < len(data):
+            _bb_range(data, PERIOD, PERIOD, len(data), result_arr)
+        
+        return result_arr
+    
+    return _get_bb_specialized
+
+def get_bb_dispatch(
+                    data:   np.ndarray[np.float32], 
+                    period: int,
+                        ) -> np.ndarray[np.float32]:
+    '''
+    Get Bollinger Bands of the given array.
+    Same results as `get_bb()`, 
+    kernel is compiled for this exact period ( on the first call with the new period ), 
+    so `1 / period` and window offsets are constants.
+    
+    Parameters:
+    -----------
+    data:   (`np.ndarray[np.float32]`) : Input data array.
+    period: (`int`)                    : Period.
+    
+    Returns:
+    --------
+    (`np.ndarray[np.float32]`): Bollinger Bands result array.
+    '''
+    
+    return _build_bb_specialized(int(period))(data)
+
+# -----------------------------------------------------------------------------------
+#
+#               BOLLINGER BANDS (tsf) - Thread Safe Function
+#
+# -----------------------------------------------------------------------------------
+
+_signature_tsf = numba.void(
+                    numba.types.Array(numba.float32, 1, 'C', readonly = True,  aligned = True),     # data
+                    numba.int32,                                                                    # period                    
+                    numba.int32,                                                                    # data_size                                 
+                    numba.types.Array(numba.float32, 1, 'C', readonly = False, aligned = True), )   # result_arr
+
+@numba.njit(_signature_tsf,
+            cache        = True, 
+            fastmath     = True, 
+            nogil        = True,
+            boundscheck  = False, )
+def get_bb_tsf( 
+                data:       np.ndarray[np.float32], 
+                period:     np.int32,
+                data_size:  np.int32,
+                result_arr: np.ndarray[np.float32],                  
+                        ) -> None:
+    '''
+    Update `result_arr[]` with calulated Bollinger Bands values.
+    
+    Thread Safe Function.
+    
+    Parameters:
+    -----------
+    data:       (`np.ndarray[np.float32]`) : Input data array.
+    period:     (`np.int32`)               : Period.
+    data_size:  (`np.int32`)               : Size of data array.
+    result_arr: (`np.ndarray[np.float32]`) : Result Array.
+        Array updated with Bollinger Bands result values.    
+    '''
+    
+    if data_size < 0:
+        data_size = data.shape[0]
+    
+    result_arr[:period] = np.float32(0.0)  # Default value for the first period.
+    
+    _get_bb_kernel(data, period, 0, data_size, result_arr)
+    
+    return 
+
 # -----------------------------------------------------------------------------------
 #
 #               BOLLINGER BANDS
@@ -31,24 +299,12 @@ _spec_func_numba = numba.types.Array(numba.float32, 1, 'C')(
                                     numba.types.Array(numba.float32, 1, 'C', readonly = True, aligned = True), 
                                     numba.int32,   )
 
-_locals_func_numba = {
-                        'accum':        numba.float32,
-                        'accum_sq':     numba.float32, 
-                        'multiplier_1': numba.float32, 
-                        'bb_res':       numba.float32,                       
-                        'sma':          numba.float32, 
-                        'accum_var':    numba.float32, 
-                        'std':          numba.float32, 
-                            }
-
-
 @numba.njit(_spec_func_numba,
             cache        = True, 
             fastmath     = True, 
             nogil        = True,
             boundscheck  = False,
-            inline       = 'always',
-            locals       = _locals_func_numba, )
+            error_model  = 'numpy', )
 def get_bb(
             data:   np.ndarray[np.float32], 
             period: np.int32,
@@ -77,82 +333,52 @@ def get_bb(
     >>> period: int = 5    
     >>> bb_res: np.ndarray[float] = get_bb(data, period)
     >>> # bb_res[i] - in range (-3.0 .. 3.0)
+    
+    NOTE: Allocates result array on every call, 
+        to reuse a preallocated array ( e.g. parameter sweeps ) call `get_bb_tsf()`.
     '''
     
     result_arr = np.empty_like(data, dtype = np.float32)
     
-    # Calculate initial average.
-    accum:    np.float32 = 0.0
-    accum_sq: np.float32 = 0.0
-    
-    for i in range(period):
-        accum        += data[i]
-        accum_sq     += data[i] ** 2
-        result_arr[i] = 0.0     # Default value for the first period.
-        pass
-
-    multiplier_1: np.float32 = 1.0 / np.float32(period)    
-
-    for i in range(period, len(data)):
-        data_temp:     np.float32 = data[i]
-        data_temp_old: np.float32 = data[i - period]        
-        
-        accum      += data_temp - data_temp_old
-        accum_sq   += data_temp ** 2 - data_temp_old ** 2        
-        sma         = accum * multiplier_1
-        accum_var   = accum_sq * multiplier_1 - sma * sma
-        std         = np.sqrt(accum_var)        
-        diff: float = data_temp - sma        
-        bb_res      = 3.0
-        
-        if abs(diff) < std * 3.0:
-            bb_res = diff / std
-        elif diff < 0:
-            bb_res = -3.0
-        
-        result_arr[i] = bb_res
+    get_bb_tsf(data, period, data.shape[0], result_arr)
     
     return result_arr
 
 # -----------------------------------------------------------------------------------
 #
-#               BOLLINGER BANDS (tsf) - Thread Safe Function
+#       BOLLINGER BANDS (tsf) - Thread Safe Function, Parallel ( Multi-Core )
 #
 # -----------------------------------------------------------------------------------
 
-_signature_tsf = numba.void(
-                    numba.types.Array(numba.float32, 1, 'C', readonly = True,  aligned = True),     # data
-                    numba.int32,                                                                    # period                    
-                    numba.int32,                                                                    # data_size                                 
-                    numba.types.Array(numba.float32, 1, 'C', readonly = False, aligned = True), )   # result_arr
+_BB_TILE_SIZE: int = L2_TILE_SIZE     # Minimum values per tile ( at least `4 * period` ), rounded up to `_BB_SIMD_BLOCK` multiples.
 
-_locals_tsf = {
-        'accum':         numba.float32,
-        'accum_sq':      numba.float32,
-        'data_temp':     numba.float32,
-        'data_temp_old': numba.float32,
-        'sma':           numba.float32,
-        'accum_var':     numba.float32,
-        'std':           numba.float32,
-        'bb_res':        numba.float32,
-        'multiplier_1':  numba.float32, }
+_locals_tsf_parallel = {
+        'tile_size': numba.int32,
+        'n_tiles':   numba.int32,
+        'i_start':   numba.int32,
+        'i_end':     numba.int32, }
 
 @numba.njit(_signature_tsf,
             cache        = True, 
             fastmath     = True, 
             nogil        = True,
             boundscheck  = False,
-            locals       = _locals_tsf, )
-def get_bb_tsf( 
-                data:       np.ndarray[np.float32], 
-                period:     np.int32,
-                data_size:  np.int32,
-                result_arr: np.ndarray[np.float32],                  
-                        ) -> None:
+            parallel     = True,
+            locals       = _locals_tsf_parallel, )
+def get_bb_tsf_parallel( 
+                        data:       np.ndarray[np.float32], 
+                        period:     np.int32,
+                        data_size:  np.int32,
+                        result_arr: np.ndarray[np.float32],                  
+                                ) -> None:
     '''
     Update `result_arr[]` with calulated Bollinger Bands values.
+    Parallel version of `get_bb_tsf()`, runs on all cores.
     
-    Thread Safe Function.
+    Data is split into tiles of `max(_BB_TILE_SIZE, 4 * period)` values ( multiple of `_BB_SIMD_BLOCK` ), 
+    every tile seeds its own accumulators on the `period` values before it
+    and is calculated independently in `numba.prange()`.
+    Tiles start at block boundaries of `get_bb_tsf()`, so results are equal to it.
     
     Parameters:
     -----------
@@ -166,38 +392,210 @@ def get_bb_tsf(
     if data_size < 0:
         data_size = data.shape[0]
     
-    # Calculate initial average.
-    accum:    np.float32 = 0.0
-    accum_sq: np.float32 = 0.0
+    result_arr[:period] = np.float32(0.0)  # Default value for the first period.
+    
+    tile_size: np.int32 = max(_BB_TILE_SIZE, 4 * period)
+    tile_size           = (tile_size + _BB_SIMD_BLOCK - 1) // _BB_SIMD_BLOCK * _BB_SIMD_BLOCK
+    n_tiles:   np.int32 = (data_size + tile_size - 1) // tile_size
+    
+    for t in numba.prange(n_tiles):
+        i_start: np.int32 = t * tile_size
+        i_end:   np.int32 = min(i_start + tile_size, data_size)
+        _get_bb_kernel(data, period, i_start, i_end, result_arr)
+    
+    return 
+
+# -----------------------------------------------------------------------------------
+#
+#       BOLLINGER BANDS (tsf) - Thread Safe Function, bfloat16 Input
+#
+# -----------------------------------------------------------------------------------
+
+_BB_BF16_TILE: int = L2_BF16_TILE_SIZE
+
+_signature_tsf_bf16 = numba.void(
+                    numba.types.Array(numba.uint16,  1, 'C', readonly = True,  aligned = True),     # data_bf16
+                    numba.int32,                                                                    # period
+                    numba.int32,                                                                    # data_size
+                    numba.types.Array(numba.float32, 1, 'C', readonly = False, aligned = True), )   # result_arr
+
+_locals_tsf_bf16 = {
+        'tile_end':  numba.int32,
+        'src_start': numba.int32,
+        'src_size':  numba.int32, }
+
+@numba.njit(_signature_tsf_bf16,
+            cache        = True, 
+            fastmath     = True, 
+            nogil        = True,
+            boundscheck  = False,
+            locals       = _locals_tsf_bf16, )
+def get_bb_tsf_bf16( 
+                    data_bf16:  np.ndarray[np.uint16], 
+                    period:     np.int32,
+                    data_size:  np.int32,
+                    result_arr: np.ndarray[np.float32],                  
+                            ) -> None:
+    '''
+    Update `result_arr[]` with calulated Bollinger Bands values, 
+    for bfloat16 compressed input ( see `as_bf16()` ).
     
-    for i in range(period):
-        data_temp: np.float32 = data[i]
+    Half of the memory traffic of `get_bb_tsf()` for very long series ( larger than L3 cache ).
+    Data is decompressed to float32 in tiles of `_BB_BF16_TILE` values 
+    ( packed shift, vectorized ), calculation is float32.
+    Results are equal to `get_bb_tsf()` of the decompressed data, up to float32 rounding.
+    
+    Thread Safe Function.
+    
+    Parameters:
+    -----------
+    data_bf16:  (`np.ndarray[np.uint16]`)  : Input data array, bfloat16 ( high 16 bits of float32 ).
+    period:     (`np.int32`)               : Period.
+    data_size:  (`np.int32`)               : Size of data array.
+    result_arr: (`np.ndarray[np.float32]`) : Result Array.
+        Array updated with Bollinger Bands result values.    
+    '''
+    
+    if data_size < 0:
+        data_size = data_bf16.shape[0]
+    
+    result_arr[:period] = np.float32(0.0)  # Default value for the first period.
+    
+    # Tile with the `period` values before it ( window of the first value ).
+    buf_u32 = np.empty(_BB_BF16_TILE + period, dtype = np.uint32)
+    buf_f32 = buf_u32.view(np.float32)
+    
+    for tile_start in range(period, data_size, _BB_BF16_TILE):
+        tile_end:  np.int32 = min(tile_start + _BB_BF16_TILE, data_size)
+        src_start: np.int32 = tile_start - period
+        src_size:  np.int32 = tile_end - src_start
+        
+        for k in range(src_size):
+            buf_u32[k] = np.uint32(data_bf16[src_start + k]) << np.uint32(16)
         
-        accum        += data_temp
-        accum_sq     += data_temp ** 2
-        result_arr[i] = 0.0         # Default value for the first period.
-        pass
+        _bb_range(buf_f32, period, period, src_size, result_arr[src_start:tile_end])
+    
+    return 
 
-    multiplier_1: np.float32 = 1.0 / np.float32(period)    
+# -----------------------------------------------------------------------------------
+#
+#      BOLLINGER BANDS (full tsf) - Upper / Mid / Lower / Bandwidth / %B, one pass
+#
+# -----------------------------------------------------------------------------------
+
+_signature_full_tsf = numba.void(
+                    numba.types.Array(numba.float32, 1, 'C', readonly = True,  aligned = True),     # data
+                    numba.int32,                                                                    # period
+                    numba.int32,                                                                    # data_size
+                    numba.types.Array(numba.float32, 1, 'C', readonly = False, aligned = True),     # upper_arr
+                    numba.types.Array(numba.float32, 1, 'C', readonly = False, aligned = True),     # mid_arr
+                    numba.types.Array(numba.float32, 1, 'C', readonly = False, aligned = True),     # lower_arr
+                    numba.types.Array(numba.float32, 1, 'C', readonly = False, aligned = True),     # bandw_arr
+                    numba.types.Array(numba.float32, 1, 'C', readonly = False, aligned = True), )   # pctb_arr
 
-    for i in range(period, data_size):
-        data_temp:     np.float32 = data[i]
-        data_temp_old: np.float32 = data[i - period]
+_locals_full_tsf = {
+        'block_end':     numba.int32,
+        'mean':          numba.float64,
+        'mean_new':      numba.float64,
+        'm2':            numba.float64,
+        'data_temp':     numba.float64,
+        'data_temp_old': numba.float64,
+        'data_delta':    numba.float64,
+        'multiplier_1':  numba.float64,
+        'mean_f32':      numba.float32,
+        'accum_var':     numba.float32,
+        'std':           numba.float32,
+        'band':          numba.float32,
+        'inv_width':     numba.float32, }
+
+@numba.njit(_signature_full_tsf,
+            cache        = True, 
+            fastmath     = True, 
+            nogil        = True,
+            boundscheck  = False,
+            locals       = _locals_full_tsf, )
+def get_bb_full_tsf( 
+                    data:      np.ndarray[np.float32], 
+                    period:    np.int32,
+                    data_size: np.int32,
+                    upper_arr: np.ndarray[np.float32],
+                    mid_arr:   np.ndarray[np.float32],
+                    lower_arr: np.ndarray[np.float32],
+                    bandw_arr: np.ndarray[np.float32],
+                    pctb_arr:  np.ndarray[np.float32],
+                            ) -> None:
+    '''
+    Update all Bollinger Bands lines in a single pass over the data.
+    
+    ```python
+    Mid   = SMA
+    Upper = SMA + 2 * STD
+    Lower = SMA - 2 * STD
+    BandW = (Upper - Lower) / Mid
+    %B    = (Close - Lower) / (Upper - Lower)
+    ```
+    
+    Thread Safe Function.
+    Flat window ( STD == 0 ) gives `BandW = 0.0`, `%B = 0.5`.
+    
+    Parameters:
+    -----------
+    data:      (`np.ndarray[np.float32]`) : Input data array.
+    period:    (`np.int32`)               : Period.
+    data_size: (`np.int32`)               : Size of data array.
+    upper_arr: (`np.ndarray[np.float32]`) : Result Array, Upper Band.
+    mid_arr:   (`np.ndarray[np.float32]`) : Result Array, Middle Band ( SMA ).
+    lower_arr: (`np.ndarray[np.float32]`) : Result Array, Lower Band.
+    bandw_arr: (`np.ndarray[np.float32]`) : Result Array, Bandwidth.
+    pctb_arr:  (`np.ndarray[np.float32]`) : Result Array, %B.
+        All arrays updated, first `period` values are set to 0.0.
+    '''
+    
+    if data_size < 0:
+        data_size = data.shape[0]
+    
+    # Default value for the first period.
+    upper_arr[:period] = np.float32(0.0)
+    mid_arr[:period]   = np.float32(0.0)
+    lower_arr[:period] = np.float32(0.0)
+    bandw_arr[:period] = np.float32(0.0)
+    pctb_arr[:period]  = np.float32(0.0)
+    
+    if period >= data_size:
+        return
+    
+    multiplier_1 = 1.0 / np.float64(period)
+    
+    # Blocks aligned to `_BB_SIMD_BLOCK`, Mean / M2 seeded per block ( as in `_bb_range()` ).
+    block_start = period
+    
+    while block_start < data_size:
+        block_end = min((block_start // _BB_SIMD_BLOCK + 1) * _BB_SIMD_BLOCK, data_size)
         
-        accum      += data_temp - data_temp_old
-        accum_sq   += data_temp ** 2 - data_temp_old ** 2        
-        sma         = accum * multiplier_1
-        accum_var   = accum_sq * multiplier_1 - sma * sma
-        std         = accum_var ** 0.5        
-        diff: float = data_temp - sma        
-        bb_res      = 3.0
+        mean, m2 = _bb_window_seed(data, block_start - period, period)
         
-        if abs(diff) < std * 3.0:
-            bb_res = diff / std
-        elif diff < 0:
-            bb_res = -3.0
+        for i in range(block_start, block_end):
+            data_temp     = data[i]
+            data_temp_old = data[i - period]
+            
+            # Welford / Chan update - replace x_old with x in the window.
+            data_delta  = data_temp - data_temp_old
+            mean_new    = mean + data_delta * multiplier_1
+            m2         += data_delta * (data_temp - mean_new + data_temp_old - mean)
+            mean        = mean_new
+            mean_f32    = mean
+            accum_var   = max(m2, 0.0) * multiplier_1    # M2 can drift below 0.0 on flat data.
+            std         = math.sqrt(accum_var)
+            band        = np.float32(2.0) * std                          # SMA to Upper / Lower.
+            inv_width   = np.float32(0.25) / std if std > np.float32(0.0) else np.float32(0.0)   # 1 / (Upper - Lower)
+            
+            mid_arr[i]   = mean_f32
+            upper_arr[i] = mean_f32 + band
+            lower_arr[i] = mean_f32 - band
+            bandw_arr[i] = (band + band) / mean_f32 if mean_f32 != np.float32(0.0) else np.float32(0.0)
+            pctb_arr[i]  = np.float32(0.5) + np.float32(data_temp - mean) * inv_width
         
-        result_arr[i] = bb_res
+        block_start = block_end
     
     return 
 
@@ -214,13 +612,12 @@ _spec_func_vtsf = numba.types.float32(
                     numba.int32, )                                                             # data_indx
 
 _locals_vtsf = {
-        'accum':         numba.float32,
-        'accum_sq':      numba.float32,
-        'data_temp':     numba.float32,
-        'data_temp_old': numba.float32,
-        'sma':           numba.float32,
+        'data_dev':      numba.float64,     # Inlined `_bb_window_seed()`.
+        'm2':            numba.float64,
+        'sma':           numba.float64,
         'accum_var':     numba.float32,
-        'std':           numba.float32,
+        'diff':          numba.float32,
+        'inv_std':       numba.float32,
         'bb_res':        numba.float32,
         'multiplier_1':  numba.float32, }
 
@@ -228,7 +625,8 @@ _locals_vtsf = {
             cache       = True, 
             fastmath    = True, 
             nogil       = True,
-            boundscheck = False,            
+            boundscheck = False,
+            error_model = 'numpy',
             locals      = _locals_vtsf, )
 def get_bb_vtsf(
                 data:      np.ndarray[np.float32],
@@ -249,31 +647,104 @@ def get_bb_vtsf(
     (`np.float32`) : Bollinger Bands result value.
     '''
     
-    # Calculate initial average.
-    accum:     np.float32 = 0.0
-    accum_sq:  np.float32 = 0.0    
-    data_temp: np.float32 = 0.0
+    multiplier_1: np.float32 = 1.0 / np.float32(period)    
+    
+    # Calculate Mean and M2 ( sum of squared deviations ). Two pass, float64 - same as seeds of `get_bb()`.
+    sma, m2 = _bb_window_seed(data, data_indx + 1 - period, period)
+    
+    accum_var        = m2 * multiplier_1    
+    diff: np.float32 = data[data_indx] - sma   
+    
+    # Branchless clamp to [-3.0 .. 3.0], flat window ( std == 0.0 ) gives 0.0.
+    inv_std     = np.float32(1.0) / math.sqrt(accum_var) if accum_var > np.float32(0.0) else np.float32(0.0)
+    bb_res      = min(np.float32(3.0), max(np.float32(-3.0), diff * inv_std))
+    
+    return bb_res
+
+# -----------------------------------------------------------------------------------
+#
+#     BOLLINGER BANDS (vtsf batch) - Values for selected indexes, Parallel ( Multi-Core )
+#
+# -----------------------------------------------------------------------------------
+
+_signature_vtsf_batch = numba.void(
+                    numba.types.Array(numba.float32, 1, 'C', readonly = True,  aligned = True),     # data
+                    numba.int32,                                                                    # period
+                    numba.types.Array(numba.int32,   1, 'C', readonly = True,  aligned = True),     # data_indx_arr
+                    numba.types.Array(numba.float32, 1, 'C', readonly = False, aligned = True), )   # result_arr
+
+@numba.njit(_signature_vtsf_batch,
+            cache        = True, 
+            fastmath     = True, 
+            nogil        = True,
+            boundscheck  = False,
+            parallel     = True, )
+def get_bb_vtsf_batch(
+                        data:          np.ndarray[np.float32],
+                        period:        np.int32,
+                        data_indx_arr: np.ndarray[np.int32],
+                        result_arr:    np.ndarray[np.float32],
+                                ) -> None:
+    '''
+    Calculate Bollinger Bands for every index in `data_indx_arr[]`.
+    Same as `get_bb_vtsf()` in a loop, windows are calculated in parallel in `numba.prange()`.
+    
+    Parameters:
+    -----------
+    data:          (`np.ndarray[np.float32]`) : Input data array.
+    period:        (`np.int32`)               : Period.
+    data_indx_arr: (`np.ndarray[np.int32]`)   : Indexes to calculate.
+        Warning: **( data_indx >= period - 1 )**
+    result_arr:    (`np.ndarray[np.float32]`) : Result Array.
+        Array updated with Bollinger Bands values, `result_arr[k]` for `data_indx_arr[k]`.
+        Warning: **( len(result_arr) >= len(data_indx_arr) )**
+    '''
+    
+    for k in numba.prange(data_indx_arr.shape[0]):
+        result_arr[k] = get_bb_vtsf(data, period, data_indx_arr[k])
+    
+    return
+
+# -----------------------------------------------------------------------------------
+#
+#    BOLLINGER BANDS (GPU) - Device Function ( Private )
+#
+# -----------------------------------------------------------------------------------
+
+@cuda.jit(device = True)
+def _bb_value_cuda(
+                    data:      np.ndarray[np.float32],
+                    period:    np.int32,
+                    data_indx: np.int32,
+                        ) -> np.float32:
+    '''
+    Bollinger Bands value for the window ending at `data_indx`, serial ( one thread ).
+    '''
+    
+    multiplier_1: float = 1.0 / np.float32(period)    
+    
+    # Calculate Mean and M2 ( sum of squared deviations ). Two pass - no cancellation.
+    # `data[]` is read only - loads are cached at all levels ( `ld.global.ca` ), 
+    # the second pass and the overlapping windows of neighbour threads hit L1.
+    accum: float = 0.0
     
     for i in range(data_indx + 1 - period, data_indx + 1):
-        data_temp = data[i]
-        accum    += data_temp
-        accum_sq += data_temp ** 2
-        pass
+        accum += cuda.ldca(data, i)
     
-    multiplier_1: np.float32 = 1.0 / np.float32(period)    
+    sma: float = accum * multiplier_1
+    m2:  float = 0.0
     
-    sma         = accum * multiplier_1    
-    accum_var   = accum_sq * multiplier_1 - sma * sma
-    std         = accum_var ** 0.5    
-    diff: float = data_temp - sma        
-    bb_res      = 3.0
+    for i in range(data_indx + 1 - period, data_indx + 1):
+        data_dev = cuda.ldca(data, i) - sma
+        m2      += data_dev * data_dev
     
-    if abs(diff) < std * 3.0:
-        bb_res = diff / std
-    elif diff < 0:
-        bb_res = -3.0
+    accum_var = m2 * multiplier_1    
+    diff      = cuda.ldca(data, data_indx) - sma
     
-    return bb_res
+    # Branchless clamp to [-3.0 .. 3.0], flat window ( std == 0.0 ) gives 0.0.
+    inv_std   = 1.0 / math.sqrt(accum_var) if accum_var > 0.0 else 0.0
+    
+    return min(3.0, max(-3.0, diff * inv_std))
 
 # -----------------------------------------------------------------------------------
 #
@@ -305,31 +776,194 @@ def get_bb_vtsf_cuda(
         Array updated with Bollinger Bands result value.
     '''
     
-    # Calculate initial average.
-    accum:     float = 0.0
-    accum_sq:  float = 0.0    
-    data_temp: float = 0.0
+    res_arr[res_indx] = _bb_value_cuda(data, period, data_indx)
+
+    return
+
+# -----------------------------------------------------------------------------------
+#
+#    BOLLINGER BANDS (GPU) - Range of Indexes, Grid Stride Kernel
+#
+# -----------------------------------------------------------------------------------
+
+@cuda.jit
+def get_bb_range_cuda(
+                        data:      np.ndarray[np.float32],
+                        period:    np.int32,
+                        i_start:   np.int32,
+                        i_end:     np.int32,
+                        res_arr:   np.ndarray[np.float32],
+                            ) -> None:
+    '''
+    Get Bollinger Bands values for indexes `[i_start, i_end)`, by updating `res_arr[]`.
+    GPU Kernel, grid stride loop: any grid size covers the whole range with one launch.
+    
+    Launch:
+    -------
+    >>> blocks = (i_end - i_start + threads - 1) // threads
+    >>> get_bb_range_cuda[blocks, threads](d_data, period, i_start, i_end, d_res_arr)
     
-    for i in range(data_indx + 1 - period, data_indx + 1):
-        data_temp = data[i]
-        accum    += data_temp
-        accum_sq += data_temp ** 2
-        
-    multiplier_1: float = 1.0 / np.float32(period)    
+    Parameters:
+    -----------
+    data:    (`np.ndarray[np.float32]`) : Input data array ( device array ).
+    period:  (`np.int32`)               : Period.
+    i_start: (`np.int32`)               : First index.
+        Warning: **( i_start >= period - 1 )**
+    i_end:   (`np.int32`)               : End index ( exclusive ).
+    res_arr: (`np.ndarray[np.float32]`) : Result Array ( device array ).
+        Array updated with Bollinger Bands values, `res_arr[i]` for `data[i]`.
+    '''
+    
+    grid_indx:   int = cuda.grid(1)
+    grid_stride: int = cuda.gridsize(1)
+    
+    for i in range(i_start + grid_indx, i_end, grid_stride):
+        res_arr[i] = _bb_value_cuda(data, period, i)
     
-    sma       = accum * multiplier_1    
-    accum_var = accum_sq * multiplier_1 - sma * sma
-    std       = accum_var ** 0.5    
-    diff      = data_temp - sma
-    bb_res    = 3.0
+    return
 
-    if abs(diff) < std * 3.0:
-        bb_res = diff / std
-    elif diff < 0:
-        bb_res = -3.0
+def get_bb_cuda(
+                data:              np.ndarray[np.float32],
+                period:            int,
+                threads_per_block: int = 256,
+                    ) -> np.ndarray[np.float32]:
+    '''
+    Get Bollinger Bands of the given array, calculated on GPU.
+    Same layout as `get_bb()`, first `period` values are 0.0.
+    
+    Launches `get_bb_range_cuda()` once for the whole array.
+    
+    Parameters:
+    -----------
+    data:              (`np.ndarray[np.float32]`) : Input data array.
+        Host array, or CUDA device array.
+    period:            (`int`)                    : Period.
+    threads_per_block: (`int`)                    : CUDA block size.
+    
+    Returns:
+    --------
+    (`np.ndarray[np.float32]`) : Bollinger Bands result array.
+        If `data` is a device array, result is a device array too.
+    '''
+    
+    is_device: bool = hasattr(data, '__cuda_array_interface__')
+    d_data          = data if is_device else cuda.to_device(np.ascontiguousarray(data, dtype = np.float32))
+    data_size: int  = d_data.shape[0]
     
-    res_arr[res_indx] = bb_res
+    res_arr: np.ndarray[np.float32] = np.zeros(data_size, dtype = np.float32)   # Default value for the first period.
+    d_res_arr                       = cuda.to_device(res_arr)
+    
+    blocks: int = (data_size - period + threads_per_block - 1) // threads_per_block
+    
+    if blocks > 0:
+        get_bb_range_cuda[blocks, threads_per_block](d_data, period, period, data_size, d_res_arr)
+    
+    if is_device:
+        return d_res_arr
+    
+    return d_res_arr.copy_to_host()
 
+# -----------------------------------------------------------------------------------
+#
+#    BOLLINGER BANDS (GPU) - Single Values, Block Cooperative Reduction
+#        One block of `_CUDA_REDUCE_THREADS` threads per value.
+#
+# -----------------------------------------------------------------------------------
+
+_CUDA_REDUCE_THREADS: int = 32     # Threads per block ( one warp ), MUST be a power of 2.
+
+@cuda.jit(device = True)
+def _block_sum_cuda(
+                    partial_arr: np.ndarray[np.float32],
+                    tx:          np.int32,
+                        ) -> np.float32:
+    '''
+    Tree reduction of `partial_arr[]` in shared memory, in `log2(_CUDA_REDUCE_THREADS)` steps.
+    Called by ALL threads of the block, returns the sum to all of them.
+    '''
+    
+    cuda.syncthreads()
+    
+    stride: int = _CUDA_REDUCE_THREADS // 2
+    
+    while stride > 0:
+        if tx < stride:
+            partial_arr[tx] += partial_arr[tx + stride]
+        cuda.syncthreads()
+        stride //= 2
+    
+    total: float = partial_arr[0]
+    
+    cuda.syncthreads()   # `partial_arr[]` can be reused after return.
+    
+    return total
+
+@cuda.jit
+def get_bb_vtsf_cuda_block(
+                            data:          np.ndarray[np.float32],
+                            period:        np.int32,
+                            data_indx_arr: np.ndarray[np.int32],
+                            res_arr:       np.ndarray[np.float32],
+                                ) -> None:
+    '''
+    Get Bollinger Bands values for the given indexes, by updating `res_arr[]`.
+    GPU Version, threads of a block calculate one value together:
+    each thread sums every `_CUDA_REDUCE_THREADS`-th value of the window, 
+    partial sums are reduced in shared memory.
+    Results are equal to `get_bb_vtsf_cuda()` up to float32 summation order.
+    
+    Launch:
+    -------
+    >>> get_bb_vtsf_cuda_block[len(data_indx_arr), _CUDA_REDUCE_THREADS](data, period, data_indx_arr, res_arr)
+    
+    Parameters:
+    -----------
+    data:          (`np.ndarray[np.float32]`) : Input data array.
+    period:        (`np.int32`)               : Period.
+    data_indx_arr: (`np.ndarray[np.int32]`)   : Indexes to calculate, one per block.
+        Warning: **( data_indx >= period - 1 )**
+    res_arr:       (`np.ndarray[np.float32]`) : Result Array.
+        Array updated with Bollinger Bands values, `res_arr[k]` for `data_indx_arr[k]`.
+    '''
+    
+    partial_arr = cuda.shared.array(shape = _CUDA_REDUCE_THREADS, dtype = numba.float32)
+    
+    tx:         int = cuda.threadIdx.x
+    query_indx: int = cuda.blockIdx.x
+    
+    if query_indx >= data_indx_arr.shape[0]:
+        return      # Whole block returns, no thread is left in syncthreads().
+    
+    data_indx:    int   = data_indx_arr[query_indx]
+    window_start: int   = data_indx + 1 - period
+    multiplier_1: float = 1.0 / np.float32(period)
+    
+    # Calculate Mean and M2 ( sum of squared deviations ). Two pass - no cancellation.
+    accum: float = 0.0
+    
+    for i in range(window_start + tx, data_indx + 1, _CUDA_REDUCE_THREADS):
+        accum += cuda.ldca(data, i)     # Read only, cached at all levels ( L1 ).
+    
+    partial_arr[tx] = accum
+    sma: float      = _block_sum_cuda(partial_arr, tx) * multiplier_1
+    
+    m2: float = 0.0
+    
+    for i in range(window_start + tx, data_indx + 1, _CUDA_REDUCE_THREADS):
+        data_dev = cuda.ldca(data, i) - sma
+        m2      += data_dev * data_dev
+    
+    partial_arr[tx] = m2
+    m2              = _block_sum_cuda(partial_arr, tx)
+    
+    if tx == 0:
+        accum_var = m2 * multiplier_1
+        diff      = cuda.ldca(data, data_indx) - sma
+        
+        # Branchless clamp to [-3.0 .. 3.0], flat window ( std == 0.0 ) gives 0.0.
+        inv_std   = 1.0 / math.sqrt(accum_var) if accum_var > 0.0 else 0.0
+        res_arr[query_indx] = min(3.0, max(-3.0, diff * inv_std))
+    
     return
 
-# -----------------------------------------------------------------------------------
\ No newline at end of file
+# -----------------------------------------------------------------------------------
@@ -1,18 +1,44 @@
+from __future__ import annotations
+
 import numpy as np
 import numba
 from numba import cuda
+from numba.core import cgutils
+from numba.extending import intrinsic
+from llvmlite import ir
+
+from ._constants import L2_TILE_SIZE, L2_BF16_TILE_SIZE
 
 
 # -----------------------------------------------------------------------------------
 
 _name_:           str = 'Linear Regression - Deviation from expected value'
-__version__:      str = '0.0.1'
-__version_date__: str = '2024-09-16'
+__version__:      str = '0.0.2'
+__version_date__: str = '2026-10-15'
 VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}' 
 
 # --- VERSION HISTORY: --------------------------------------------------------------
 
 # v0.0.1 @ 2024-09-16 : Initial Release.
+# v0.0.2 @ 2026-10-15 : Rolling sum_y / sum_xy - O(N) instead of O(N * period).
+#                       Added get_lr_exp_dev_np() - pure NumPy version ( cumsum / convolve ).
+#                       Single window sums helper ( float32 weights, SIMD reduction ) for all CPU versions.
+#                       Rolling kernel of get_lr_exp_dev_mini_tsf() calculates any sub-range.
+#                       Added get_lr_exp_dev_mini_tsf_parallel() - multi-core version of get_lr_exp_dev_mini_tsf().
+#                       Rolling sums are re-seeded every `_LR_SEED_BLOCK` values ( L1 block, bounded float32 drift ).
+#                       Branchless Boundary Clipping ( min / max ) in all versions.
+#                       Loop invariants ( float32 period, 1 / divisor, 1 / period ) computed once, multiply instead of divide.
+#                       Added get_lr_exp_dev_batch_tsf() - many period_mix values in one call, multi-core.
+#                       Added get_lr_exp_dev_range_cuda() - GPU grid stride kernel, get_lr_exp_dev_cuda() - host function.
+#                       Constants ( sum_x, 1 / divisor, 1 / period ) computed in float64 by a single helper, then float32.
+#                       Added get_lr_exp_dev_mini_tsf_bf16() - bfloat16 compressed input ( half memory traffic ).
+#                       Two phase rolling kernel - scalar rolling sums, packed SIMD slope / division / clipping.
+#                       get_lr_exp_dev_np() - sum_xy as sliding dot product with weights ( np.correlate, BLAS sdot ).
+#                       get_lr_exp_dev() uses the rolling kernel of get_lr_exp_dev_mini_tsf() ( single implementation ).
+#                       Added get_lr_exp_dev_batch_symbols() - multi-asset, symbols on the fast axis ( SIMD lanes ).
+#                       No price ( price <= 0.0, e.g. missing bar ) gives 0.0 ( was clipped +-1.0 ), single value versions skip the sums.
+#                       Software prefetch ( llvm.prefetch ) of the values entering the window, `_LR_PREFETCH_DIST` ahead.
+#                       get_lr_exp_dev_batch_symbols(): float64 rolling sums ( no drift within `_LR_SEED_BLOCK` rows ).
 #
 
 # --- CALCULATION DESCRIPTION: -------------------------------------------------------
@@ -76,6 +102,225 @@ VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date_
 
 # divisor = - (n**2 * (n**2 - 1)) / 12
 
+# ROLLING SUMS ( window moves by one value, x_out leaves, x_in enters ):
+# sum_xy_new = sum_xy - sum_y + n * x_in     ( weights of the rest decrease by 1 )
+# sum_y_new  = sum_y - x_out + x_in
+#
+# sum_xy = sum(j * y[j], j = 1..n) = sum of n tail sums ( sum(y[j], j = k..n), k = 1..n ),
+#   moving the window drops the longest tail sum ( == sum_y ) and adds the new one ( n * x_in ).
+# Cost per value: 1 FMA + 3 adds for both sums, loop carried chain is 1 add per sum
+#   ( `n * x_in - sum_y` and `x_in - x_out` do NOT depend on the sum being updated ).
+
+# -----------------------------------------------------------------------------------
+#
+#   LR_EXP_DEV - WINDOW SUMS ( Private, shared by all CPU versions ):
+#
+# -----------------------------------------------------------------------------------
+
+# NOTE: Weights are float32 ( no int to float conversion inside FMA chain ), 
+#       with `fastmath` both sums are vectorized to packed FMAs with several accumulators.
+
+_signature_window_sums = numba.types.UniTuple(numba.float32, 2)(
+                            numba.types.Array(numba.float32, 1, 'C', readonly = True, aligned = True),  # data_arr
+                            numba.int32,                                                                # start_indx
+                            numba.int32, )                                                              # period
+
+_locals_window_sums = {
+        'sum_y':          numba.float32,
+        'sum_xy':         numba.float32,
+        'data_temp_shft': numba.float32, }
+
+@numba.njit(_signature_window_sums,
+            cache       = True, 
+            fastmath    = True, 
+            nogil       = True,
+            boundscheck = False,
+            inline      = 'always',
+            locals      = _locals_window_sums, )
+def _lr_window_sums(
+                    data_arr:   np.ndarray[np.float32],
+                    start_indx: np.int32,
+                    period:     np.int32,
+                        ) -> tuple[np.float32, np.float32]:
+    '''
+    Sums of window `data_arr[start_indx : start_indx + period]`.
+    
+    Returns:
+    --------
+    (`tuple[np.float32, np.float32]`) : ( sum_y, sum_xy ), `x` of the first value is 1.
+    '''
+    
+    sum_y  = 0.0
+    sum_xy = 0.0
+    
+    for j in range(period):
+        data_temp_shft = data_arr[start_indx + j]
+        sum_y         += data_temp_shft
+        sum_xy        += np.float32(j + 1) * data_temp_shft
+    
+    return sum_y, sum_xy
+
+# -----------------------------------------------------------------------------------
+#
+#   LR_EXP_DEV - CONSTANTS OF PERIOD ( Private, shared by all CPU versions ):
+#
+# -----------------------------------------------------------------------------------
+
+_signature_constants = numba.types.UniTuple(numba.float32, 3)(numba.int32, )   # period
+
+@numba.njit(_signature_constants,
+            cache       = True, 
+            nogil       = True,
+            inline      = 'always', )
+def _lr_constants(period: np.int32) -> tuple[np.float32, np.float32, np.float32]:
+    '''
+    Constants of Linear Regression for the period, 
+    calculated in float64 ( exact for any period < 1000 ) and rounded to float32 once.
+    
+    Returns:
+    --------
+    (`tuple[np.float32, np.float32, np.float32]`) : ( sum_x, inv_divisor, inv_period ).
+        `divisor` sign is changed to positive, for slope follow the trend.
+    '''
+    
+    period_f64: float = np.float64(period)
+    sum_x:      float = period_f64 * (period_f64 + 1.0) / 2.0
+    divisor:    float = period_f64 * period_f64 * (period_f64 - 1.0) * (period_f64 - 1.0) / 12.0
+    
+    return np.float32(sum_x), np.float32(1.0 / divisor), np.float32(1.0 / period_f64)
+
+# -----------------------------------------------------------------------------------
+#
+#   LR_EXP_DEV - Rolling Kernel ( Private, shared by all full array versions ):
+#
+# -----------------------------------------------------------------------------------
+
+_LR_SEED_BLOCK:    int = 4096     # Values per block of rolling sums, ( float32 ) 16 KB - fits L1 cache.
+_LR_PREFETCH_DIST: int = 64       # Values ahead of the window to prefetch, ( float32 ) 256 bytes - 4 cache lines.
+_LR_LINE_MASK:     int = 15       # Prefetch once per cache line, ( float32 ) 16 values - 64 bytes.
+
+@intrinsic
+def _prefetch(typingctx, arr, indx):
+    '''
+    Software prefetch of the cache line of `arr[indx]` ( read, high locality, data cache ).
+    
+    Emits `llvm.prefetch` ( `prefetcht0` on x86 ), a hint only - never faults, no result.
+    '''
+    
+    sig = numba.types.void(arr, indx)
+    
+    def codegen(context, builder, signature, args):
+        arr_type, _ = signature.args
+        arr_struct  = context.make_array(arr_type)(context, builder, args[0])
+        item_ptr    = cgutils.get_item_pointer(context, builder, arr_type, arr_struct, [args[1]], wraparound = False)
+        
+        i8_ptr = ir.IntType(8).as_pointer()
+        i32    = ir.IntType(32)
+        fnty   = ir.FunctionType(ir.VoidType(), [i8_ptr, i32, i32, i32])
+        fn     = cgutils.get_or_insert_function(builder.module, fnty, 'llvm.prefetch.p0i8')
+        
+        builder.call(fn, [builder.bitcast(item_ptr, i8_ptr), i32(0), i32(3), i32(1)])
+        return context.get_dummy_value()
+    
+    return sig, codegen
+
+_locals_range = {
+                'block_end':        numba.int32,
+                'period_f':         numba.float32,
+                'period_calc_f':    numba.float32,
+                'inv_divisor':      numba.float32,
+                'inv_period':       numba.float32,
+                'sum_x':            numba.float32,
+                'sum_y':            numba.float32,
+                'sum_xy':           numba.float32,
+                'i_shifted':        numba.int32,
+                'i_prefetch':       numba.int32,
+                'i_last':           numba.int32,
+                'slope':            numba.float32,
+                'intercept':        numba.float32,
+                'res_deviation':    numba.float32,
+                'data_temp':        numba.float32,
+                'data_temp_shft':   numba.float32, }
+
+@numba.njit(fastmath    = True, 
+            nogil       = True,
+            boundscheck = False,
+            inline      = 'always',
+            locals      = _locals_range, )
+def _lr_exp_dev_range(
+                        data_arr:    np.ndarray[np.float32], 
+                        period:      np.int32,
+                        period_calc: np.int32,
+                        i_first:     np.int32,
+                        i_end:       np.int32,
+                        result_arr:  np.ndarray[np.float32],
+                            ) -> None:
+    '''
+    Rolling Linear Regression deviation for indexes `[i_first, i_end)`, `i_first >= period_calc`.
+    
+    Indexes are processed in blocks aligned to `_LR_SEED_BLOCK`, 
+    every block seeds its sums on the window before its first index, 
+    so any sub-range can be calculated independently ( see `get_lr_exp_dev_mini_tsf_parallel()` ), 
+    with the same results, and float32 rounding of rolling sums does NOT accumulate across blocks.
+    '''
+    
+    # Loop invariants, float32 ( int32 * float32 would widen to float64 ).
+    sum_x, inv_divisor, inv_period = _lr_constants(period)
+    period_f:      np.float32 = period
+    period_calc_f: np.float32 = period_calc
+    
+    # Two phases per block: 
+    #   1. Rolling sums - loop carried, scalar, only adds and FMAs.
+    #   2. Slope / expected price / division / clipping - independent per value, 
+    #      in scratch arrays ( no aliasing ), so it is vectorized to packed SIMD ( divps, minps / maxps ).
+    # NOTE: `result_arr[]` stores are regular ( cached ) stores, Numba can NOT emit 
+    #       non-temporal ( streaming ) stores. Block of results ( 16 KB ) plus scratch ( 2 x 16 KB ) 
+    #       and the read window stay within L1 / L2, written lines leave the cache once per block.
+    sum_y_buf  = np.empty(_LR_SEED_BLOCK, dtype = np.float32)
+    sum_xy_buf = np.empty(_LR_SEED_BLOCK, dtype = np.float32)
+    
+    i_last: np.int32 = data_arr.shape[0] - 1
+    
+    block_start = i_first
+    
+    while block_start < i_end:
+        block_end: np.int32 = min((block_start // _LR_SEED_BLOCK + 1) * _LR_SEED_BLOCK, i_end)
+        
+        # Sums of the window before the first index, then rolled by one value per index.
+        sum_y, sum_xy = _lr_window_sums(data_arr, block_start - period_calc, period)
+        
+        for i in range(block_start, block_end):
+            
+            i_shifted: np.int32 = i - period_calc     # Index of the value leaving the window.
+            
+            # Values entering the window are the only cold stream ( values leaving it were read `period` ago ), 
+            # a thread of `get_lr_exp_dev_mini_tsf_parallel()` starts its tile cold, before the hardware prefetcher.
+            if (i & _LR_LINE_MASK) == 0:
+                i_prefetch: np.int32 = min(i_shifted + period + _LR_PREFETCH_DIST, i_last)
+                _prefetch(data_arr, i_prefetch)
+            
+            data_temp_shft = data_arr[i_shifted + period]
+            sum_xy        += period_f * data_temp_shft - sum_y
+            sum_y         += data_temp_shft - data_arr[i_shifted]
+            
+            sum_y_buf[i - block_start]  = sum_y
+            sum_xy_buf[i - block_start] = sum_xy
+        
+        for k in range(block_end - block_start):
+            slope         = (period_f * sum_xy_buf[k] - sum_x * sum_y_buf[k]) * inv_divisor
+            intercept     = (sum_y_buf[k] - slope * sum_x) * inv_period
+            res_deviation = slope * period_calc_f + intercept  # Expected price.
+            
+            # NOTE: deviation = (expected_price - price) / price = expected_price / price - 1.0 = Ln(expected_price / price)
+            data_temp     = data_arr[block_start + k]
+            res_deviation = np.float32(1.0) - res_deviation / data_temp
+            res_deviation = max(np.float32(-1.0), min(np.float32(1.0), res_deviation))  # Boundary Clipping.
+            result_arr[block_start + k] = res_deviation if data_temp > np.float32(0.0) else np.float32(0.0)  # No price.
+        
+        block_start = block_end
+    
+    return
+
 # -----------------------------------------------------------------------------------
 #
 #   LR_EXP_DEV - Linear Regression - Deviation from expected value
@@ -87,15 +332,7 @@ _spec_func_numba = numba.types.Array(numba.float32, 1, 'C')(
                                     numba.int32, )
 
 _locals_func_numba = {
-                        'period_calc':   numba.int32,                        
-                        'divisor':       numba.float32,
-                        'sum_x':         numba.float32,
-                        'sum_y':         numba.float32,
-                        'sum_xy':        numba.float32,
-                        'i_shifted':     numba.int32,
-                        'slope':         numba.float32,
-                        'intercept':     numba.float32,
-                        'res_deviation': numba.float32,
+                        'period_calc':   numba.int32,
                             }
 
 
@@ -159,36 +396,84 @@ def get_lr_exp_dev(
     
     result_arr:  np.ndarray[np.float32] = np.empty_like(data_arr, dtype = np.float32)    
     
-    period_calc: np.int32   = period + expected_period    
-    divisor:     np.float32 = (period**2 * (period - 1.0)**2) / 12.0  # NOTE: Change the sign to positive, for slope follow the trend.
-    sum_x:       np.float32 = (period * (period + 1.0)) / 2.0
+    period_calc: np.int32 = period + expected_period    
     
     result_arr[:period_calc] = 0.0 # Default value for the first period.
     
-    for i in range(period_calc, len(data_arr)):
-        
-        sum_xy = 0.0
-        sum_y  = 0.0        
-        i_shifted: np.int32 = i - period_calc + 1
-        
-        for j in range(period):            
-            sum_y  += data_arr[i_shifted + j]
-            sum_xy += (j + 1) * data_arr[i_shifted + j]
-            pass        
-
-        slope         = (period * sum_xy - sum_x * sum_y) / divisor
-        intercept     = (sum_y - slope * sum_x) / float(period)
-        res_deviation = slope * period_calc + intercept  # Expected price.
-        
-        # NOTE: deviation = (expected_price - price) / price = expected_price / price - 1.0 = Ln(expected_price / price)
-        res_deviation = 1.0 - res_deviation / data_arr[i]        
-        result_arr[i] = res_deviation
-        
-        # Boundary Clipping:
-        if res_deviation > 1.0:
-            result_arr[i] = 1.0
-        elif res_deviation < -1.0:
-            result_arr[i] = -1.0
+    if period_calc < len(data_arr):
+        _lr_exp_dev_range(data_arr, period, period_calc, period_calc, len(data_arr), result_arr)
+    
+    return result_arr
+
+# -----------------------------------------------------------------------------------
+#
+#   LR_EXP_DEV - Pure NumPy version ( No Numba )
+#
+# -----------------------------------------------------------------------------------
+
+def get_lr_exp_dev_np(
+                        data_arr:        np.ndarray[np.float32],
+                        period:          int,
+                        expected_period: int,
+                            ) -> np.ndarray[np.float32]:
+    '''
+    Calculate Linear Regression - Deviation from expected value.
+    Same results as `get_lr_exp_dev()` up to float32 rounding, 
+    window sums for all indexes are calculated at once with NumPy array operations:
+    
+    ```python
+    sum_y  = cumsum(data)[p - 1:] - cumsum(data)[:-p]       # ( with leading 0.0 )
+    sum_xy = correlate(data, [1, 2, ..., p], 'valid')       # sliding dot( weights, window )
+    ```
+    
+        Prefix sums are float64, float32 prefix sums lose precision on long series.
+    
+    Parameters:
+    -----------
+    data_arr:        (`np.ndarray[np.float32]`) : Input data array.
+    period:          (`int`)                    : Period of Linear Regression.
+        **( period >= 2 )**
+    expected_period: (`int`)                    : Period of expected value ( see `get_lr_exp_dev()` ).
+    
+    Returns:
+    --------
+    (`np.ndarray[np.float32]`) : Deviation from expected value.
+    '''
+    
+    data_arr    = np.ascontiguousarray(data_arr, dtype = np.float32)
+    period      = int(period)
+    period_calc = period + int(expected_period)
+    data_size   = data_arr.shape[0]
+    
+    result_arr: np.ndarray[np.float32] = np.zeros(data_size, dtype = np.float32)  # Default value for the first period.
+    
+    if period_calc >= data_size:
+        return result_arr
+    
+    divisor: np.float32 = np.float32((period**2 * (period - 1.0)**2) / 12.0)  # NOTE: Change the sign to positive, for slope follow the trend.
+    sum_x:   np.float32 = np.float32((period * (period + 1.0)) / 2.0)
+    
+    # Window sums for every window start, window of index `i` starts at `i - period_calc + 1`.
+    accum_arr  = np.concatenate((np.zeros(1), np.cumsum(data_arr, dtype = np.float64)))
+    sum_y_arr  = (accum_arr[period:] - accum_arr[:-period]).astype(np.float32)
+    j_weights  = np.arange(1, period + 1, dtype = np.float32)
+    sum_xy_arr = np.correlate(data_arr, j_weights, mode = 'valid')     # float32 dot product per window ( BLAS sdot ).
+    
+    sum_y  = sum_y_arr[1:data_size - period_calc + 1]
+    sum_xy = sum_xy_arr[1:data_size - period_calc + 1]
+    
+    slope     = (np.float32(period) * sum_xy - sum_x * sum_y) / divisor
+    intercept = (sum_y - slope * sum_x) / np.float32(period)
+    
+    # NOTE: deviation = (expected_price - price) / price = expected_price / price - 1.0 = Ln(expected_price / price)
+    price_arr = data_arr[period_calc:]
+    
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        res_deviation = np.float32(1.0) - (slope * np.float32(period_calc) + intercept) / price_arr
+    
+    np.clip(res_deviation, -1.0, 1.0, out = res_deviation)  # Boundary Clipping.
+    
+    result_arr[period_calc:] = np.where(price_arr > 0.0, res_deviation, np.float32(0.0))  # No price ( 0.0, NaN ) gives 0.0.
     
     return result_arr
 
@@ -285,17 +570,7 @@ _signature_tsf = numba.void(
 _locals_tsf = {
                 'period':           numba.int32,
                 'expected_period':  numba.int32,
-                'period_calc':      numba.int32,
-                'divisor':          numba.float32,
-                'sum_x':            numba.float32,
-                'sum_y':            numba.float32,
-                'sum_xy':           numba.float32,
-                'i_shifted':        numba.int32,
-                'slope':            numba.float32,
-                'intercept':        numba.float32,
-                'res_deviation':    numba.float32,
-                'data_temp':        numba.float32,
-                'data_temp_shft':   numba.float32, }
+                'period_calc':      numba.int32, }
     
 @numba.njit(_signature_tsf,
             cache       = True, 
@@ -335,35 +610,378 @@ def get_lr_exp_dev_mini_tsf(
     expected_period: np.int32 = period_mix // 1000    
     period_calc:     np.int32 = period + expected_period
     
-    divisor: np.float32 = (period**2 * (period - 1.0)**2) / 12.0  # NOTE: Change the sign to positive, for slope follow the trend.
-    sum_x:   np.float32 = (period * (period + 1.0)) / 2.0
-    
     for i in range(period_calc):
         result_arr[i] = 0.0 # Default value for the first period.
     
+    if period_calc >= data_size:
+        return
+    
+    _lr_exp_dev_range(data_arr, period, period_calc, period_calc, data_size, result_arr)
+    
+    return
+
+# -----------------------------------------------------------------------------------
+#
+#  LR_EXP_DEV - MINI, (tsf) - Thread Safe Function, Parallel ( Multi-Core )
+#
+# -----------------------------------------------------------------------------------
+
+_LR_TILE_SIZE: int = L2_TILE_SIZE     # Multiple of `_LR_SEED_BLOCK`.
+
+_locals_tsf_parallel = {
+                'period':           numba.int32,
+                'expected_period':  numba.int32,
+                'period_calc':      numba.int32,
+                'n_tiles':          numba.int32,
+                'i_start':          numba.int32,
+                'i_end':            numba.int32, }
+
+@numba.njit(_signature_tsf,
+            cache       = True, 
+            fastmath    = True, 
+            nogil       = True,
+            boundscheck = False,
+            parallel    = True,
+            locals      = _locals_tsf_parallel, )
+def get_lr_exp_dev_mini_tsf_parallel(
+                                    data_arr:   np.ndarray[np.float32], 
+                                    period_mix: np.int32,
+                                    data_size:  np.int32,
+                                    result_arr: np.ndarray[np.float32],                  
+                                            ) -> None:
+    '''
+    Calculate Linear Regression - Deviation from expected value.
+    Parallel version of `get_lr_exp_dev_mini_tsf()`, runs on all cores.
+    
+    Data is split into tiles of `_LR_TILE_SIZE` values, 
+    every tile seeds its own sums on the window before it
+    and is calculated independently in `numba.prange()`.
+    Tiles are multiples of `_LR_SEED_BLOCK`, so results are equal to `get_lr_exp_dev_mini_tsf()`.
+    
+    Parameters:
+    -----------
+    data_arr:   (`np.ndarray[np.float32]`) : Input data array.
+    period_mix: (`np.int32`)               : combined code of period and expected_period.
+        ( see `get_lr_exp_dev_mini_tsf()` )
+    data_size:  (`np.int32`)               : Data size.
+    result_arr: (`np.ndarray[np.float32]`) : Result array.
+        Result array will be filled with the computed array.    
+    '''
+    
+    if data_size < 0:
+        data_size = data_arr.shape[0]
+    
+    period:          np.int32 = period_mix % 1000
+    expected_period: np.int32 = period_mix // 1000    
+    period_calc:     np.int32 = period + expected_period
+    
+    result_arr[:period_calc] = 0.0 # Default value for the first period.
+    
+    n_tiles: np.int32 = (data_size + _LR_TILE_SIZE - 1) // _LR_TILE_SIZE
+    
+    for t in numba.prange(n_tiles):
+        i_start: np.int32 = max(t * _LR_TILE_SIZE, period_calc)
+        i_end:   np.int32 = min((t + 1) * _LR_TILE_SIZE, data_size)
+        
+        if i_start < i_end:
+            _lr_exp_dev_range(data_arr, period, period_calc, i_start, i_end, result_arr)
+    
+    return
+
+# -----------------------------------------------------------------------------------
+#
+#  LR_EXP_DEV - MINI, (tsf) - Thread Safe Function, bfloat16 Input
+#
+# -----------------------------------------------------------------------------------
+
+_LR_BF16_TILE: int = L2_BF16_TILE_SIZE     # Multiple of `_LR_SEED_BLOCK`.
+
+_signature_tsf_bf16 = numba.void(
+                    numba.types.Array(numba.uint16,  1, 'C', readonly = True,  aligned = True),     # data_bf16
+                    numba.int32,                                                                    # period_mix
+                    numba.int32,                                                                    # data_size
+                    numba.types.Array(numba.float32, 1, 'C', readonly = False, aligned = True), )   # result_arr
+
+_locals_tsf_bf16 = {
+                'period':           numba.int32,
+                'expected_period':  numba.int32,
+                'period_calc':      numba.int32,
+                'tile_end':         numba.int32,
+                'src_start':        numba.int32,
+                'src_size':         numba.int32, }
+
+@numba.njit(_signature_tsf_bf16,
+            cache       = True, 
+            fastmath    = True, 
+            nogil       = True,
+            boundscheck = False,
+            locals      = _locals_tsf_bf16, )
+def get_lr_exp_dev_mini_tsf_bf16(
+                                data_bf16:  np.ndarray[np.uint16], 
+                                period_mix: np.int32,
+                                data_size:  np.int32,
+                                result_arr: np.ndarray[np.float32],                  
+                                        ) -> None:
+    '''
+    Calculate Linear Regression - Deviation from expected value, 
+    for bfloat16 compressed input ( see `as_bf16()` ).
+    
+    Half of the memory traffic of `get_lr_exp_dev_mini_tsf()` for very long series ( larger than L3 cache ).
+    Data is decompressed to float32 in tiles of `_LR_BF16_TILE` values 
+    ( packed shift, vectorized ), sums and result are float32.
+    Results are equal to `get_lr_exp_dev_mini_tsf()` of the decompressed data, up to float32 rounding.
+    
+    NOTE: bfloat16 keeps ~3 significant digits ( relative step 2^-8 ), 
+        so deviations smaller than ~0.005 are mostly rounding of the input.
+    
+    Thread Safe Function.
+    
+    Parameters:
+    -----------
+    data_bf16:  (`np.ndarray[np.uint16]`)  : Input data array, bfloat16 ( high 16 bits of float32 ).
+    period_mix: (`np.int32`)               : combined code of period and expected_period.
+        ( see `get_lr_exp_dev_mini_tsf()` )
+    data_size:  (`np.int32`)               : Data size.
+    result_arr: (`np.ndarray[np.float32]`) : Result array.
+        Result array will be filled with the computed array.    
+    '''
+    
+    if data_size < 0:
+        data_size = data_bf16.shape[0]
+    
+    period:          np.int32 = period_mix % 1000
+    expected_period: np.int32 = period_mix // 1000    
+    period_calc:     np.int32 = period + expected_period
+    
+    result_arr[:period_calc] = 0.0 # Default value for the first period.
+    
+    # Tile with the `period_calc` values before it ( window of the first value ).
+    buf_u32 = np.empty(_LR_BF16_TILE + period_calc, dtype = np.uint32)
+    buf_f32 = buf_u32.view(np.float32)
     
-    for i in range(period_calc, data_size):
+    for tile_start in range(period_calc, data_size, _LR_BF16_TILE):
+        tile_end:  np.int32 = min(tile_start + _LR_BF16_TILE, data_size)
+        src_start: np.int32 = tile_start - period_calc
+        src_size:  np.int32 = tile_end - src_start
         
-        sum_xy = 0.0
-        sum_y  = 0.0        
-        i_shifted: np.int32 = i - period_calc + 1
+        for k in range(src_size):
+            buf_u32[k] = np.uint32(data_bf16[src_start + k]) << np.uint32(16)
         
-        for j in range(period):          
-            data_temp_shft = data_arr[i_shifted + j]  
-            sum_y         += data_temp_shft
-            sum_xy        += (j + 1) * data_temp_shft
+        _lr_exp_dev_range(buf_f32, period, period_calc, period_calc, src_size, result_arr[src_start:tile_end])
+    
+    return
+
+# -----------------------------------------------------------------------------------
+#
+#  LR_EXP_DEV - MINI, (batch tsf) - Many period_mix values, Parallel ( Multi-Core )
+#
+# -----------------------------------------------------------------------------------
+
+_LR_BATCH_TILE: int = 4 * _LR_SEED_BLOCK     # Values per tile, ( float32 ) 64 KB - shared by all period_mix values in L2 cache.
+
+_signature_batch_tsf = numba.void(
+                    numba.types.Array(numba.float32, 1, 'C', readonly = True,  aligned = True),     # data_arr
+                    numba.types.Array(numba.int32,   1, 'C', readonly = True,  aligned = True),     # period_mix_arr
+                    numba.int32,                                                                    # data_size
+                    numba.types.Array(numba.float32, 2, 'C', readonly = False, aligned = True), )   # result_mat
+
+_locals_batch_tsf = {
+                'n_params':         numba.intp,
+                'n_tiles':          numba.int32,
+                'tile':             numba.int32,
+                'k':                numba.int32,
+                'period':           numba.int32,
+                'expected_period':  numba.int32,
+                'period_calc':      numba.int32,
+                'i_start':          numba.int32,
+                'i_end':            numba.int32, }
+
+@numba.njit(_signature_batch_tsf,
+            cache       = True, 
+            fastmath    = True, 
+            nogil       = True,
+            boundscheck = False,
+            parallel    = True,
+            locals      = _locals_batch_tsf, )
+def get_lr_exp_dev_batch_tsf(
+                            data_arr:       np.ndarray[np.float32], 
+                            period_mix_arr: np.ndarray[np.int32],
+                            data_size:      np.int32,
+                            result_mat:     np.ndarray[np.float32],
+                                    ) -> None:
+    '''
+    Calculate Linear Regression - Deviation from expected value, 
+    for every `period_mix` in `period_mix_arr[]` ( e.g. parameter sweeps ).
+    Row `result_mat[k]` is equal to `get_lr_exp_dev_mini_tsf()` with `period_mix_arr[k]`.
+    
+    Jobs ( data tile, period_mix ) are calculated in parallel in `numba.prange()`, 
+    tile major, so all period_mix values of a tile run together 
+    and the tile is read from DRAM once, instead of once per period_mix.
+    
+    Parameters:
+    -----------
+    data_arr:       (`np.ndarray[np.float32]`) : Input data array.
+    period_mix_arr: (`np.ndarray[np.int32]`)   : Combined codes of period and expected_period.
+        ( see `get_lr_exp_dev_mini_tsf()` )
+    data_size:      (`np.int32`)               : Data size.
+    result_mat:     (`np.ndarray[np.float32]`) : 2D Result array, shape ( len(period_mix_arr), data_size ).
+        Row-major ( C ), one row per period_mix.
+    '''
+    
+    if data_size < 0:
+        data_size = data_arr.shape[0]
+    
+    n_params: np.int32 = period_mix_arr.shape[0]
+    n_tiles:  np.int32 = (data_size + _LR_BATCH_TILE - 1) // _LR_BATCH_TILE
+    
+    for job in numba.prange(n_tiles * n_params):
+        tile: np.int32 = job // n_params
+        k:    np.int32 = job % n_params
+        
+        period:          np.int32 = period_mix_arr[k] % 1000
+        expected_period: np.int32 = period_mix_arr[k] // 1000
+        period_calc:     np.int32 = period + expected_period
+        
+        if tile == 0:
+            result_mat[k, :period_calc] = 0.0 # Default value for the first period.
+        
+        i_start: np.int32 = max(tile * _LR_BATCH_TILE, period_calc)
+        i_end:   np.int32 = min((tile + 1) * _LR_BATCH_TILE, data_size)
         
+        if i_start < i_end:
+            _lr_exp_dev_range(data_arr, period, period_calc, i_start, i_end, result_mat[k])
+    
+    return
 
-        slope         = (period * sum_xy - sum_x * sum_y) / divisor
-        intercept     = (sum_y - slope * sum_x) / float(period)
-        res_deviation = slope * period_calc + intercept  # Expected price.
+# -----------------------------------------------------------------------------------
+#
+#  LR_EXP_DEV - MINI, (batch symbols) - Multi-Asset, Symbols on the fast axis, Parallel ( Multi-Core )
+#
+# -----------------------------------------------------------------------------------
+
+_LR_SYMBOL_CHUNK: int = 64     # Symbols per job, ( float32 ) 256 bytes per row - 4 cache lines, 8 AVX2 vectors.
+
+_signature_batch_symbols = numba.void(
+                    numba.types.Array(numba.float32, 2, 'C', readonly = True,  aligned = True),     # data_mat
+                    numba.int32,                                                                    # period_mix
+                    numba.types.Array(numba.float32, 2, 'C', readonly = False, aligned = True), )   # result_mat
+
+_locals_batch_symbols = {
+                'period':           numba.int32,
+                'expected_period':  numba.int32,
+                'period_calc':      numba.int32,
+                'n_bars':           numba.intp,
+                'n_symbols':        numba.intp,
+                'n_chunks':         numba.int32,
+                's_start':          numba.int32,
+                's_end':            numba.int32,
+                'block_end':        numba.int32,
+                'i_shifted':        numba.int32,
+                'period_f':         numba.float32,
+                'period_calc_f':    numba.float32,
+                'inv_divisor':      numba.float32,
+                'inv_period':       numba.float32,
+                'sum_x':            numba.float32,
+                'weight':           numba.float32,
+                'slope':            numba.float32,
+                'intercept':        numba.float32,
+                'res_deviation':    numba.float32,
+                'data_temp_shft':   numba.float32, }
+
+@numba.njit(_signature_batch_symbols,
+            cache       = True, 
+            fastmath    = True, 
+            nogil       = True,
+            boundscheck = False,
+            parallel    = True,
+            locals      = _locals_batch_symbols, )
+def get_lr_exp_dev_batch_symbols(
+                                data_mat:   np.ndarray[np.float32], 
+                                period_mix: np.int32,
+                                result_mat: np.ndarray[np.float32],
+                                        ) -> None:
+    '''
+    Calculate Linear Regression - Deviation from expected value, for many symbols in one call.
+    Column `result_mat[:, s]` is equal to `get_lr_exp_dev_mini_tsf()` of `data_mat[:, s]`, 
+    up to float32 rounding ( rolling sums of every symbol are float64 ).
+    
+    Symbols are on the fast axis, so the per symbol work at index `i` ( rolling sums, 
+    slope, division, clipping ) is one contiguous row, vectorized across symbols ( SIMD lanes ).
+    Chunks of `_LR_SYMBOL_CHUNK` symbols are calculated in parallel in `numba.prange()`, 
+    rolling sums are re-seeded every `_LR_SEED_BLOCK` rows, as in `get_lr_exp_dev_mini_tsf()`.
+    
+    Parameters:
+    -----------
+    data_mat:   (`np.ndarray[np.float32]`) : 2D array of values, shape ( n_bars, n_symbols ).
+        Row-major ( C ), so every row ( all symbols at one bar ) is contiguous.
+    period_mix: (`np.int32`)               : combined code of period and expected_period.
+        ( see `get_lr_exp_dev_mini_tsf()` )
+    result_mat: (`np.ndarray[np.float32]`) : 2D Result array, shape ( n_bars, n_symbols ).
+    '''
+    
+    n_bars:    np.int32 = data_mat.shape[0]
+    n_symbols: np.int32 = data_mat.shape[1]
+    
+    period:          np.int32 = period_mix % 1000
+    expected_period: np.int32 = period_mix // 1000    
+    period_calc:     np.int32 = period + expected_period
+    
+    result_mat[:period_calc, :] = 0.0 # Default value for the first period.
+    
+    if period_calc >= n_bars:
+        return
+    
+    # Loop invariants, float32 ( int32 * float32 would widen to float64 ).
+    sum_x, inv_divisor, inv_period = _lr_constants(period)
+    period_f:      np.float32 = period
+    period_calc_f: np.float32 = period_calc
+    
+    n_chunks: np.int32 = (n_symbols + _LR_SYMBOL_CHUNK - 1) // _LR_SYMBOL_CHUNK
+    
+    for c in numba.prange(n_chunks):
+        s_start: np.int32 = c * _LR_SYMBOL_CHUNK
+        s_end:   np.int32 = min(s_start + _LR_SYMBOL_CHUNK, n_symbols)
         
-        # NOTE: deviation = (expected_price - price) / price = expected_price / price - 1.0 = Ln(expected_price / price)
-        data_temp     = data_arr[i]
-        res_deviation = 1.0 - res_deviation / data_temp
-        res_deviation = max(-1.0, min(1.0, res_deviation))  # Boundary Clipping.
-        result_arr[i] = res_deviation
-        pass
+        # float64 - rounding of `sum_y` is added to `sum_xy` on every row, float32 drifts within a block.
+        sum_y_arr  = np.empty(s_end - s_start, dtype = np.float64)
+        sum_xy_arr = np.empty(s_end - s_start, dtype = np.float64)
+        
+        block_start = period_calc
+        
+        while block_start < n_bars:
+            block_end: np.int32 = min((block_start // _LR_SEED_BLOCK + 1) * _LR_SEED_BLOCK, n_bars)
+            
+            # Sums of the window before the first index, then rolled by one row per index.
+            sum_y_arr[:]  = 0.0
+            sum_xy_arr[:] = 0.0
+            
+            for j in range(period):
+                weight: np.float32 = j + 1
+                
+                for s in range(s_start, s_end):
+                    data_temp_shft             = data_mat[block_start - period_calc + j, s]
+                    sum_y_arr[s - s_start]    += data_temp_shft
+                    sum_xy_arr[s - s_start]   += weight * data_temp_shft
+            
+            for i in range(block_start, block_end):
+                
+                i_shifted: np.int32 = i - period_calc     # Index of the row leaving the window.
+                
+                for s in range(s_start, s_end):
+                    data_temp_shft           = data_mat[i_shifted + period, s]
+                    sum_xy_arr[s - s_start] += period_f * data_temp_shft - sum_y_arr[s - s_start]
+                    sum_y_arr[s - s_start]  += data_temp_shft - data_mat[i_shifted, s]
+                    
+                    slope         = (period_f * sum_xy_arr[s - s_start] - sum_x * sum_y_arr[s - s_start]) * inv_divisor
+                    intercept     = (sum_y_arr[s - s_start] - slope * sum_x) * inv_period
+                    res_deviation = slope * period_calc_f + intercept  # Expected price.
+                    
+                    # NOTE: deviation = (expected_price - price) / price = expected_price / price - 1.0 = Ln(expected_price / price)
+                    res_deviation    = np.float32(1.0) - res_deviation / data_mat[i, s]
+                    res_deviation    = max(np.float32(-1.0), min(np.float32(1.0), res_deviation))  # Boundary Clipping.
+                    result_mat[i, s] = res_deviation if data_mat[i, s] > np.float32(0.0) else np.float32(0.0)  # No price.
+            
+            block_start = block_end
     
     return
 
@@ -382,7 +1000,8 @@ _locals_vtsf = {
                 'period':           numba.int32,
                 'expected_period':  numba.int32,
                 'period_calc':      numba.int32,
-                'divisor':          numba.float32,
+                'inv_divisor':      numba.float32,
+                'inv_period':       numba.float32,
                 'sum_x':            numba.float32,
                 'sum_y':            numba.float32,
                 'sum_xy':           numba.float32,
@@ -430,33 +1049,71 @@ def get_lr_exp_dev_mini_vtsf(
     period:          np.int32   = period_mix % 1000
     expected_period: np.int32   = period_mix // 1000    
     period_calc:     np.int32   = period + expected_period    
-    divisor:         np.float32 = (period**2 * (period - 1.0)**2) / 12.0  # NOTE: Change the sign to positive, for slope follow the trend.
-    sum_x:           np.float32 = (period * (period + 1.0)) / 2.0
-    sum_xy:          float      = 0.0
-    sum_y:           float      = 0.0    
     data_temp:       np.float32 = 0.0
     res_deviation:   np.float32 = 0.0    
     start_indx_shft: int        = data_indx - period_calc + 1
+    
+    data_temp = data_arr[data_indx]
+    
+    if not data_temp > np.float32(0.0):
+        return np.float32(0.0)  # No price, window sums are skipped.
+    
+    sum_x, inv_divisor, inv_period = _lr_constants(period)
+    sum_y, sum_xy                  = _lr_window_sums(data_arr, start_indx_shft, period)
+    
+    slope:     float = (np.float32(period) * sum_xy - sum_x * sum_y) * inv_divisor
+    intercept: float = (sum_y - slope * sum_x) * inv_period
+    # NOTE: deviation = (expected_price - price) / price = expected_price / price - 1.0 = Ln(expected_price / price)
+    res_deviation: float = slope * period_calc + intercept  # Expected price.            
+    res_deviation        = 1.0 - res_deviation / data_temp
+    res_deviation        = max(np.float32(-1.0), min(np.float32(1.0), res_deviation))  # Boundary Clipping.
+    
+    return res_deviation
+
+# -----------------------------------------------------------------------------------
+#
+#  LR_EXP_DEV - GPU, Device Function ( Private )
+#
+# -----------------------------------------------------------------------------------
+
+@cuda.jit(device = True)
+def _lr_exp_dev_value_cuda(
+                            data_arr:    np.ndarray[np.float32],
+                            period:      np.int32,
+                            period_calc: np.int32,
+                            data_indx:   np.int32,
+                                ) -> np.float32:
+    '''
+    Linear Regression deviation for `data_indx`, serial ( one thread ).
+    `data_arr[]` is read only - loads are cached at all levels ( `cuda.ldca()` ), 
+    windows of neighbour threads overlap and hit L1.
+    '''
+    
+    divisor:         float = (period**2 * (period - 1.0)**2) / 12.0  # NOTE: Change the sign to positive, for slope follow the trend.
+    sum_x:           float = (period * (period + 1.0)) / 2.0
+    sum_xy:          float = 0.0
+    sum_y:           float = 0.0    
+    data_temp:       float = 0.0
+    res_deviation:   float = 0.0
+    
+    start_indx_shft: int = data_indx - period_calc + 1
+    
+    if not cuda.ldca(data_arr, data_indx) > 0.0:
+        return 0.0  # No price ( 0.0, NaN ), window sums are skipped.
 
     for j in range(period):                
-        data_temp: float = data_arr[start_indx_shft + j]  
+        data_temp: float = cuda.ldca(data_arr, start_indx_shft + j)
         sum_y           += data_temp
         sum_xy          += (j + 1) * data_temp
     
     slope:     float = (period * sum_xy - sum_x * sum_y) / divisor
     intercept: float = (sum_y - slope * sum_x) / float(period)            
-    data_temp: float = data_arr[data_indx]        
+    data_temp: float = cuda.ldca(data_arr, data_indx)
     # NOTE: deviation = (expected_price - price) / price = expected_price / price - 1.0 = Ln(expected_price / price)
     res_deviation: float = slope * period_calc + intercept  # Expected price.            
-    res_deviation        = 1.0 - res_deviation / data_temp
-    func_val_temp        = res_deviation
-    
-    if res_deviation > 1.0:
-        func_val_temp = 1.0
-    elif res_deviation < -1.0:
-        func_val_temp = -1.0
+    res_deviation        = 1.0 - res_deviation / data_temp    
     
-    return func_val_temp
+    return max(-1.0, min(1.0, res_deviation))  # Boundary Clipping ( fminf / fmaxf ).
 
 # -----------------------------------------------------------------------------------
 #
@@ -496,38 +1153,101 @@ def get_lr_exp_dev_mini_vtsf_cuda(
         
     '''
     
-    period:          int   = period_mix % 1000
-    expected_period: int   = period_mix // 1000    
-    period_calc:     int   = period + expected_period    
-    divisor:         float = (period**2 * (period - 1.0)**2) / 12.0  # NOTE: Change the sign to positive, for slope follow the trend.
-    sum_x:           float = (period * (period + 1.0)) / 2.0
-    sum_xy:          float = 0.0
-    sum_y:           float = 0.0    
-    data_temp:       float = 0.0
-    res_deviation:   float = 0.0
+    period:          int = period_mix % 1000
+    expected_period: int = period_mix // 1000    
     
-    start_indx_shft: int = data_indx - period_calc + 1
+    res_arr[res_indx] = _lr_exp_dev_value_cuda(data_arr, period, period + expected_period, data_indx)
+    
+    return
 
-    for j in range(period):                
-        data_temp: float = data_arr[start_indx_shft + j]  
-        sum_y           += data_temp
-        sum_xy          += (j + 1) * data_temp
+# -----------------------------------------------------------------------------------
+#
+#  LR_EXP_DEV - MINI, GPU version, Range of Indexes, Grid Stride Kernel
+#
+# -----------------------------------------------------------------------------------
+
+@cuda.jit()
+def get_lr_exp_dev_range_cuda(
+                                data_arr:   np.ndarray[np.float32],
+                                period_mix: np.int32,
+                                i_start:    np.int32,
+                                i_end:      np.int32,
+                                res_arr:    np.ndarray[np.float32],
+                                    ) -> None:
+    '''
+    Linear Regression - Deviation from expected value, for indexes `[i_start, i_end)`, by updating `res_arr[]`.
+    GPU Kernel, grid stride loop: any grid size covers the whole range with one launch.
     
-    slope:     float = (period * sum_xy - sum_x * sum_y) / divisor
-    intercept: float = (sum_y - slope * sum_x) / float(period)            
-    data_temp: float = data_arr[data_indx]        
-    # NOTE: deviation = (expected_price - price) / price = expected_price / price - 1.0 = Ln(expected_price / price)
-    res_deviation: float = slope * period_calc + intercept  # Expected price.            
-    res_deviation        = 1.0 - res_deviation / data_temp    
-    func_val_temp        = res_deviation
+    Launch:
+    -------
+    >>> blocks = (i_end - i_start + threads - 1) // threads
+    >>> get_lr_exp_dev_range_cuda[blocks, threads](d_data_arr, period_mix, i_start, i_end, d_res_arr)
     
-    if res_deviation > 1.0:
-        func_val_temp = 1.0
-    elif res_deviation < -1.0:
-        func_val_temp = -1.0
+    Parameters:
+    -----------
+    data_arr:   (`np.ndarray[np.float32]`) : Input data array ( device array ).
+    period_mix: (`np.int32`)               : combined code of period and expected_period.
+        ( see `get_lr_exp_dev_mini_vtsf_cuda()` )
+    i_start:    (`np.int32`)               : First index.
+        Warning: **( i_start >= period + expected_period - 1 )**
+    i_end:      (`np.int32`)               : End index ( exclusive ).
+    res_arr:    (`np.ndarray[np.float32]`) : Result array ( device array ).
+        Array updated with deviation values, `res_arr[i]` for `data_arr[i]`.
+    '''
     
-    res_arr[res_indx] = func_val_temp
+    period:          int = period_mix % 1000
+    expected_period: int = period_mix // 1000    
+    period_calc:     int = period + expected_period
+    
+    grid_indx:   int = cuda.grid(1)
+    grid_stride: int = cuda.gridsize(1)
+    
+    for i in range(i_start + grid_indx, i_end, grid_stride):
+        res_arr[i] = _lr_exp_dev_value_cuda(data_arr, period, period_calc, i)
     
     return
 
+def get_lr_exp_dev_cuda(
+                        data_arr:          np.ndarray[np.float32],
+                        period_mix:        int,
+                        threads_per_block: int = 256,
+                            ) -> np.ndarray[np.float32]:
+    '''
+    Linear Regression - Deviation from expected value, of the whole array, calculated on GPU.
+    Same layout as `get_lr_exp_dev_mini()`, first `period + expected_period` values are 0.0.
+    
+    Launches `get_lr_exp_dev_range_cuda()` once for the whole array.
+    
+    Parameters:
+    -----------
+    data_arr:          (`np.ndarray[np.float32]`) : Input data array.
+        Host array, or CUDA device array.
+    period_mix:        (`int`)                    : combined code of period and expected_period.
+        ( see `get_lr_exp_dev_mini()` )
+    threads_per_block: (`int`)                    : CUDA block size.
+    
+    Returns:
+    --------
+    (`np.ndarray[np.float32]`) : Deviation from expected value.
+        If `data_arr` is a device array, result is a device array too.
+    '''
+    
+    is_device:  bool = hasattr(data_arr, '__cuda_array_interface__')
+    d_data_arr       = data_arr if is_device else cuda.to_device(np.ascontiguousarray(data_arr, dtype = np.float32))
+    data_size:  int  = d_data_arr.shape[0]
+    period_calc: int = period_mix % 1000 + period_mix // 1000
+    
+    res_arr: np.ndarray[np.float32] = np.zeros(data_size, dtype = np.float32)   # Default value for the first period.
+    d_res_arr                       = cuda.to_device(res_arr)
+    
+    blocks: int = (data_size - period_calc + threads_per_block - 1) // threads_per_block
+    
+    if blocks > 0:
+        get_lr_exp_dev_range_cuda[blocks, threads_per_block](d_data_arr, period_mix, period_calc, data_size, d_res_arr)
+    
+    if is_device:
+        return d_res_arr
+    
+    return d_res_arr.copy_to_host()
+
 # -----------------------------------------------------------------------------------
\ No newline at end of file
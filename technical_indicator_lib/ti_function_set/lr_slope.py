@@ -1,18 +1,43 @@
+from __future__ import annotations
+
+import functools
+import math
+
 import numpy as np
 import numba
 from numba import cuda
+from numba.cuda import libdevice
+
+from ._constants import L2_TILE_SIZE
 
 
 # -----------------------------------------------------------------------------------
 
 _name_:           str = 'Linear Regression - Slope'
-__version__:      str = '0.0.1'
-__version_date__: str = '2024-09-16'
+__version__:      str = '0.0.2'
+__version_date__: str = '2026-10-15'
 VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}' 
 
 # --- VERSION HISTORY: --------------------------------------------------------------
 
 # v0.0.1 @ 2024-09-16 : Initial Release.
+# v0.0.2 @ 2026-10-15 : ArcTan by minimax polynomial ( Horner, FMA ) instead of Taylor series, exact 2 / Pi ( CPU versions ).
+#                       Branchless ArcTan range reduction / sign ( min / max, select, copysign ) in all versions.
+#                       Rolling sum_y / sum_xy - O(N) instead of O(N * period), re-seeded every `_LR_SEED_BLOCK` values.
+#                       CUDA: float32 minimax ArcTan ( cuda.fma ), fast division ( __fdividef ), device helpers with constants as arguments.
+#                       Added get_lr_slope_tsf_parallel() - multi-core version of get_lr_slope_tsf().
+#                       Added get_lr_slope_range_cuda() - GPU grid stride kernel ( shared memory tile ), get_lr_slope_cuda() - host function.
+#                       ArcTan(x) = Pi / 4 + ArcTan((x - 1) / (x + 1)) reduction - no select, division does not feed the polynomial twice.
+#                       Window sums helper - float32 ramp weights ( no int -> float conversion ), 4 accumulators ( ILP ).
+#                       Added get_lr_slope_dispatch() - kernels specialized by period ( compile cache ).
+#                       Added get_lr_slope_np() - pure NumPy version ( cumsum / correlate, np.arctan ).
+#                       Rolling kernel - single fused pass ( 2 loads, 1 store per value ), 1 / divisor computed once.
+#                       Window sums centered on a window value ( no float32 cancellation at high price levels ), 
+#                           explicit float32 values in the inlined rolling kernel ( same code in every caller ).
+#                       Rolling sums in float64 ( no drift within `_LR_SEED_BLOCK` values ).
+#                       Rolling kernel callers compiled without 'reassoc' fast math flag ( serial and parallel results are equal ).
+#                       Rolling kernel seeds in float64 ( `_lr_window_seed()` ), no seed error drift on short periods.
+#                       get_lr_slope_np() - float64 sums of values centered on the series mean ( no float32 cancellation ).
 #
 
 # --- CALCULATION DESCRIPTION: -------------------------------------------------------
@@ -62,6 +87,278 @@ VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date_
 
 # divisor = - (n**2 * (n**2 - 1)) / 12
 
+# -----------------------------------------------------------------------------------
+#
+#       ArcTan on [-1.0 .. 1.0] ( Private, shared by all CPU versions ):
+#
+# -----------------------------------------------------------------------------------
+
+_INV_HALF_PI: float = 0.6366197723675814     # 1.0 / (np.pi / 2.0)
+
+_signature_atan_unit = numba.float32(numba.float32, )
+
+_locals_atan_unit = {
+                        's': numba.float32,
+                        'r': numba.float32, }
+
+@numba.njit(_signature_atan_unit,
+            cache       = True, 
+            fastmath    = True, 
+            nogil       = True,
+            inline      = 'always',
+            locals      = _locals_atan_unit, )
+def _atan_unit_f32(a: np.float32) -> np.float32:
+    '''
+    ArcTan(a) for `a` in '([-1.0 .. 1.0])', max error ~1.7 ulp ( float32 ).
+    
+    Minimax polynomial in `s = a * a`, Horner scheme - 8 multiply-adds, 
+    contracted to FMA ( `llvm.fma.f32` ) under fastmath, no divisions.
+    '''
+    
+    s = a * a
+    r = np.float32( 2.78569828e-3)             # 0x1.6d2086p-9
+    r = r * s + np.float32(-1.58660226e-2)     # -0x1.03f2ecp-6
+    r = r * s + np.float32( 4.24722321e-2)     # 0x1.5beebap-5
+    r = r * s + np.float32(-7.49753043e-2)     # -0x1.33194ep-4
+    r = r * s + np.float32( 1.06448799e-1)     # 0x1.b403a8p-4
+    r = r * s + np.float32(-1.42070308e-1)     # -0x1.22f5c2p-3
+    r = r * s + np.float32( 1.99934542e-1)     # 0x1.997748p-3
+    r = r * s + np.float32(-3.33331466e-1)     # -0x1.5554d8p-2
+    
+    return (r * s) * a + a
+
+# -----------------------------------------------------------------------------------
+#
+#       ArcTan(Slope) / (0.5 * PI) ( Private, shared by all CPU versions ):
+#
+# -----------------------------------------------------------------------------------
+
+_signature_atan_norm = numba.float32(numba.float32, )
+
+_locals_atan_norm = {
+                        'x_abs':    numba.float32,
+                        'x_temp':   numba.float32,
+                        'atan_val': numba.float32, }
+
+@numba.njit(_signature_atan_norm,
+            cache       = True, 
+            fastmath    = True, 
+            nogil       = True,
+            inline      = 'always',
+            locals      = _locals_atan_norm, )
+def _atan_norm_f32(lr_slope_temp: np.float32) -> np.float32:
+    '''
+    ArcTan(x) normalized to '([-1.0 .. 1.0])', branchless.
+    
+    ArcTan(|x|) = Pi / 4 + ArcTan((|x| - 1) / (|x| + 1)), reduced value is in '([-1.0 .. 1.0))' for any |x|, 
+    so no select is needed and the divisor is '>= 1.0' ( no division by zero ).
+    Normalized: 0.5 + ArcTan(reduced) * 2 / Pi, absolute error ~1 ulp of 0.5 near x = 0.
+    '''
+    
+    x_abs  = abs(lr_slope_temp)
+    x_temp = (x_abs - np.float32(1.0)) / (x_abs + np.float32(1.0))
+    
+    # NOTE: _atan_unit_f32() is odd ( r(s) * s * a + a ), valid for negative values too.
+    atan_val = np.float32(0.5) + _atan_unit_f32(x_temp) * np.float32(_INV_HALF_PI)  # NOTE: Minimax polynomial for ArcTan(x), x in [-1 .. 1].
+    
+    return math.copysign(atan_val, lr_slope_temp)
+
+# -----------------------------------------------------------------------------------
+#
+#       Linear Regression Slope - Window Sums ( Private, shared by all CPU versions ):
+#
+# -----------------------------------------------------------------------------------
+
+_signature_window_sums = numba.types.UniTuple(numba.float32, 2)(
+                                numba.types.Array(numba.float32, 1, 'C', readonly = True, aligned = True),
+                                numba.int32,      # start_indx
+                                numba.int32,      # period
+                                numba.float32, )  # offset
+
+_locals_window_sums = {
+        'n_quad':    numba.int32,
+        'x_f':       numba.float32,
+        'sum_y':     numba.float32,
+        'sum_xy':    numba.float32,
+        'sum_xy_0':  numba.float32,
+        'sum_xy_1':  numba.float32,
+        'sum_xy_2':  numba.float32,
+        'sum_xy_3':  numba.float32,
+        'data_0':    numba.float32,
+        'data_1':    numba.float32,
+        'data_2':    numba.float32,
+        'data_3':    numba.float32,
+        'data_temp': numba.float32, }
+
+@numba.njit(_signature_window_sums,
+            cache       = True, 
+            fastmath    = True, 
+            nogil       = True,
+            boundscheck = False,
+            inline      = 'always',
+            locals      = _locals_window_sums, )
+def _lr_window_sums(
+                    data_arr:   np.ndarray[np.float32],
+                    start_indx: np.int32,
+                    period:     np.int32,
+                    offset:     np.float32,
+                        ) -> tuple[np.float32, np.float32]:
+    '''
+    Sums of window `data_arr[start_indx : start_indx + period] - offset`.
+    
+    Slope is invariant to the `offset` shift, values near the window level ( e.g. a value of the window ) 
+    keep sums small - no float32 cancellation in `period * sum_xy - sum_x * sum_y` at high price levels.
+    
+    `x` ramp is a float32 induction ( `(j + 1)` would be int64 -> float conversion per value, 
+    no packed instruction on AVX2 ), `sum_xy` is split into 4 independent accumulators ( FMA chains ).
+    
+    Returns:
+    --------
+    (`tuple[np.float32, np.float32]`) : ( sum_y, sum_xy ), `x` of the first value is 1.
+    '''
+    
+    sum_y    = np.float32(0.0)
+    sum_xy_0 = np.float32(0.0)
+    sum_xy_1 = np.float32(0.0)
+    sum_xy_2 = np.float32(0.0)
+    sum_xy_3 = np.float32(0.0)
+    x_f      = np.float32(1.0)
+    
+    n_quad: np.int32 = period & ~3
+    
+    for j in range(0, n_quad, 4):
+        data_ptr  = start_indx + j
+        data_0    = data_arr[data_ptr]     - offset
+        data_1    = data_arr[data_ptr + 1] - offset
+        data_2    = data_arr[data_ptr + 2] - offset
+        data_3    = data_arr[data_ptr + 3] - offset
+        sum_y    += data_0 + data_1 + data_2 + data_3
+        sum_xy_0 += x_f                      * data_0
+        sum_xy_1 += (x_f + np.float32(1.0)) * data_1
+        sum_xy_2 += (x_f + np.float32(2.0)) * data_2
+        sum_xy_3 += (x_f + np.float32(3.0)) * data_3
+        x_f      += np.float32(4.0)
+    
+    for j in range(n_quad, period):     # Tail.
+        data_temp = data_arr[start_indx + j] - offset
+        sum_y    += data_temp
+        sum_xy_0 += x_f * data_temp
+        x_f      += np.float32(1.0)
+    
+    sum_xy = (sum_xy_0 + sum_xy_1) + (sum_xy_2 + sum_xy_3)
+    
+    return sum_y, sum_xy
+
+# -----------------------------------------------------------------------------------
+#
+#       Linear Regression Slope - Rolling Kernel ( Private, shared by all full array versions ):
+#
+# -----------------------------------------------------------------------------------
+
+# ROLLING SUMS: window of index `i` is `data_arr[i - period + 1 .. i]`, `x = 1 .. period`.
+#   Step i - 1 -> i, every old `x` decreases by 1, the new value gets `x = period`:
+#       sum_xy(i) = sum_xy(i - 1) - sum_y(i - 1) + period * data_arr[i]
+#       sum_y(i)  = sum_y(i - 1) + data_arr[i] - data_arr[i - period]
+
+_LR_SEED_BLOCK: int = 4096     # Values per block of rolling sums, ( float32 ) 16 KB - fits L1 cache.
+
+@numba.njit(inline = 'always')
+def _lr_window_seed(
+                    data_arr:   np.ndarray[np.float32],
+                    start_indx: np.int32,
+                    period:     np.int32,
+                    offset:     np.float64,
+                        ) -> tuple[np.float64, np.float64]:
+    '''
+    Sums of window `data_arr[start_indx : start_indx + period] - offset`, float64 ( seed of the rolling kernel ).
+    
+    Rolling `sum_xy` subtracts `sum_y` on every step, so a rounding error of the seed `sum_y` 
+    would grow linearly through the block - float32 seeds drift on short periods / zero crossing data.
+    '''
+    
+    seed_y  = np.float64(0.0)
+    seed_xy = np.float64(0.0)
+    
+    for j in range(period):
+        seed_delta = np.float64(data_arr[start_indx + j]) - offset
+        seed_y    += seed_delta
+        seed_xy   += np.float64(j + 1) * seed_delta
+    
+    return seed_y, seed_xy
+
+# Fast math flags of the `_lr_slope_range()` callers - all but 'reassoc': 
+#   window sums are NOT re-vectorized differently per caller ( serial / prange tiles ), results are equal.
+#   Rolling loop is a dependency chain, it is NOT vectorized with 'reassoc' either.
+_LR_FASTMATH: set[str] = {'nnan', 'ninf', 'nsz', 'arcp', 'contract', 'afn'}
+
+_locals_range = {
+                'block_end':     numba.int32,
+                'inv_divisor':   numba.float32,
+                'sum_x':         numba.float32,
+                'period_f':      numba.float32,
+                'offset':        numba.float64,
+                'roll_y':        numba.float64,
+                'roll_xy':       numba.float64,
+                'data_delta':    numba.float64,
+                'lr_slope_temp': numba.float32, }
+
+@numba.njit(fastmath    = True, 
+            nogil       = True,
+            boundscheck = False,
+            inline      = 'always',
+            locals      = _locals_range, )
+def _lr_slope_range(
+                    data_arr:   np.ndarray[np.float32],
+                    period:     np.int32,
+                    i_first:    np.int32,
+                    i_end:      np.int32,
+                    result_arr: np.ndarray[np.float32],
+                        ) -> None:
+    '''
+    Rolling Linear Regression Slope for indexes `[i_first, i_end)`, `i_first >= period`.
+    
+    Indexes are processed in blocks aligned to `_LR_SEED_BLOCK`, 
+    every block seeds its sums on the window before its first index, 
+    so float32 rounding of rolling sums does NOT accumulate across blocks.
+    Sums are of values centered on the first seed value of the block ( slope is invariant to the shift ).
+    Seed and rolling sums are float64 ( `roll_y` rounding error is added to `roll_xy` on every step, see `_lr_window_seed()` ), 
+    slope and ArcTan are float32.
+    Inlined code is typed by the caller `locals`, so all values here are explicit `np.float32` / `np.float64` - 
+    every caller ( serial, tiles, specialized ) compiles the same arithmetic.
+    
+    Single fused pass: rolling sums, slope and ArcTan per value, state in registers, no scratch arrays - 
+    2 loads ( value entering / leaving the window ) and 1 store per value.
+    '''
+    
+    # Loop invariants, float32, multiply instead of divide.
+    inv_divisor: np.float32 = np.float32(12.0 / (period**2 * (period - 1.0)**2))  # Change the sign to positive, for slope follow the trend.
+    sum_x:       np.float32 = np.float32((period * (period + 1.0)) / 2.0)
+    period_f:    np.float32 = np.float32(period)
+    
+    block_start = i_first
+    
+    while block_start < i_end:
+        block_end: np.int32 = min((block_start // _LR_SEED_BLOCK + 1) * _LR_SEED_BLOCK, i_end)
+        
+        # Sums of the window before the first index, centered on its first value, float64.
+        offset          = np.float64(data_arr[block_start - period])
+        roll_y, roll_xy = _lr_window_seed(data_arr, block_start - period, period, offset)
+        
+        # Rolled by one value per index, float64 - `roll_y` error would feed `roll_xy` every step.
+        for i in range(block_start, block_end):
+            data_delta = np.float64(data_arr[i]) - offset
+            roll_xy   += period_f * data_delta - roll_y
+            roll_y    += data_delta - (np.float64(data_arr[i - period]) - offset)
+            
+            lr_slope_temp = np.float32((period_f * roll_xy - sum_x * roll_y) * inv_divisor)
+            
+            # ArcTan(Slope) / (0.5 * PI)
+            result_arr[i] = _atan_norm_f32(lr_slope_temp)
+        
+        block_start = block_end
+    
+    return
+
 # -----------------------------------------------------------------------------------
 #
 #       Linear Regression Slope Calculation:
@@ -78,13 +375,11 @@ _locals_func_numba = {
                         'sum_y':     numba.float32,
                         'sum_xy':    numba.float32,
                         'i_shifted': numba.int32,         
-                        'x_temp':    numba.float32,
-                        'atan_val':  numba.float32,             
                             }
 
 @numba.njit(_spec_func_numba,
             cache       = True, 
-            fastmath    = True, 
+            fastmath    = _LR_FASTMATH, 
             nogil       = True,
             boundscheck = False,
             locals      = _locals_func_numba, )
@@ -111,43 +406,127 @@ def get_lr_slope(
     
     result_arr: np.ndarray[np.float32] = np.empty_like(data_arr, dtype = np.float32)    
     
-    divisor: np.float32 = (period**2 * (period - 1.0)**2) / 12.0  # Change the sign to positive, for slope follow the trend.
-    sum_x:   np.float32 = (period * (period + 1.0)) / 2.0
-    
     result_arr[:period] = 0.0 # Default value for the first period.
     
-    for i in range(period, len(data_arr)):
-        
-        sum_xy = 0.0
-        sum_y  = 0.0
-        
-        i_shifted: np.int32 = i - period + 1
-        
-        for j in range(period):
-            sum_y  += data_arr[i_shifted + j]
-            sum_xy += (j + 1) * data_arr[i_shifted + j]
-            pass
+    _lr_slope_range(data_arr, period, period, len(data_arr), result_arr)
+    
+    return result_arr
+
+# -----------------------------------------------------------------------------------
+#
+#       Linear Regression Slope - NumPy Version ( no JIT ):
+#
+# -----------------------------------------------------------------------------------
+
+def get_lr_slope_np(
+                    data_arr: np.ndarray[np.float32],
+                    period:   int,
+                        ) -> np.ndarray[np.float32]:
+    '''
+    Get Linear Regression Slope indicator array.
+    Same results as `get_lr_slope()` up to float32 rounding, 
+    window sums for all indexes are calculated at once with NumPy array operations:
+    
+    ```python
+    sum_y  = cumsum(data)[p - 1:] - cumsum(data)[:-p]       # ( with leading 0.0 )
+    sum_xy = correlate(data, [1, 2, ..., p], 'valid')       # sliding dot( weights, window )
+    ```
+    
+        Sums are float64 of values centered on the series mean ( slope is invariant to the shift ), 
+        float32 dot products of raw values cancel in `period * sum_xy - sum_x * sum_y` on short periods.
+    
+    Parameters:
+    -----------
+    data_arr: (`np.ndarray[np.float32]`) : Input data array.
+    period:   (`int`)                    : Period of linear regression.
+        **( period >= 2 )**
     
-        lr_slope_temp: np.float32 = (period * sum_xy - sum_x * sum_y) / divisor
+    Returns:
+    --------
+    (`np.ndarray[np.float32]`) : Linear Regression Slope indicator array.
+    '''
+    
+    data_arr  = np.ascontiguousarray(data_arr, dtype = np.float32)
+    period    = int(period)
+    data_size = data_arr.shape[0]
+    
+    result_arr: np.ndarray[np.float32] = np.zeros(data_size, dtype = np.float32)  # Default value for the first period.
+    
+    if period >= data_size:
+        return result_arr
+    
+    divisor: np.float64 = (period**2 * (period - 1.0)**2) / 12.0  # Change the sign to positive, for slope follow the trend.
+    sum_x:   np.float64 = (period * (period + 1.0)) / 2.0
+    
+    # Window sums for every window start, window of index `i` starts at `i - period + 1`.
+    data_f64   = data_arr - np.mean(data_arr, dtype = np.float64)     # float64, centered.
+    accum_arr  = np.concatenate((np.zeros(1), np.cumsum(data_f64)))
+    sum_y_arr  = accum_arr[period:] - accum_arr[:-period]
+    j_weights  = np.arange(1, period + 1, dtype = np.float64)
+    sum_xy_arr = np.correlate(data_f64, j_weights, mode = 'valid')    # float64 dot product per window.
+    
+    slope = ((period * sum_xy_arr[1:] - sum_x * sum_y_arr[1:]) / divisor).astype(np.float32)
+    
+    # ArcTan(Slope) / (0.5 * PI)
+    result_arr[period:] = np.arctan(slope) * np.float32(_INV_HALF_PI)
+    
+    return result_arr
+
+# -----------------------------------------------------------------------------------
+#
+#       Linear Regression Slope - Specialized by Period ( Compile Cache )
+#
+# -----------------------------------------------------------------------------------
+
+_spec_func_specialized = numba.types.Array(numba.float32, 1, 'C')(
+                            numba.types.Array(numba.float32, 1, 'C', readonly = True, aligned = True), )  # data_arr
+
+@functools.lru_cache(maxsize = 16)
+def _build_lr_slope_specialized(period: int):
+    '''
+    Build Linear Regression Slope kernel `(data_arr) -> result_arr` for the fixed period.
+    '''
+    
+    PERIOD: int = period
+    
+    @numba.njit(_spec_func_specialized,
+                fastmath    = _LR_FASTMATH,
+                nogil       = True,
+                boundscheck = False,
+                error_model = 'numpy', )
+    def _get_lr_slope_specialized(data_arr: np.ndarray[np.float32]) -> np.ndarray[np.float32]:
         
-        # ArcTan(Slope) / (0.5 * PI)
-        # atan normalized to -1 to 1 calculation:
-        x_temp: np.float32 = abs(lr_slope_temp)
-        if x_temp > 1:
-            x_temp = 1.0 / x_temp
+        result_arr = np.empty_like(data_arr, dtype = np.float32)
         
-        atan_val: np.float32 = x_temp - (x_temp**3 / 3) + (x_temp**5 / 5) - (x_temp**7 / 7) # NOTE: Taylor series for ArcTan(x)
-        atan_val            *= 0.6366       # NOTE: 0.6366 = 1.0 / (np.pi / 2.0)
+        result_arr[:PERIOD] = np.float32(0.0)  # Default value for the first period.
         
-        if abs(lr_slope_temp) > 1:
-            atan_val = 1.0 - atan_val    
-        if lr_slope_temp < 0:
-            atan_val = -atan_val    
+        _lr_slope_range(data_arr, PERIOD, PERIOD, len(data_arr), result_arr)
         
-        result_arr[i] = atan_val
-        pass
+        return result_arr
     
-    return result_arr
+    return _get_lr_slope_specialized
+
+def get_lr_slope_dispatch(
+                            data_arr: np.ndarray[np.float32],
+                            period:   int,
+                                ) -> np.ndarray[np.float32]:
+    '''
+    Get Linear Regression Slope indicator array.
+    Same results as `get_lr_slope()`, 
+    kernel is compiled for this exact period ( on the first call with the new period ), 
+    so `divisor`, `sum_x` and the window seed loop are constants / unrolled.
+    
+    Parameters:
+    -----------
+    data_arr: (`np.ndarray[np.float32]`) : Input data array.
+    period:   (`int`)                    : Period of linear regression.
+    
+    Returns:
+    --------
+    (`np.ndarray[np.float32]`) : Linear Regression Slope indicator array.
+    '''
+    
+    return _build_lr_slope_specialized(int(period))(data_arr)
 
 # -----------------------------------------------------------------------------------
 #
@@ -169,14 +548,12 @@ _locals_tsf = {
                 'i_shifted':     numba.int32,                
                 'data_temp':     numba.float32,
                 'res_val':       numba.float32,
-                'x_temp':        numba.float32,
-                'atan_val':      numba.float32,
                 'lr_slope_temp': numba.float32,
                 }
 
 @numba.njit(_signature_tsf,
             cache       = True, 
-            fastmath    = True, 
+            fastmath    = _LR_FASTMATH, 
             nogil       = True,
             boundscheck = False,
             locals      = _locals_tsf, )
@@ -205,42 +582,71 @@ def get_lr_slope_tsf(
     if data_size < 0:
         data_size = data_arr.shape[0]
     
-    divisor: np.float32 = (period**2 * (period - 1.0)**2) / 12.0  # Change the sign to positive, for slope follow the trend.
-    sum_x:   np.float32 = (period * (period + 1.0)) / 2.0
+    for i in range(period):
+        result_arr[i] = 0.0  # Default value for the first period.
+    
+    _lr_slope_range(data_arr, period, period, data_size, result_arr)
+    
+    return
+
+# -----------------------------------------------------------------------------------
+#
+#       Linear Regression Slope Indicator (tsf) - Thread Safe Function, Multi-Core:
+#
+# -----------------------------------------------------------------------------------
+
+_LR_TILE_SIZE: int = L2_TILE_SIZE     # Multiple of `_LR_SEED_BLOCK`.
+
+_locals_tsf_parallel = {
+                'n_tiles': numba.int32,
+                'i_start': numba.int32,
+                'i_end':   numba.int32, }
+
+@numba.njit(_signature_tsf,
+            cache       = True, 
+            fastmath    = _LR_FASTMATH, 
+            nogil       = True,
+            boundscheck = False,
+            parallel    = True,
+            locals      = _locals_tsf_parallel, )
+def get_lr_slope_tsf_parallel(
+                                data_arr:   np.ndarray[np.float32], 
+                                period:     np.int32,
+                                data_size:  np.int32,
+                                result_arr: np.ndarray[np.float32],
+                                    ) -> None:
+    '''
+    Get Linear Regression Slope indicator array.
+    Parallel version of `get_lr_slope_tsf()`, runs on all cores.
+    
+    Data is split into tiles of `_LR_TILE_SIZE` values, 
+    every tile seeds its own sums on the window before it
+    and is calculated independently in `numba.prange()`.
+    Tiles are multiples of `_LR_SEED_BLOCK`, so results are equal to `get_lr_slope_tsf()`.
+    
+    Parameters:
+    -----------
+    data_arr:   (`np.ndarray[np.float32]`) : Input data array.
+    period:     (`np.int32`)               : Period of linear regression.
+    data_size:  (`np.int32`)               : Data size.
+    result_arr: (`np.ndarray[np.float32]`) : Result array.
+        Result array will be filled with the computed array.
+    '''
+    
+    if data_size < 0:
+        data_size = data_arr.shape[0]
     
     for i in range(period):
         result_arr[i] = 0.0  # Default value for the first period.
     
-    for i in range(period, data_size):
-        
-        sum_xy:    np.float32 = 0.0
-        sum_y:     np.float32 = 0.0        
-        i_shifted: np.int32   = i - period + 1
-        
-        for j in range(period):
-            data_temp = data_arr[i_shifted + j]
-            sum_y    += data_temp
-            sum_xy   += (j + 1) * data_temp
-            pass
-        
-        lr_slope_temp: np.float32 = (period * sum_xy - sum_x * sum_y) / divisor
-        
-        # ArcTan(Slope) / (0.5 * PI)
-        # atan normalized to -1 to 1 calculation:
-        x_temp: np.float32 = abs(lr_slope_temp)
-        if x_temp > 1:
-            x_temp = 1.0 / x_temp
-        
-        atan_val: np.float32 = x_temp - (x_temp**3 / 3) + (x_temp**5 / 5) - (x_temp**7 / 7) # NOTE: Taylor series for ArcTan(x)
-        atan_val            *= 0.6366      # NOTE: 0.6366 = 1.0 / (np.pi / 2.0)
+    n_tiles: np.int32 = (data_size + _LR_TILE_SIZE - 1) // _LR_TILE_SIZE
+    
+    for t in numba.prange(n_tiles):
+        i_start: np.int32 = max(t * _LR_TILE_SIZE, period)
+        i_end:   np.int32 = min((t + 1) * _LR_TILE_SIZE, data_size)
         
-        if abs(lr_slope_temp) > 1:
-            atan_val = 1.0 - atan_val    
-        if lr_slope_temp < 0:
-            atan_val = -atan_val    
-                
-        result_arr[i] = atan_val
-        pass
+        if i_start < i_end:
+            _lr_slope_range(data_arr, period, i_start, i_end, result_arr)
     
     return
 
@@ -294,32 +700,79 @@ def get_lr_slope_vtsf(
 
     divisor: np.float32 = (period**2 * (period - 1.0)**2) / 12.0  # Change the sign to positive, for slope follow the trend.
     sum_x:   np.float32 = (period * (period + 1.0)) / 2.0
-    sum_xy:  np.float32 = 0.0
-    sum_y:   np.float32 = 0.0   
     
-    start_indx_shft: np.int32 = data_indx - period + 1
+    sum_y, sum_xy = _lr_window_sums(data_arr, data_indx - period + 1, period, data_arr[data_indx - period + 1])
+    
+    lr_slope_temp = (period * sum_xy - sum_x * sum_y) / divisor
+    
+    # ArcTan(Slope) / (0.5 * PI)
+    return _atan_norm_f32(lr_slope_temp)
+
+# -----------------------------------------------------------------------------------
+#
+#   Linear Regression Slope (CUDA) - Device Helpers ( Private ).
+#
+# -----------------------------------------------------------------------------------
+
+@cuda.jit(device = True, inline = True)
+def _atan_unit_cuda(a: np.float32) -> np.float32:
+    '''
+    ArcTan(a) for `a` in '([-1.0 .. 1.0])', float32 minimax polynomial ( see `_atan_unit_f32()` ).
+    Horner scheme - 8 FMA, float32 literals ( float64 would run at 1/32 - 1/64 rate on consumer GPUs ).
+    '''
+    
+    s = a * a
+    r = np.float32( 2.78569828e-3)
+    r = cuda.fma(r, s, np.float32(-1.58660226e-2))
+    r = cuda.fma(r, s, np.float32( 4.24722321e-2))
+    r = cuda.fma(r, s, np.float32(-7.49753043e-2))
+    r = cuda.fma(r, s, np.float32( 1.06448799e-1))
+    r = cuda.fma(r, s, np.float32(-1.42070308e-1))
+    r = cuda.fma(r, s, np.float32( 1.99934542e-1))
+    r = cuda.fma(r, s, np.float32(-3.33331466e-1))
+    
+    return cuda.fma(r * s, a, a)
+
+@cuda.jit(device = True, inline = True)
+def _lr_slope_value_cuda(
+                            data_arr:    np.ndarray[np.float32],
+                            period:      np.int32,
+                            data_indx:   np.int32,
+                            sum_x:       np.float32,
+                            inv_divisor: np.float32,
+                                ) -> np.float32:
+    '''
+    Linear Regression Slope for `data_indx`, serial ( one thread ).
+    `sum_x` and `1 / divisor` are constants of the period, computed once by the caller.
+    '''
+    
+    sum_xy: float = 0.0
+    sum_y:  float = 0.0   
+    
+    start_indx_shft: int = data_indx - period + 1
     
     for j in range(period):                
-        data_temp: np.float32 = data_arr[start_indx_shft + j]
-        sum_y  += data_temp
-        sum_xy += (j + 1) * data_temp
+        data_temp: float = cuda.ldca(data_arr, start_indx_shft + j)
+        sum_y           += data_temp
+        sum_xy          += (j + 1) * data_temp
+    
+    lr_slope_temp = np.float32((period * sum_xy - sum_x * sum_y) * inv_divisor)
+    
+    return _atan_norm_cuda(lr_slope_temp)
 
-    lr_slope_temp = (period * sum_xy - sum_x * sum_y) / divisor
+@cuda.jit(device = True, inline = True)
+def _atan_norm_cuda(lr_slope_temp: np.float32) -> np.float32:
+    '''
+    ArcTan(x) normalized to '([-1.0 .. 1.0])' ( see `_atan_norm_f32()` ).
+    '''
     
-    # atan normalized to -1 to 1 calculation:
-    x_temp: np.float32 = abs(lr_slope_temp)
-    if x_temp > 1:
-        x_temp = 1.0 / x_temp
+    # atan normalized to -1 to 1 calculation ( branchless, no warp divergence ):
+    x_abs  = abs(lr_slope_temp)
+    x_temp = libdevice.fast_fdividef(x_abs - np.float32(1.0), x_abs + np.float32(1.0))
     
-    atan_val: np.float32 = x_temp - (x_temp**3 / 3) + (x_temp**5 / 5) - (x_temp**7 / 7) # NOTE: Taylor series for ArcTan(x)
-    atan_val            *= 0.6366       # NOTE: 0.6366 = 1.0 / (np.pi / 2.0)
+    atan_val = np.float32(0.5) + _atan_unit_cuda(x_temp) * np.float32(0.63661977)      # NOTE: 0.63661977 = 1.0 / (np.pi / 2.0)
     
-    if abs(lr_slope_temp) > 1:
-        atan_val = 1.0 - atan_val    
-    if lr_slope_temp < 0:
-        atan_val = -atan_val    
-        
-    return atan_val
+    return math.copysign(atan_val, lr_slope_temp)
 
 # -----------------------------------------------------------------------------------
 #
@@ -356,33 +809,139 @@ def get_lr_slope_vtsf_cuda(
 
     divisor: float = (period**2 * (period - 1.0)**2) / 12.0  # Change the sign to positive, for slope follow the trend.
     sum_x:   float = (period * (period + 1.0)) / 2.0    
-    sum_xy:  float = 0.0
-    sum_y:   float = 0.0   
     
-    start_indx_shft: int = data_indx - period + 1
+    res_arr[res_indx] = _lr_slope_value_cuda(data_arr, period, data_indx, sum_x, 1.0 / divisor)
     
-    for j in range(period):                
-        data_temp: float = data_arr[start_indx_shft + j]
-        sum_y           += data_temp
-        sum_xy          += (j + 1) * data_temp
+    return
 
-    lr_slope_temp = (period * sum_xy - sum_x * sum_y) / divisor
+# -----------------------------------------------------------------------------------
+#
+#   Linear Regression Slope (CUDA) - Range of Indexes, Grid Stride Kernel
+#
+# -----------------------------------------------------------------------------------
+
+_LR_CUDA_THREADS:    int = 256     # Max threads per block of get_lr_slope_range_cuda().
+_LR_CUDA_MAX_PERIOD: int = 256     # Max period for the shared memory tile, longer periods read global memory.
+_LR_CUDA_TILE:       int = _LR_CUDA_THREADS + _LR_CUDA_MAX_PERIOD - 1     # ( float32 ) 2 KB of shared memory.
+
+@cuda.jit()
+def get_lr_slope_range_cuda(
+                            data_arr:    np.ndarray[np.float32],
+                            period:      np.int32,
+                            i_start:     np.int32,
+                            i_end:       np.int32,
+                            sum_x:       np.float32,
+                            inv_divisor: np.float32,
+                            res_arr:     np.ndarray[np.float32],
+                                ) -> None:
+    '''
+    Linear Regression Slope for indexes `[i_start, i_end)`, by updating `res_arr[]`.
+    GPU Kernel, grid stride loop: any grid size covers the whole range with one launch.
+    
+    For `period <= _LR_CUDA_MAX_PERIOD` the block loads its windows ( `threads + period - 1` values ) 
+    into shared memory once, cooperatively, every value is read from global memory once per block, 
+    instead of `period` times.
+    
+    Launch:
+    -------
+    >>> blocks = (i_end - i_start + threads - 1) // threads     # threads <= _LR_CUDA_THREADS
+    >>> get_lr_slope_range_cuda[blocks, threads](d_data_arr, period, i_start, i_end, sum_x, inv_divisor, d_res_arr)
+    
+    Parameters:
+    -----------
+    data_arr:    (`np.ndarray[np.float32]`) : Input data array ( device array ).
+    period:      (`np.int32`)               : Period of linear regression.
+    i_start:     (`np.int32`)               : First index.
+        Warning: **( i_start >= period - 1 )**
+    i_end:       (`np.int32`)               : End index ( exclusive ).
+    sum_x:       (`np.float32`)             : `period * (period + 1) / 2`.
+    inv_divisor: (`np.float32`)             : `12 / (period**2 * (period - 1)**2)`.
+    res_arr:     (`np.ndarray[np.float32]`) : Result array ( device array ).
+        Array updated with slope values, `res_arr[i]` for `data_arr[i]`.
+    '''
     
-    # atan normalized to -1 to 1 calculation:
-    x_temp: float = abs(lr_slope_temp)
-    if x_temp > 1:
-        x_temp = 1.0 / x_temp
+    tile = cuda.shared.array(_LR_CUDA_TILE, dtype = numba.float32)
     
-    atan_val: float = x_temp - (x_temp**3 / 3) + (x_temp**5 / 5) - (x_temp**7 / 7) # NOTE: Taylor series for ArcTan(x)
-    atan_val       *= 0.6366          # NOTE: 0.6366 = 1.0 / (np.pi / 2.0)
+    thread_indx: int  = cuda.threadIdx.x
+    threads:     int  = cuda.blockDim.x
+    use_tile:    bool = period <= _LR_CUDA_MAX_PERIOD
     
-    if abs(lr_slope_temp) > 1:
-        atan_val = 1.0 - atan_val    
-    if lr_slope_temp < 0:
-        atan_val = -atan_val    
+    # Loop over first indexes of the block - same for all threads of the block, `cuda.syncthreads()` is safe.
+    for block_first in range(i_start + cuda.blockIdx.x * threads, i_end, cuda.gridsize(1)):
+        i: int = block_first + thread_indx
+        
+        if use_tile:
+            tile_first: int = block_first - period + 1
+            tile_size:  int = min(threads, i_end - block_first) + period - 1
+            
+            for k in range(thread_indx, tile_size, threads):
+                tile[k] = cuda.ldca(data_arr, tile_first + k)
+            
+            cuda.syncthreads()
+            
+            if i < i_end:
+                sum_xy: float = 0.0
+                sum_y:  float = 0.0
+                
+                for j in range(period):
+                    data_temp: float = tile[thread_indx + j]
+                    sum_y           += data_temp
+                    sum_xy          += (j + 1) * data_temp
+                
+                res_arr[i] = _atan_norm_cuda(np.float32((period * sum_xy - sum_x * sum_y) * inv_divisor))
+            
+            cuda.syncthreads()     # Tile is reused by the next loop.
         
-    res_arr[res_indx] = atan_val
+        elif i < i_end:
+            res_arr[i] = _lr_slope_value_cuda(data_arr, period, i, sum_x, inv_divisor)
+    
+    return
+
+def get_lr_slope_cuda(
+                        data_arr:          np.ndarray[np.float32],
+                        period:            int,
+                        threads_per_block: int = _LR_CUDA_THREADS,
+                            ) -> np.ndarray[np.float32]:
+    '''
+    Linear Regression Slope of the whole array, calculated on GPU.
+    Same layout as `get_lr_slope()`, first `period` values are 0.0.
+    
+    Launches `get_lr_slope_range_cuda()` once for the whole array, 
+    constants of the period are computed once, on the host.
+    
+    Parameters:
+    -----------
+    data_arr:          (`np.ndarray[np.float32]`) : Input data array.
+        Host array, or CUDA device array.
+    period:            (`int`)                    : Period of linear regression.
+    threads_per_block: (`int`)                    : CUDA block size, up to `_LR_CUDA_THREADS`.
+    
+    Returns:
+    --------
+    (`np.ndarray[np.float32]`) : Linear Regression Slope indicator array.
+        If `data_arr` is a device array, result is a device array too.
+    '''
+    
+    is_device:  bool = hasattr(data_arr, '__cuda_array_interface__')
+    d_data_arr       = data_arr if is_device else cuda.to_device(np.ascontiguousarray(data_arr, dtype = np.float32))
+    data_size:  int  = d_data_arr.shape[0]
+    
+    sum_x:       float = period * (period + 1.0) / 2.0
+    inv_divisor: float = 12.0 / (period**2 * (period - 1.0)**2)   # Change the sign to positive, for slope follow the trend.
+    
+    res_arr: np.ndarray[np.float32] = np.zeros(data_size, dtype = np.float32)   # Default value for the first period.
+    d_res_arr                       = cuda.to_device(res_arr)
+    
+    threads_per_block = min(threads_per_block, _LR_CUDA_THREADS)
+    blocks: int       = (data_size - period + threads_per_block - 1) // threads_per_block
+    
+    if blocks > 0:
+        get_lr_slope_range_cuda[blocks, threads_per_block](d_data_arr, period, period, data_size, 
+                                                           np.float32(sum_x), np.float32(inv_divisor), d_res_arr)
+    
+    if is_device:
+        return d_res_arr
     
-    return atan_val
+    return d_res_arr.copy_to_host()
 
 # -----------------------------------------------------------------------------------
@@ -1,18 +1,32 @@
+from __future__ import annotations
+
+import functools
+
 import numpy as np
 import numba
 from numba import cuda
+from numba.extending import intrinsic
+
+from ._constants import L2_TILE_SIZE
 
 
 # -----------------------------------------------------------------------------------
 
 _name_:           str = 'MA BOP OC - TI Lib'
-__version__:      str = '0.0.1'
-__version_date__: str = '2024-09-16'
+__version__:      str = '0.0.2'
+__version_date__: str = '2026-10-15'
 VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}' 
 
 # --- VERSION HISTORY: --------------------------------------------------------------
 
 # v0.0.1 @ 2024-09-16 : Initial Release.
+# v0.0.2 @ 2026-10-15 : Sliding counter of get_mabop_oc_tsf() calculates any sub-range.
+#                       Added get_mabop_oc_tsf_parallel() - multi-core version of get_mabop_oc_tsf().
+#                       Sliding counter on precomputed uint8 up-mask ( one compare per value, 1 byte loads ).
+#                       get_mabop_oc() - prefix sum ( int32 cumsum ) of up-mask, window count is a difference of prefix sums.
+#                       Added get_mabop_oc_dispatch() - kernels specialized by period ( compile cache ).
+#                       get_mabop_oc_vtsf() - float32 locals ( period_step ).
+#                       Sliding counter for period <= 64 - uint64 bit window and popcount ( SWAR ), no subtraction.
 #
 
 # --- CALCULATION DESCRIPTION: -------------------------------------------------------
@@ -44,9 +58,8 @@ _spec_func_numba = numba.types.Array(numba.float32, 1, 'C')(
                                     numba.int32)
 
 _locals_func_numba = {
-        'period_up':  numba.int32,
-        'period_rev': numba.float32,
-        'res_val':    numba.float32, }
+        'data_size':  numba.int32,
+        'period_rev': numba.float32, }
 
 @numba.njit(_spec_func_numba,
             cache       = True, 
@@ -82,27 +95,235 @@ def get_mabop_oc(
     
     result_arr: np.ndarray[np.float32] = np.empty_like(data_arr, dtype = np.float32)
     
-    period_up:  np.int32 = 0
+    data_size:  np.int32   = len(data_arr)
     period_rev: np.float32 = 1.0 / np.float32(period)
-
-    result_arr[0] = 0.5   # Default value for the first period.
     
-    for i in range(1, period + 1):
-        result_arr[i] = 0.5   # Default value for the first period.        
-        period_up    += (data_arr[i] > data_arr[i - 1])        
-        pass
+    # Prefix sum of up-mask: up_cnt[i] - number of rising values in [1 .. i], 
+    # int32 - exact for any length ( float32 cumsum is exact only up to 2**24 ).
+    up_cnt: np.ndarray[np.int32] = np.empty(data_size, dtype = np.int32)
+    up_cnt[0] = 0
+    
+    for i in range(1, data_size):
+        up_cnt[i] = up_cnt[i - 1] + np.int32(data_arr[i] > data_arr[i - 1])
     
-    result_arr[period] = period_rev * period_up 
+    result_arr[:period] = 0.5   # Default value for the first period.
+    
+    # Window count - difference of prefix sums, independent per value ( packed SIMD ).
+    for i in range(period, data_size):
+        result_arr[i] = period_rev * np.float32(up_cnt[i] - up_cnt[i - period])
+    
+    return result_arr
+
+# -----------------------------------------------------------------------------------
+#
+#               MA BOP OC - Specialized by Period ( Compile Cache )
+#
+# -----------------------------------------------------------------------------------
+
+_spec_func_specialized = numba.types.Array(numba.float32, 1, 'C')(
+                            numba.types.Array(numba.float32, 1, 'C', readonly = True, aligned = True), )  # data_arr
 
-    for i in range(period + 1, len(data_arr)):
+@functools.lru_cache(maxsize = 16)
+def _build_mabop_oc_specialized(period: int):
+    '''
+    Build MA BOP OC kernel `(data_arr) -> result_arr` for the fixed period.
+    '''
+    
+    PERIOD:     int        = period
+    PERIOD_REV: np.float32 = np.float32(1.0) / np.float32(period)
+    
+    @numba.njit(_spec_func_specialized,
+                fastmath    = True,
+                nogil       = True,
+                boundscheck = False,
+                error_model = 'numpy', )
+    def _get_mabop_oc_specialized(data_arr: np.ndarray[np.float32]) -> np.ndarray[np.float32]:
         
-        period_up          += (data_arr[i] > data_arr[i - 1])
-        period_up          -= (data_arr[i - period] > data_arr[i - period - 1])        
-        res_val: np.float32 = period_rev * period_up
-        result_arr[i]       = res_val        
-        pass
+        data_size  = len(data_arr)
+        result_arr = np.empty_like(data_arr, dtype = np.float32)
+        
+        # Prefix sum of up-mask ( see `get_mabop_oc()` ).
+        up_cnt    = np.empty(data_size, dtype = np.int32)
+        up_cnt[0] = 0
+        
+        for i in range(1, data_size):
+            up_cnt[i] = up_cnt[i - 1] + np.int32(data_arr[i] > data_arr[i - 1])
+        
+        result_arr[:PERIOD] = np.float32(0.5)  # Default value for the first period.
+        
+        for i in range(PERIOD, data_size):
+            result_arr[i] = PERIOD_REV * np.float32(up_cnt[i] - up_cnt[i - PERIOD])
+        
+        return result_arr
+    
+    return _get_mabop_oc_specialized
 
-    return result_arr
+def get_mabop_oc_dispatch(
+                            data_arr: np.ndarray[np.float32],
+                            period:   int,
+                                ) -> np.ndarray[np.float32]:
+    '''
+    Get MA BOP OC indicator of the given array.
+    Same results as `get_mabop_oc()`, 
+    kernel is compiled for this exact period ( on the first call with the new period ), 
+    so `1 / period` and window offsets are constants.
+    
+    Parameters:
+    -----------
+    data_arr: (`np.ndarray[np.float32]`) : array of values.
+    period:   (`int`)                    : period of MA BOP OC.
+    
+    Returns:
+    --------
+    (`np.ndarray[np.float32]`) : array of MA BOP OC.
+    '''
+    
+    return _build_mabop_oc_specialized(int(period))(data_arr)
+
+# -----------------------------------------------------------------------------------
+#
+#               MA BOP OC: Up-Mask ( Private ):
+#
+# -----------------------------------------------------------------------------------
+
+@numba.njit(fastmath    = True, 
+            nogil       = True,
+            boundscheck = False,
+            inline      = 'always', )
+def _mabop_up_mask(
+                    data_arr: np.ndarray[np.float32],
+                    i_first:  np.int32,
+                    i_end:    np.int32,
+                    mask_arr: np.ndarray[np.uint8],
+                        ) -> None:
+    '''
+    `mask_arr[i - i_first] = data_arr[i] > data_arr[i - 1]` for indexes `[i_first, i_end)`, `i_first >= 1`.
+    
+    Independent per value - vectorized to packed SIMD compares.
+    '''
+    
+    for i in range(i_first, i_end):
+        mask_arr[i - i_first] = np.uint8(data_arr[i] > data_arr[i - 1])
+    
+    return
+
+# -----------------------------------------------------------------------------------
+#
+#               MA BOP OC: Bit Window ( Private, period <= 64 ):
+#
+# -----------------------------------------------------------------------------------
+
+_MABOP_BITS_MAX_PERIOD: int = 64     # Window of up-flags fits a single uint64.
+
+@intrinsic
+def _popcount64(typingctx, bits):
+    '''
+    Number of set bits of uint64 `bits` - `llvm.ctpop.i64` ( `popcnt` on x86 ).
+    '''
+    
+    sig = numba.types.uint64(numba.types.uint64)
+    
+    def codegen(context, builder, signature, args):
+        return builder.ctpop(args[0])
+    
+    return sig, codegen
+
+_locals_range_bits = {
+    'bits':        numba.uint64,
+    'window_mask': numba.uint64,
+    'period_rev':  numba.float32, }
+
+@numba.njit(fastmath    = True, 
+            nogil       = True,
+            boundscheck = False,
+            inline      = 'always',
+            locals      = _locals_range_bits, )
+def _mabop_oc_range_bits(
+                            data_arr:   np.ndarray[np.float32],
+                            period:     np.int32,
+                            i_first:    np.int32,
+                            i_end:      np.int32,
+                            result_arr: np.ndarray[np.float32],
+                                ) -> None:
+    '''
+    MA BOP OC for indexes `[i_first, i_end)`, `i_first >= period`, `period <= 64`.
+    
+    Up-flags of the window are bits of a uint64 ( newest value - bit 0 ), 
+    every step shifts in one flag, count is popcount of the masked window - 
+    no subtraction of the leaving flag, so the counter can NOT drift, no scratch array.
+    '''
+    
+    period_rev:  np.float32 = 1.0 / np.float32(period)
+    window_mask: np.uint64  = np.uint64(0xFFFFFFFFFFFFFFFF) >> np.uint64(_MABOP_BITS_MAX_PERIOD - period)
+    bits:        np.uint64  = 0
+    
+    for i in range(i_first - period + 1, i_first):
+        bits = (bits << np.uint64(1)) | np.uint64(data_arr[i] > data_arr[i - 1])
+    
+    for i in range(i_first, i_end):
+        bits          = ((bits << np.uint64(1)) | np.uint64(data_arr[i] > data_arr[i - 1])) & window_mask
+        result_arr[i] = period_rev * np.float32(_popcount64(bits))
+    
+    return
+
+# -----------------------------------------------------------------------------------
+#
+#               MA BOP OC: Sliding Counter ( Private, shared by tsf versions ):
+#
+# -----------------------------------------------------------------------------------
+
+_locals_range = {
+    'i_mask':     numba.int32,
+    'k':          numba.int32,
+    'period_up':  numba.int32,
+    'period_rev': numba.float32, }
+
+@numba.njit(fastmath    = True, 
+            nogil       = True,
+            boundscheck = False,
+            inline      = 'always',
+            locals      = _locals_range, )
+def _mabop_oc_range(
+                    data_arr:   np.ndarray[np.float32],
+                    period:     np.int32,
+                    i_first:    np.int32,
+                    i_end:      np.int32,
+                    result_arr: np.ndarray[np.float32],
+                        ) -> None:
+    '''
+    MA BOP OC for indexes `[i_first, i_end)`, `i_first >= period`.
+    
+    Counter is seeded on the window of `i_first`, so any sub-range can be calculated independently, 
+    integer counter - results do NOT depend on the split.
+    
+    Up-mask of the range ( and the first window ) is computed once, 
+    the counter adds / subtracts mask bytes - no float compares ( 4 loads ) per step.
+    For `period <= 64` uses the bit window ( see `_mabop_oc_range_bits()` ).
+    '''
+    
+    if period <= _MABOP_BITS_MAX_PERIOD:
+        _mabop_oc_range_bits(data_arr, period, i_first, i_end, result_arr)
+        return
+    
+    period_up:  np.int32   = 0
+    period_rev: np.float32 = 1.0 / np.float32(period)
+    
+    i_mask: np.int32 = i_first - period + 1     # First index of the first window.
+    
+    up_mask = np.empty(i_end - i_mask, dtype = np.uint8)
+    _mabop_up_mask(data_arr, i_mask, i_end, up_mask)
+    
+    for k in range(period):
+        period_up += up_mask[k]
+    
+    result_arr[i_first] = period_rev * period_up
+    
+    for i in range(i_first + 1, i_end):
+        k: np.int32   = i - i_mask
+        period_up    += np.int32(up_mask[k]) - np.int32(up_mask[k - period])
+        result_arr[i] = period_rev * period_up
+    
+    return
 
 # -----------------------------------------------------------------------------------
 #
@@ -117,17 +338,11 @@ _signature_tsf = numba.void(
                     numba.int32,
                     numba.types.Array(numba.float32, 1, 'C', readonly = False, aligned = True), )
 
-_locals_tsf = {
-    'period_up':  numba.int32,
-    'period_rev': numba.float32,
-    'res_val':    numba.float32,  }
-
 @numba.njit(_signature_tsf,
             cache       = True, 
             fastmath    = True, 
             nogil       = True,
-            boundscheck = False,
-            locals      = _locals_tsf,  )
+            boundscheck = False, )
 def get_mabop_oc_tsf(
                         data_arr:   np.ndarray[np.float32],
                         period:     np.int32,
@@ -158,25 +373,72 @@ def get_mabop_oc_tsf(
     if data_size < 0:
         data_size = data_arr.shape[0]
     
-    period_up:  np.int32 = 0
-    period_rev: np.float32 = 1.0 / np.float32(period)
-
-    result_arr[0] = 0.5   # Default value for the first period.
+    for i in range(period):
+        result_arr[i] = 0.5   # Default value for the first period.
     
-    for i in range(1, period + 1):
-        result_arr[i] = 0.5   # Default value for the first period.        
-        period_up    += (data_arr[i] > data_arr[i - 1])
-        pass
+    if period < data_size:
+        _mabop_oc_range(data_arr, period, period, data_size, result_arr)
     
-    result_arr[period] = period_rev * period_up 
+    return
+
+# -----------------------------------------------------------------------------------
+#
+#               MA BOP OC: Moving Average of Balance of Power (Only Close Prices)
+#                  (tsf) - Thread Safe Function, Multi-Core
+#
+# -----------------------------------------------------------------------------------
+
+_MABOP_TILE_SIZE: int = L2_TILE_SIZE
 
-    for i in range(period + 1, data_size):
+_locals_tsf_parallel = {
+    'n_tiles': numba.int32,
+    'i_start': numba.int32,
+    'i_end':   numba.int32, }
+
+@numba.njit(_signature_tsf,
+            cache       = True, 
+            fastmath    = True, 
+            nogil       = True,
+            boundscheck = False,
+            parallel    = True,
+            locals      = _locals_tsf_parallel, )
+def get_mabop_oc_tsf_parallel(
+                                data_arr:   np.ndarray[np.float32],
+                                period:     np.int32,
+                                data_size:  np.int32,
+                                result_arr: np.ndarray[np.float32],                  
+                                        ) -> None:
+    '''
+    Get MA BOP OC indicator of the given array.
+    Parallel version of `get_mabop_oc_tsf()`, runs on all cores.
+    
+    Data is split into tiles of `_MABOP_TILE_SIZE` values, 
+    every tile seeds its own counter on the window of its first index 
+    and is calculated independently in `numba.prange()`.
+    
+    Parameters:
+    -----------
+    data_arr:   (`np.ndarray[np.float32]`) : array of values.
+    period:     (`np.int32`)               : period of MA BOP OC.
+    data_size:  (`np.int32`)               : size of data array.
+    result_arr: (`np.ndarray[np.float32]`) : array of MA BOP OC.
+        Results will be rewritten in this array.
+    '''
+    
+    if data_size < 0:
+        data_size = data_arr.shape[0]
+    
+    for i in range(period):
+        result_arr[i] = 0.5   # Default value for the first period.
+    
+    n_tiles: np.int32 = (data_size + _MABOP_TILE_SIZE - 1) // _MABOP_TILE_SIZE
+    
+    for t in numba.prange(n_tiles):
+        i_start: np.int32 = max(t * _MABOP_TILE_SIZE, period)
+        i_end:   np.int32 = min((t + 1) * _MABOP_TILE_SIZE, data_size)
         
-        period_up          += (data_arr[i] > data_arr[i - 1])
-        period_up          -= (data_arr[i - period] > data_arr[i - period - 1])        
-        res_val: np.float32 = period_rev * period_up
-        result_arr[i]       = res_val
-        pass    
+        if i_start < i_end:
+            _mabop_oc_range(data_arr, period, i_start, i_end, result_arr)
     
     return
 
@@ -193,8 +455,8 @@ _spec_func_vtsf = numba.types.float32(
                     numba.int32, )
 
 _locals_vtsf = {
-        'period_up': numba.int32,
-        'res_val':   numba.float32, }
+        'period_step': numba.float32,
+        'res_val':     numba.float32, }
 
 @numba.njit(_spec_func_vtsf,
             cache       = True, 
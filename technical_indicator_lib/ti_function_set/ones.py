@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import numpy as np
 import numba
 from numba import cuda
@@ -6,13 +8,16 @@ from numba import cuda
 # -----------------------------------------------------------------------------------
 
 _name_:           str = 'ONES'
-__version__:      str = '0.0.1'
-__version_date__: str = '2024-09-16'
+__version__:      str = '0.0.2'
+__version_date__: str = '2026-10-15'
 VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}' 
 
 # --- VERSION HISTORY: --------------------------------------------------------------
 
 # v0.0.1 @ 2024-09-16 : Initial Release.
+# v0.0.2 @ 2026-10-15 : Added get_ones_view() - read only view, no allocation.
+#                       get_ones_tsf() - slice fill ( vectorized stores ) instead of scalar loop.
+#                       get_ones_vtsf() - inlined into Numba callers ( constant result ).
 #
 
 # --- CALCULATION DESCRIPTION: -------------------------------------------------------
@@ -55,6 +60,32 @@ def get_ones(
     '''    
     return np.ones(len(data), dtype = np.float32)
 
+def get_ones_view(
+                    data:   np.ndarray[np.float32],             
+                    period: int = 0, 
+                        ) -> np.ndarray[np.float32]:
+    '''
+    Get array of ONES, as read only view.
+    
+    Pure Python ( `np.broadcast_to()` is not supported by Numba ), 
+    view of a single float32 value - no allocation, no memset.
+    Use `get_ones()` if the result is modified, or is used inside Numba functions.
+    
+    Parameters:
+    -----------
+    data:   (`np.ndarray[np.float32]`) : Input data array.
+        Not Used, just to return array of ones, 
+            with same length as input data.
+    period: (`int`)                    : Period, Not used.
+    
+    ---
+    
+    Returns:
+    --------
+    (`np.ndarray[np.float32]`) : Read only array of ones ( strides = 0 ).
+    '''    
+    return np.broadcast_to(np.float32(1.0), (len(data), ))
+
 # -----------------------------------------------------------------------------------
 #
 #              ONES (tsf) - Thread Safe Function
@@ -81,8 +112,7 @@ def get_ones_tsf(
     if data_size < 0:
         data_size = data.shape[0]
     
-    for i in range(data_size):
-        result_arr[i] = 1.0
+    result_arr[:data_size] = np.float32(1.0)
     
     return
 
@@ -100,12 +130,19 @@ _spec_func_vtsf = numba.types.float32(
 @numba.njit(_spec_func_vtsf,
             cache       = True, 
             nogil       = True,
-            boundscheck = False, )
+            boundscheck = False,
+            inline      = 'always', )
 def get_ones_vtsf(
                     data_arr:   np.ndarray[np.float32],
                     period:     np.int32,
                     data_indx:  np.int32,
                         ) -> np.float32:
-    return 1.0
+    '''
+    Get single value of ONES, i.e. 1.0.
+    
+    Inlined into Numba callers ( `inline = 'always'` ), 
+    the float32 literal is constant-folded there, e.g. `x * get_ones_vtsf(...)` -> `x`.
+    '''
+    return np.float32(1.0)
 
 # -----------------------------------------------------------------------------------
\ No newline at end of file
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import numpy as np
 import numba
 from numba import cuda
@@ -6,13 +8,23 @@ from numba import cuda
 # -----------------------------------------------------------------------------------
 
 _name_:           str = 'Percent Change - TI Lib'
-__version__:      str = '0.0.1'
-__version_date__: str = '2024-09-16'
+__version__:      str = '0.0.2'
+__version_date__: str = '2026-10-15'
 VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}' 
 
 # --- VERSION HISTORY: --------------------------------------------------------------
 
 # v0.0.1 @ 2024-09-16 : Initial Release.
+# v0.0.2 @ 2026-10-15 : Added get_pcnt_ch_np() - pure NumPy version ( single divide ufunc ).
+#                       get_pcnt_ch() - float32 literal ( no float64 promotion in the loop ).
+#                       Added get_pcnt_ch_tsf_parallel() - multi-core version of get_pcnt_ch_tsf().
+#                       period == 1 fast path ( _pcnt_ch_p1(), get_pcnt_ch_p1() ) - previous value carried in a register.
+#                       Added get_pcnt_ch_range_cuda() - GPU grid stride kernel, get_pcnt_ch_cuda() - host function.
+#                       Added get_pcnt_ch_batch() - multi-asset, rows in parallel.
+#                       get_pcnt_ch() is NOT force inlined ( array version, inlining is left to LLVM ).
+#                       Added get_pcnt_ch_mul() - NumPy version, reciprocal pass + multiply ( no divide in the main pass ).
+#                       Added get_pcnt_ch_v() - multi-core Numba ufunc ( @numba.vectorize, target = 'parallel' ).
+#                       Added get_pcnt_ch_multi_tsf() - several periods in one pass over data.
 #
 
 # --- CALCULATION DESCRIPTION: -------------------------------------------------------
@@ -26,6 +38,42 @@ VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date_
 #
 # -----------------------------------------------------------------------------------
 
+_signature_p1 = numba.void(
+                    numba.types.Array(numba.float32, 1, 'C', readonly = True,  aligned = True),
+                    numba.int32,
+                    numba.types.Array(numba.float32, 1, 'C', readonly = False, aligned = True), )
+
+_locals_p1 = {
+    'prev_val': numba.float32,
+    'curr_val': numba.float32, }
+
+@numba.njit(_signature_p1,
+            cache       = True, 
+            fastmath    = True, 
+            nogil       = True,
+            boundscheck = False,
+            inline      = 'always',
+            locals      = _locals_p1, )
+def _pcnt_ch_p1(
+                data_arr:   np.ndarray[np.float32],
+                data_size:  np.int32,
+                result_arr: np.ndarray[np.float32],
+                    ) -> None:
+    '''
+    Percent Change for period == 1 ( most common case ).
+    No `i - period` indexing, previous value carried in a register - one load per value.
+    '''
+    
+    result_arr[0] = 0.0     # Default value for the first period.
+    prev_val      = data_arr[0]
+    
+    for i in range(1, data_size):
+        curr_val      = data_arr[i]
+        result_arr[i] = (curr_val / prev_val) - np.float32(1.0)
+        prev_val      = curr_val
+    
+    return
+
 _spec_func_numba = numba.types.Array(numba.float32, 1, 'C', aligned = True)(
                                     numba.types.Array(numba.float32, 1, 'C', readonly = True, aligned = True), 
                                     numba.int32,  )
@@ -34,8 +82,7 @@ _spec_func_numba = numba.types.Array(numba.float32, 1, 'C', aligned = True)(
             cache       = True, 
             fastmath    = True, 
             nogil       = True,
-            boundscheck = False,
-            inline      = 'always', )
+            boundscheck = False, )
 def get_pcnt_ch(
                 data_arr: np.ndarray[np.float32],
                 period:   np.int32,
@@ -56,11 +103,166 @@ def get_pcnt_ch(
     '''
 
     result_arr          = np.empty_like(data_arr, dtype = np.float32)    
+    
+    if period == 1 and len(data_arr) > 0:
+        _pcnt_ch_p1(data_arr, len(data_arr), result_arr)
+        return result_arr
+    
     result_arr[:period] = 0.0       # Default value for the first period.
 
     for i in range(period, len(data_arr)):
-        result_arr[i] = (data_arr[i] / data_arr[i - period]) - 1.0
+        result_arr[i] = (data_arr[i] / data_arr[i - period]) - np.float32(1.0)
+
+    return result_arr
 
+def get_pcnt_ch_p1(
+                    data_arr: np.ndarray[np.float32],
+                        ) -> np.ndarray[np.float32]:
+    '''
+    Get Percent Change of given data array, period == 1.
+    Same results as `get_pcnt_ch(data_arr, 1)`, 
+    calculated with NumPy ufuncs written straight into the result array ( `out=` ) - no temporary arrays.
+    
+    ---
+    
+    Parameters:
+    -----------
+    data_arr: (`np.ndarray[np.float32]`) : Input data array.
+    
+    Returns:
+    --------
+    (`np.ndarray[np.float32]`) : Percent Change array.    
+    '''
+    
+    data_arr = np.ascontiguousarray(data_arr, dtype = np.float32)
+    
+    result_arr     = np.empty_like(data_arr, dtype = np.float32)
+    result_arr[:1] = 0.0        # Default value for the first period.
+    
+    res_view = result_arr[1:]
+    np.divide(data_arr[1:], data_arr[:-1], out = res_view)
+    np.subtract(res_view, np.float32(1.0), out = res_view)
+    
+    return result_arr
+
+def get_pcnt_ch_np(
+                    data_arr: np.ndarray[np.float32],
+                    period:   int,
+                        ) -> np.ndarray[np.float32]:
+    '''
+    Get Percent Change. of given data array.
+    Same results as `get_pcnt_ch()`, 
+    calculated with NumPy ufuncs ( `np.divide()`, `np.subtract()` ) in place - no Python loop, no temporary arrays.
+    
+    ---
+    
+    Parameters:
+    -----------
+    data_arr: (`np.ndarray[np.float32]`) : Input data array.
+    period:   (`int`)                    : Period.
+        **( period >= 1 )**
+    
+    Returns:
+    --------
+    (`np.ndarray[np.float32]`) : Percent Change array.    
+    '''
+    
+    period = int(period)
+    
+    if period == 1:
+        return get_pcnt_ch_p1(data_arr)
+    
+    data_arr = np.ascontiguousarray(data_arr, dtype = np.float32)
+    
+    result_arr          = np.empty_like(data_arr, dtype = np.float32)
+    result_arr[:period] = 0.0       # Default value for the first period.
+    
+    if period < data_arr.shape[0]:
+        res_view = result_arr[period:]
+        np.divide(data_arr[period:], data_arr[:-period], out = res_view)
+        np.subtract(res_view, np.float32(1.0), out = res_view)
+    
+    return result_arr
+
+def get_pcnt_ch_mul(
+                    data_arr: np.ndarray[np.float32],
+                    period:   int,
+                        ) -> np.ndarray[np.float32]:
+    '''
+    Get Percent Change. of given data array.
+    Same as `get_pcnt_ch_np()`, but without division in the main pass: 
+    reciprocals `1.0 / data_arr[i]` are computed once ( `np.reciprocal()` ), 
+    then `result[i] = data_arr[i] * inv[i - period] - 1.0` ( multiply + subtract only ).
+    
+    NOTE: Result may differ from `get_pcnt_ch()` in the last bit ( two roundings, reciprocal + multiply ).
+        Faster on compute bound ( cache resident ) data, on long arrays the extra `inv` pass is a wash.
+    
+    ---
+    
+    Parameters:
+    -----------
+    data_arr: (`np.ndarray[np.float32]`) : Input data array.
+    period:   (`int`)                    : Period.
+        **( period >= 1 )**
+    
+    Returns:
+    --------
+    (`np.ndarray[np.float32]`) : Percent Change array.    
+    '''
+    
+    data_arr = np.ascontiguousarray(data_arr, dtype = np.float32)
+    period   = int(period)
+    
+    result_arr          = np.empty_like(data_arr, dtype = np.float32)
+    result_arr[:period] = 0.0       # Default value for the first period.
+    
+    if period < data_arr.shape[0]:
+        inv_arr  = np.reciprocal(data_arr[:-period])
+        res_view = result_arr[period:]
+        np.multiply(data_arr[period:], inv_arr, out = res_view)
+        np.subtract(res_view, np.float32(1.0), out = res_view)
+    
+    return result_arr
+
+@numba.vectorize([numba.float32(numba.float32, numba.float32)], target = 'parallel', fastmath = True)
+def _pcnt_ch_ufunc(curr_val: np.float32, prev_val: np.float32) -> np.float32:
+    '''Percent Change `curr_val / prev_val - 1.0` - NumPy ufunc, multi-core.'''
+    return (curr_val / prev_val) - np.float32(1.0)
+
+def get_pcnt_ch_v(
+                    data_arr: np.ndarray[np.float32],
+                    period:   int,
+                        ) -> np.ndarray[np.float32]:
+    '''
+    Get Percent Change. of given data array.
+    Same results as `get_pcnt_ch()`, 
+    calculated with a Numba ufunc ( `@numba.vectorize`, target = 'parallel' ) - 
+    one fused divide / subtract pass, SIMD and multi-core, written straight into the result ( `out=` ).
+    
+    NOTE: Multi-core ufunc, pays off on long arrays only.
+    
+    ---
+    
+    Parameters:
+    -----------
+    data_arr: (`np.ndarray[np.float32]`) : Input data array.
+    period:   (`int`)                    : Period.
+        **( period >= 1 )**
+    
+    Returns:
+    --------
+    (`np.ndarray[np.float32]`) : Percent Change array.    
+    '''
+    
+    data_arr = np.ascontiguousarray(data_arr, dtype = np.float32)
+    period   = int(period)
+    
+    result_arr          = np.empty_like(data_arr, dtype = np.float32)
+    result_arr[:period] = 0.0       # Default value for the first period.
+    
+    if period < data_arr.shape[0]:
+        _pcnt_ch_ufunc(data_arr[period:], data_arr[:-period], out = result_arr[period:])
+    
     return result_arr
 
 # -----------------------------------------------------------------------------------
@@ -107,6 +309,10 @@ def get_pcnt_ch_tsf(
     if data_size < 0:
         data_size = data.shape[0]
     
+    if period == 1 and data_size > 0:
+        _pcnt_ch_p1(data, data_size, result_arr)
+        return
+    
     for i in range(period):
         result_arr[i] = 0.0     # Default value for the first period.
 
@@ -116,6 +322,165 @@ def get_pcnt_ch_tsf(
 
     return
 
+# -----------------------------------------------------------------------------------
+#
+#             Percent Change (tsf) - Thread Safe Function, Multi-Core
+#
+# -----------------------------------------------------------------------------------
+
+@numba.njit(_signature_tsf,
+            cache       = True, 
+            fastmath    = True, 
+            nogil       = True,
+            boundscheck = False,
+            parallel    = True, )
+def get_pcnt_ch_tsf_parallel(    
+                                data:       np.ndarray[np.float32], 
+                                period:     np.int32,
+                                data_size:  np.int32,
+                                result_arr: np.ndarray[np.float32],
+                                    ) -> None:
+    '''
+    Get Percent Change. of given data array.
+    Parallel version of `get_pcnt_ch_tsf()`, runs on all cores.
+    
+    Values are independent ( no loop carried state ), 
+    index range is split between threads by `numba.prange()`.
+    
+    ---
+    
+    Parameters:
+    -----------
+    data:       (`np.ndarray[np.float32]`) : Input data array.
+    period:     (`np.int32`)               : Period.
+    data_size:  (`np.int32`)               : Data size.
+    result_arr: (`np.ndarray[np.float32]`) : Result array.
+        Result data will be rewritten in the same array.
+    '''
+    
+    if data_size < 0:
+        data_size = data.shape[0]
+    
+    for i in range(period):
+        result_arr[i] = 0.0     # Default value for the first period.
+    
+    for i in numba.prange(period, data_size):
+        result_arr[i] = (data[i] / data[i - period]) - np.float32(1.0)
+    
+    return
+
+# -----------------------------------------------------------------------------------
+#
+#          Percent Change (batch) - Multi-Asset, Parallel ( Multi-Core )
+#
+# -----------------------------------------------------------------------------------
+
+_spec_func_batch = numba.types.Array(numba.float32, 2, 'C')(
+                    numba.types.Array(numba.float32, 2, 'C', readonly = True, aligned = True),  # data_mat
+                    numba.int32, )                                                              # period
+
+@numba.njit(_spec_func_batch,
+            cache        = True, 
+            fastmath     = True, 
+            nogil        = True,
+            boundscheck  = False,
+            parallel     = True, )
+def get_pcnt_ch_batch(
+                    data_mat: np.ndarray[np.float32],
+                    period:   np.int32,
+                        ) -> np.ndarray[np.float32]:
+    '''
+    Get Percent Change for many assets in one call.
+    Rows ( assets ) are calculated in parallel in `numba.prange()`,
+    each row gives the same result as `get_pcnt_ch()`.
+    
+    Parameters:
+    -----------
+    data_mat: (`np.ndarray[np.float32]`) : 2D array of values, shape ( n_assets, n_bars ).
+        Row-major ( C ), so every row is contiguous.
+    period:   (`np.int32`)               : period of Percent Change.
+    
+    Returns:
+    --------
+    (`np.ndarray[np.float32]`) : 2D array of Percent Change, shape ( n_assets, n_bars ).
+    '''
+    
+    n_assets: int = data_mat.shape[0]
+    n_bars:   int = data_mat.shape[1]
+    
+    result_mat: np.ndarray[np.float32] = np.empty((n_assets, n_bars), dtype = np.float32)
+    
+    for a in numba.prange(n_assets):
+        get_pcnt_ch_tsf(data_mat[a], period, n_bars, result_mat[a])
+    
+    return result_mat
+
+# -----------------------------------------------------------------------------------
+#
+#             Percent Change (multi tsf) - Many periods, one pass over data
+#
+# -----------------------------------------------------------------------------------
+
+_signature_multi_tsf = numba.void(
+                    numba.types.Array(numba.float32, 1, 'C', readonly = True,  aligned = True),     # data
+                    numba.types.Array(numba.int32,   1, 'C', readonly = True,  aligned = True),     # periods
+                    numba.int32,                                                                    # data_size
+                    numba.types.Array(numba.float32, 2, 'C', readonly = False, aligned = True), )   # result_mat
+
+_locals_multi_tsf = {
+    'curr_val': numba.float32,
+    'period':   numba.int32, }
+
+@numba.njit(_signature_multi_tsf,
+            cache       = True, 
+            fastmath    = True, 
+            nogil       = True,
+            boundscheck = False,
+            locals      = _locals_multi_tsf, )
+def get_pcnt_ch_multi_tsf(    
+                            data:       np.ndarray[np.float32], 
+                            periods:    np.ndarray[np.int32],
+                            data_size:  np.int32,
+                            result_mat: np.ndarray[np.float32],
+                                ) -> None:
+    '''
+    Get Percent Change for several periods ( e.g. 1, 5, 20 ) in one pass over data.
+    Row `result_mat[k]` is equal to `get_pcnt_ch_tsf()` with `periods[k]`.
+    
+    Every `data[i]` is read once, kept in a register, and used for all periods - 
+    instead of one pass over data per period.
+    
+    Thread Safe Function.
+    
+    ---
+    
+    Parameters:
+    -----------
+    data:       (`np.ndarray[np.float32]`) : Input data array.
+    periods:    (`np.ndarray[np.int32]`)   : Periods, K values.
+    data_size:  (`np.int32`)               : Data size.
+    result_mat: (`np.ndarray[np.float32]`) : 2D Result array, shape ( K, data_size ).
+        Result data will be rewritten in the same array.
+    '''
+    
+    if data_size < 0:
+        data_size = data.shape[0]
+    
+    n_periods: int = periods.shape[0]
+    
+    for k in range(n_periods):
+        result_mat[k, :min(periods[k], data_size)] = 0.0     # Default value for the first period.
+    
+    for i in range(data_size):
+        curr_val = data[i]
+        
+        for k in range(n_periods):
+            period = periods[k]
+            if i >= period:
+                result_mat[k, i] = (curr_val / data[i - period]) - np.float32(1.0)
+    
+    return
+
 # -----------------------------------------------------------------------------------
 #
 #             Percent Change (vtsf) - Single Value, Thread Safe Function
@@ -181,4 +546,92 @@ def get_pcnt_ch_vtsf_cuda(
     
     return
 
+# -----------------------------------------------------------------------------------
+#
+#             Percent Change (GPU) - Whole Array, one launch
+#
+# -----------------------------------------------------------------------------------
+
+@cuda.jit()
+def get_pcnt_ch_range_cuda(
+                            data:    np.ndarray[np.float32],
+                            period:  np.int32,
+                            i_start: np.int32,
+                            i_end:   np.int32,
+                            res_arr: np.ndarray[np.float32],
+                                ) -> None:
+    '''
+    Get Percent Change values for indexes `[i_start, i_end)`, by updating `res_arr[]`.
+    GPU Kernel, grid stride loop: any grid size covers the whole range with one launch.
+    
+    Launch:
+    -------
+    >>> blocks = (i_end - i_start + threads - 1) // threads
+    >>> get_pcnt_ch_range_cuda[blocks, threads](d_data, period, i_start, i_end, d_res_arr)
+    
+    Parameters:
+    -----------
+    data:    (`np.ndarray[np.float32]`) : Input data array ( device array ).
+    period:  (`np.int32`)               : Period.
+    i_start: (`np.int32`)               : First index.
+        Indexes `i < period` are set to 0.0 ( default value for the first period ).
+    i_end:   (`np.int32`)               : End index ( exclusive ).
+    res_arr: (`np.ndarray[np.float32]`) : Result Array ( device array ).
+        Array updated with Percent Change values, `res_arr[i]` for `data[i]`.
+    '''
+    
+    grid_indx:   int = cuda.grid(1)
+    grid_stride: int = cuda.gridsize(1)
+    
+    for i in range(i_start + grid_indx, i_end, grid_stride):
+        res_val: np.float32 = 0.0
+        
+        if i >= period:
+            res_val = (data[i] / data[i - period]) - 1.0
+        
+        res_arr[i] = res_val
+    
+    return
+
+def get_pcnt_ch_cuda(
+                        data:              np.ndarray[np.float32],
+                        period:            int,
+                        threads_per_block: int = 256,
+                            ) -> np.ndarray[np.float32]:
+    '''
+    Get Percent Change of the given array, calculated on GPU.
+    Same layout as `get_pcnt_ch()`, first `period` values are 0.0.
+    
+    Launches `get_pcnt_ch_range_cuda()` once for the whole array, 
+    instead of one `get_pcnt_ch_vtsf_cuda()` launch per value.
+    
+    Parameters:
+    -----------
+    data:              (`np.ndarray[np.float32]`) : Input data array.
+        Host array, or CUDA device array.
+    period:            (`int`)                    : Period.
+    threads_per_block: (`int`)                    : CUDA block size.
+    
+    Returns:
+    --------
+    (`np.ndarray[np.float32]`) : Percent Change array.
+        If `data` is a device array, result is a device array too.
+    '''
+    
+    is_device: bool = hasattr(data, '__cuda_array_interface__')
+    d_data          = data if is_device else cuda.to_device(np.ascontiguousarray(data, dtype = np.float32))
+    data_size: int  = d_data.shape[0]
+    
+    d_res_arr = cuda.device_array(data_size, dtype = np.float32)   # Every value is written by the kernel.
+    
+    blocks: int = (data_size + threads_per_block - 1) // threads_per_block
+    
+    if blocks > 0:
+        get_pcnt_ch_range_cuda[blocks, threads_per_block](d_data, period, 0, data_size, d_res_arr)
+    
+    if is_device:
+        return d_res_arr
+    
+    return d_res_arr.copy_to_host()
+
 # -----------------------------------------------------------------------------------
\ No newline at end of file
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import numpy as np
 import numba
 from numba import cuda
@@ -6,13 +8,26 @@ from numba import cuda
 # -----------------------------------------------------------------------------------
 
 _name_:           str = 'RSI - TI Lib'
-__version__:      str = '0.0.1'
-__version_date__: str = '2024-09-16'
+__version__:      str = '0.0.2'
+__version_date__: str = '2026-10-15'
 VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}' 
 
 # --- VERSION HISTORY: --------------------------------------------------------------
 
 # v0.0.1 @ 2024-09-16 : Initial Release.
+# v0.0.2 @ 2026-10-15 : Branchless gain / loss split ( max(diff, 0), max(-diff, 0) ) in all versions.
+#                       Previous value carried in a local, gain / loss EMA updated as two independent FMAs.
+#                       Added get_rsi_np() - NumPy ufunc diff / max split, short Numba IIR for the two EMAs.
+#                       EMA in incremental form accum += (x - accum) * multiplier - no multiplier_2 in the loop.
+#                       float64 accumulators / multiplier ( input and output arrays stay float32 ).
+#                       Added get_rsi_indexes_cuda() - many RSI values per block, data staged in shared memory tiles.
+#                       Added get_rsi_batch() - multi-asset, rows in parallel.
+#                       get_rsi() is NOT force inlined ( array version, inlining is left to LLVM ).
+#                       Added get_rsi_u8() - RSI rounded to uint8, get_rsi_mask_lt() - uint8 threshold scan.
+#                       Added get_rsi_state_step() - O(1) incremental single value, state kept by the caller.
+#                       Branchless RSI value from accumulators ( _rsi_value(), select instead of a branch ).
+#                       get_rsi_np() - gains / losses in one pass each, multi-core ufuncs ( @numba.vectorize ).
+#                       Added get_rsi_batch_symbols() - multi-asset, symbols on the fast axis ( SIMD lanes ), chunked.
 #
 
 # --- CALCULATION DESCRIPTION: -------------------------------------------------------
@@ -27,6 +42,32 @@ VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date_
 # rsi = 100.0 * (accum_gain) / ((accum_loss + accum_gain))
 # rsi = 100.0 * (accum_gain) / (accum_loss + accum_gain)
 
+# -----------------------------------------------------------------------------------
+#
+#               RSI - Value from accumulators ( Private )
+#
+# -----------------------------------------------------------------------------------
+
+@numba.njit(numba.float32(numba.float64, numba.float64),
+            cache       = True, 
+            fastmath    = True, 
+            nogil       = True,
+            boundscheck = False,
+            inline      = 'always', )
+def _rsi_value(
+                accum_gain: np.float64,
+                accum_loss: np.float64,
+                    ) -> np.float32:
+    '''
+    RSI value `100 * gain / (gain + loss)`, 50.0 if there was no move ( gain + loss == 0 ).
+    Branchless: division by a clamped denominator is always safe, result is selected ( blendv ).
+    '''
+    
+    accum_range = accum_gain + accum_loss
+    res_val     = 100.0 * accum_gain / max(accum_range, 1e-300)
+    
+    return np.float32(res_val) if accum_range > 0.0 else np.float32(50.0)
+
 # -----------------------------------------------------------------------------------
 #
 #               RSI: Relative Strength Index
@@ -38,18 +79,19 @@ _spec_func_numba = numba.types.Array(numba.float32, 1, 'C')(
                 numba.int32)
 
 _locals_func_numba = {                       
-        'accum_gain':   numba.float32,
-        'accum_loss':   numba.float32,
-        'multiplier':   numba.float32,
-        'multiplier_2': numba.float32,
-        'diff':         numba.float32,  }
+        'accum_gain':   numba.float64,
+        'accum_loss':   numba.float64,
+        'multiplier':   numba.float64,
+        'res_val':      numba.float32,
+        'diff':         numba.float32,
+        'd_prev':       numba.float32,
+        'd_curr':       numba.float32,  }
 
 @numba.njit(_spec_func_numba,
             cache       = True, 
             fastmath    = True, 
             nogil       = True,
             boundscheck = False,
-            inline      = 'always',
             locals      = _locals_func_numba, )
 def get_rsi(
             data:   np.ndarray[np.float32],             
@@ -71,54 +113,258 @@ def get_rsi(
     '(result[i] - in range [0.0 .. 100.0])'    
     '''
     
-    multiplier:   np.float32 = 1.0 / period
-    multiplier_2: np.float32 = 1.0 - multiplier
+    multiplier: np.float64 = 1.0 / period
     
     result_arr: np.ndarray[np.float32] = np.empty_like(data, dtype = np.float32)
     
     # Calculate initial average gain and loss.
-    accum_gain: np.float32 = 0.0
-    accum_loss: np.float32 = 0.0
+    accum_gain: np.float64 = 0.0
+    accum_loss: np.float64 = 0.0
         
     result_arr[0] = 50.0 # Default value for the first period.
     
+    d_prev = data[0]  # NOTE: Previous value carried in a register - one load per step.
+    
     for i in range(1, period):
         
         result_arr[i] = 50.0 # Default value for the first period.
         
-        diff = data[i] - data[i - 1]
-        if diff > 0.0:
-            accum_gain += diff
-        else:
-            accum_loss -= diff
-            pass
+        d_curr = data[i]
+        diff   = d_curr - d_prev
+        d_prev = d_curr
         
-        pass
+        accum_gain += max(diff, np.float32(0.0))   # Branchless split ( maxss ).
+        accum_loss += max(-diff, np.float32(0.0))
 
     accum_gain *= multiplier
     accum_loss *= multiplier
     
     for i in range(period, len(data)):
-        diff        = data[i] - data[i - 1]        
-        accum_gain *= multiplier_2
-        accum_loss *= multiplier_2                
-        diff       *= multiplier  # NOTE: Diff scaled in advanced here.
+        d_curr = data[i]
+        diff   = d_curr - d_prev
+        d_prev = d_curr
         
-        if diff > 0.0:
-            accum_gain += diff
-        else:
-            accum_loss -= diff
+        # Two independent first-order IIR filters - no shared dependency, issued back-to-back.
+        # Wilder EMA: accum = accum * (1 - m) + x * m  ==  accum + (x - accum) * m
+        accum_gain += (max(diff, np.float32(0.0)) - accum_gain) * multiplier
+        accum_loss += (max(-diff, np.float32(0.0)) - accum_loss) * multiplier
         
-        res_val: np.float32 = 50.0
+        res_val = _rsi_value(accum_gain, accum_loss)
         
-        accum_range: np.float32 = accum_gain + accum_loss
-        if accum_range > 0.0:
-            res_val = 100.0 * accum_gain / accum_range
+        result_arr[i] = res_val
+    
+    return result_arr
+
+# -----------------------------------------------------------------------------------
+#
+#             RSI (np) - NumPy preprocessing + Numba IIR
+#
+# -----------------------------------------------------------------------------------
+
+_signature_iir = numba.void(
+                    numba.types.Array(numba.float32, 1, 'C', readonly = True,  aligned = True),
+                    numba.types.Array(numba.float32, 1, 'C', readonly = True,  aligned = True),
+                    numba.int32,
+                    numba.float32,
+                    numba.types.Array(numba.float32, 1, 'C', readonly = False, aligned = True), )
+
+_locals_iir = {
+        'multiplier_2': numba.float64,
+        'accum_gain':   numba.float64,
+        'accum_loss':   numba.float64,
+        'res_val':      numba.float32, }
+
+@numba.njit(_signature_iir,
+            cache       = True, 
+            fastmath    = True, 
+            nogil       = True,
+            boundscheck = False,
+            locals      = _locals_iir, )
+def _rsi_iir(
+                pos_arr:    np.ndarray[np.float32],
+                neg_arr:    np.ndarray[np.float32],
+                period:     np.int32,
+                multiplier: np.float32,
+                result_arr: np.ndarray[np.float32],
+                    ) -> None:
+    '''
+    Wilder EMA of pre-scaled gains / losses ( `pos_arr`, `neg_arr` already multiplied by `multiplier` ).
+    Only the scalar recurrence is left here - it reads two contiguous float32 streams.
+    '''
+    
+    multiplier_2: np.float64 = 1.0 - multiplier
+    
+    accum_gain: np.float64 = 0.0
+    accum_loss: np.float64 = 0.0
+    
+    for i in range(1, period):
+        accum_gain += pos_arr[i]
+        accum_loss += neg_arr[i]
+    
+    for i in range(period, pos_arr.shape[0]):
+        accum_gain = accum_gain * multiplier_2 + pos_arr[i]
+        accum_loss = accum_loss * multiplier_2 + neg_arr[i]
+        
+        res_val = _rsi_value(accum_gain, accum_loss)
         
         result_arr[i] = res_val
     
+    return
+
+_ufunc_sig = [numba.float32(numba.float32, numba.float32, numba.float32)]
+
+@numba.vectorize(_ufunc_sig, target = 'parallel', fastmath = True)
+def _rsi_gain_ufunc(d_curr: np.float32, d_prev: np.float32, multiplier: np.float32) -> np.float32:
+    '''Scaled gain `max(d_curr - d_prev, 0) * multiplier` - NumPy ufunc, multi-core.'''
+    return max(d_curr - d_prev, np.float32(0.0)) * multiplier
+
+@numba.vectorize(_ufunc_sig, target = 'parallel', fastmath = True)
+def _rsi_loss_ufunc(d_curr: np.float32, d_prev: np.float32, multiplier: np.float32) -> np.float32:
+    '''Scaled loss `max(d_prev - d_curr, 0) * multiplier` - NumPy ufunc, multi-core.'''
+    return max(d_prev - d_curr, np.float32(0.0)) * multiplier
+
+def get_rsi_np(
+                data:   np.ndarray[np.float32],
+                period: int,
+                    ) -> np.ndarray[np.float32]:
+    '''
+    Get RSI of the given array.
+    Same results as `get_rsi()`, 
+    diff and gain / loss split done with Numba ufuncs ( one fused, multi-core pass each ),
+    only the EMA recurrence runs in a short Numba loop.
+    
+    ---
+    
+    Parameters:
+    -----------
+    data:   (`np.ndarray[np.float32]`) : array of values.
+    period: (`int`)                    : period of RSI.
+    
+    Returns:
+    --------
+    result: (`np.ndarray[np.float32]`) : array of RSI.
+    '(result[i] - in range [0.0 .. 100.0])'
+    '''
+    
+    data       = np.ascontiguousarray(data, dtype = np.float32)
+    period     = int(period)
+    multiplier = np.float32(1.0 / period)
+    data_size  = data.shape[0]
+    
+    result_arr          = np.empty_like(data, dtype = np.float32)
+    result_arr[:period] = 50.0      # Default value for the first period.
+    
+    if data_size <= period:
+        return result_arr
+    
+    # Diff scaled in advance, split into gains / losses.
+    pos_arr    = np.empty_like(data, dtype = np.float32)
+    neg_arr    = np.empty_like(data, dtype = np.float32)
+    pos_arr[0] = 0.0
+    neg_arr[0] = 0.0
+    _rsi_gain_ufunc(data[1:], data[:-1], multiplier, out = pos_arr[1:])
+    _rsi_loss_ufunc(data[1:], data[:-1], multiplier, out = neg_arr[1:])
+    
+    _rsi_iir(pos_arr, neg_arr, np.int32(period), multiplier, result_arr)
+    
+    return result_arr
+
+# -----------------------------------------------------------------------------------
+#
+#             RSI (u8) - Quantized to uint8, for bulk screening
+#
+# -----------------------------------------------------------------------------------
+
+_spec_func_u8 = numba.types.Array(numba.uint8, 1, 'C')(
+                numba.types.Array(numba.float32, 1, 'C', readonly = True, aligned = True), 
+                numba.int32)
+
+@numba.njit(_spec_func_u8,
+            cache       = True, 
+            fastmath    = True, 
+            nogil       = True,
+            boundscheck = False,
+            locals      = _locals_func_numba, )
+def get_rsi_u8(
+                data:   np.ndarray[np.float32],             
+                period: np.int32, 
+                    ) -> np.ndarray[np.uint8]:
+    '''
+    Get RSI of the given array, rounded to `np.uint8`.
+    Same EMA as `get_rsi()`, only the stored value is quantized ( error <= 0.5 ).
+    1 byte per value - 4x less memory for downstream scans ( see `get_rsi_mask_lt()` ).
+    
+    ---
+    
+    Parameters:
+    -----------
+    data:   (`np.ndarray[np.float32]`) : array of values.
+    period: (`np.int32`)               : period of RSI.
+    
+    Returns:
+    --------
+    result: (`np.ndarray[np.uint8]`) : array of RSI.
+    '(result[i] - in range [0 .. 100])'    
+    '''
+    
+    multiplier: np.float64 = 1.0 / period
+    
+    result_arr: np.ndarray[np.uint8] = np.empty(len(data), dtype = np.uint8)
+    
+    accum_gain: np.float64 = 0.0
+    accum_loss: np.float64 = 0.0
+    
+    result_arr[:period] = 50    # Default value for the first period.
+    
+    d_prev = data[0]
+    
+    for i in range(1, period):
+        d_curr = data[i]
+        diff   = d_curr - d_prev
+        d_prev = d_curr
+        
+        accum_gain += max(diff, np.float32(0.0))
+        accum_loss += max(-diff, np.float32(0.0))
+    
+    accum_gain *= multiplier
+    accum_loss *= multiplier
+    
+    for i in range(period, len(data)):
+        d_curr = data[i]
+        diff   = d_curr - d_prev
+        d_prev = d_curr
+        
+        accum_gain += (max(diff, np.float32(0.0)) - accum_gain) * multiplier
+        accum_loss += (max(-diff, np.float32(0.0)) - accum_loss) * multiplier
+        
+        res_val = _rsi_value(accum_gain, accum_loss)
+        
+        result_arr[i] = np.uint8(res_val + np.float32(0.5))    # Round half up, res_val >= 0.
+    
     return result_arr
 
+def get_rsi_mask_lt(
+                    rsi_arr:   np.ndarray[np.uint8],
+                    threshold: int,
+                        ) -> np.ndarray[np.bool_]:
+    '''
+    Get mask of values below `threshold`, e.g. oversold screening `get_rsi_mask_lt(rsi_u8, 30)`.
+    One `np.less()` over uint8 values - 32 compares per AVX2 instruction.
+    
+    ---
+    
+    Parameters:
+    -----------
+    rsi_arr:   (`np.ndarray[np.uint8]`) : RSI array from `get_rsi_u8()`.
+    threshold: (`int`)                  : Threshold, in range [0 .. 255].
+    
+    Returns:
+    --------
+    (`np.ndarray[np.bool_]`) : `True` where `rsi_arr[i] < threshold`.
+    '''
+    
+    return np.less(rsi_arr, np.uint8(threshold))
+
 # -----------------------------------------------------------------------------------
 #
 #             RSI (tsf) - Thread Safe Function
@@ -132,11 +378,12 @@ _signature_tsf = numba.void(
                     numba.types.Array(numba.float32, 1, 'C', readonly = False, aligned = True), )
 
 _locals_tsf = {
-        'multiplier':   numba.float32,
-        'multiplier_2': numba.float32,
+        'multiplier':   numba.float64,
         'diff':         numba.float32,
-        'accum_gain':   numba.float32,
-        'accum_loss':   numba.float32,
+        'd_prev':       numba.float32,
+        'd_curr':       numba.float32,
+        'accum_gain':   numba.float64,
+        'accum_loss':   numba.float64,
         'res_val':      numba.float32, }
 
 @numba.njit(_signature_tsf,
@@ -171,46 +418,176 @@ def get_rsi_tsf(
     if data_size < 0:
         data_size = data.shape[0]
     
-    multiplier:   np.float32 = 1.0 / float(period)
-    multiplier_2: np.float32 = 1.0 - multiplier
+    multiplier: np.float64 = 1.0 / float(period)
     
     # Calculate initial average gain and loss.
-    accum_gain: np.float32 = 0.0
-    accum_loss: np.float32 = 0.0
+    accum_gain: np.float64 = 0.0
+    accum_loss: np.float64 = 0.0
         
     result_arr[0] = 50.0        # Default value for the first period.
+    d_prev        = data[0]     # NOTE: Previous value carried in a register - one load per step.
+    
     for i in range(1, period):
         
         result_arr[i] = 50.0        # Default value for the first period.        
-        diff          = data[i] - data[i - 1]
+        d_curr        = data[i]
+        diff          = d_curr - d_prev
+        d_prev        = d_curr
         
-        if diff > 0.0:
-            accum_gain += diff
-        else:
-            accum_loss -= diff
+        accum_gain += max(diff, np.float32(0.0))   # Branchless split ( maxss ).
+        accum_loss += max(-diff, np.float32(0.0))
         
     accum_gain *= multiplier
     accum_loss *= multiplier
     
     for i in range(period, data_size):
-        diff = data[i] - data[i - 1]
+        d_curr = data[i]
+        diff   = d_curr - d_prev
+        d_prev = d_curr
         
-        accum_gain *= multiplier_2
-        accum_loss *= multiplier_2                
-        diff       *= multiplier  # NOTE: Diff scaled in advanced here.
+        # Two independent first-order IIR filters - no shared dependency, issued back-to-back.
+        # Wilder EMA: accum = accum * (1 - m) + x * m  ==  accum + (x - accum) * m
+        accum_gain += (max(diff, np.float32(0.0)) - accum_gain) * multiplier
+        accum_loss += (max(-diff, np.float32(0.0)) - accum_loss) * multiplier
+        
+        res_val = _rsi_value(accum_gain, accum_loss)
+        
+        result_arr[i] = res_val
+    
+    return
+
+# -----------------------------------------------------------------------------------
+#
+#          RSI (batch) - Multi-Asset, Parallel ( Multi-Core )
+#
+# -----------------------------------------------------------------------------------
+
+_spec_func_batch = numba.types.Array(numba.float32, 2, 'C')(
+                    numba.types.Array(numba.float32, 2, 'C', readonly = True, aligned = True),  # data_mat
+                    numba.int32, )                                                              # period
+
+@numba.njit(_spec_func_batch,
+            cache        = True, 
+            fastmath     = True, 
+            nogil        = True,
+            boundscheck  = False,
+            parallel     = True, )
+def get_rsi_batch(
+                data_mat: np.ndarray[np.float32],
+                period:   np.int32,
+                    ) -> np.ndarray[np.float32]:
+    '''
+    Get RSI for many assets in one call.
+    Rows ( assets ) are calculated in parallel in `numba.prange()`,
+    each row gives the same result as `get_rsi()`.
+    
+    Parameters:
+    -----------
+    data_mat: (`np.ndarray[np.float32]`) : 2D array of values, shape ( n_assets, n_bars ).
+        Row-major ( C ), so every row is contiguous.
+    period:   (`np.int32`)               : period of RSI.
+    
+    Returns:
+    --------
+    (`np.ndarray[np.float32]`) : 2D array of RSI, shape ( n_assets, n_bars ).
+    '''
+    
+    n_assets: int = data_mat.shape[0]
+    n_bars:   int = data_mat.shape[1]
+    
+    result_mat: np.ndarray[np.float32] = np.empty((n_assets, n_bars), dtype = np.float32)
+    
+    for a in numba.prange(n_assets):
+        get_rsi_tsf(data_mat[a], period, n_bars, result_mat[a])
+    
+    return result_mat
+
+# -----------------------------------------------------------------------------------
+#
+#  RSI (batch symbols) - Multi-Asset, Symbols on the fast axis, Parallel ( Multi-Core )
+#
+# -----------------------------------------------------------------------------------
+
+_RSI_SYMBOL_CHUNK: int = 256     # Symbols per job, gain / loss state ( 2 x 2 KB float64 ) stays in L1.
+
+_signature_batch_symbols = numba.void(
+                    numba.types.Array(numba.float32, 2, 'C', readonly = True,  aligned = True),     # data_mat
+                    numba.int32,                                                                    # period
+                    numba.types.Array(numba.float32, 2, 'C', readonly = False, aligned = True), )   # result_mat
+
+_locals_batch_symbols = {
+                'n_bars':       numba.intp,
+                'n_symbols':    numba.intp,
+                'n_chunks':     numba.int32,
+                's_start':      numba.int32,
+                's_end':        numba.int32,
+                'multiplier':   numba.float64,
+                'diff':         numba.float32, }
+
+@numba.njit(_signature_batch_symbols,
+            cache       = True, 
+            fastmath    = True, 
+            nogil       = True,
+            boundscheck = False,
+            parallel    = True,
+            locals      = _locals_batch_symbols, )
+def get_rsi_batch_symbols(
+                            data_mat:   np.ndarray[np.float32], 
+                            period:     np.int32,
+                            result_mat: np.ndarray[np.float32],
+                                ) -> None:
+    '''
+    Get RSI for many symbols in one call.
+    Column `result_mat[:, s]` is equal to `get_rsi_tsf()` of `data_mat[:, s]`.
+    
+    Symbols are on the fast axis, so the per symbol work at index `i` ( diff, gain / loss split, 
+    both EMAs ) is one contiguous row, vectorized across symbols ( SIMD lanes ).
+    Chunks of `_RSI_SYMBOL_CHUNK` symbols are calculated in parallel in `numba.prange()`, 
+    gain / loss state of a chunk is a small array, resident in L1 for the whole series.
+    
+    Parameters:
+    -----------
+    data_mat:   (`np.ndarray[np.float32]`) : 2D array of values, shape ( n_bars, n_symbols ).
+        Row-major ( C ), so every row ( all symbols at one bar ) is contiguous.
+    period:     (`np.int32`)               : period of RSI.
+    result_mat: (`np.ndarray[np.float32]`) : 2D Result array, shape ( n_bars, n_symbols ).
+    '''
+    
+    n_bars:    np.int32 = data_mat.shape[0]
+    n_symbols: np.int32 = data_mat.shape[1]
+    
+    result_mat[:period, :] = 50.0   # Default value for the first period.
+    
+    if period >= n_bars:
+        return
+    
+    multiplier: np.float64 = 1.0 / float(period)
+    
+    n_chunks: np.int32 = (n_symbols + _RSI_SYMBOL_CHUNK - 1) // _RSI_SYMBOL_CHUNK
+    
+    for c in numba.prange(n_chunks):
+        s_start: np.int32 = c * _RSI_SYMBOL_CHUNK
+        s_end:   np.int32 = min(s_start + _RSI_SYMBOL_CHUNK, n_symbols)
         
-        if diff > 0.0:
-            accum_gain += diff
-        else:
-            accum_loss -= diff
+        accum_gain_arr = np.zeros(s_end - s_start, dtype = np.float64)
+        accum_loss_arr = np.zeros(s_end - s_start, dtype = np.float64)
         
-        res_val:     np.float32 = 50.0                
-        accum_range: np.float32 = accum_gain + accum_loss
+        for i in range(1, period):
+            for s in range(s_start, s_end):
+                diff                         = data_mat[i, s] - data_mat[i - 1, s]
+                accum_gain_arr[s - s_start] += max(diff, np.float32(0.0))
+                accum_loss_arr[s - s_start] += max(-diff, np.float32(0.0))
         
-        if accum_range > 0.0:
-            res_val = 100.0 * accum_gain / accum_range
+        accum_gain_arr *= multiplier
+        accum_loss_arr *= multiplier
         
-        result_arr[i] = res_val
+        for i in range(period, n_bars):
+            for s in range(s_start, s_end):
+                diff                         = data_mat[i, s] - data_mat[i - 1, s]
+                accum_gain_arr[s - s_start] += (max(diff, np.float32(0.0)) - accum_gain_arr[s - s_start]) * multiplier
+                accum_loss_arr[s - s_start] += (max(-diff, np.float32(0.0)) - accum_loss_arr[s - s_start]) * multiplier
+                
+                result_mat[i, s] = _rsi_value(accum_gain_arr[s - s_start], accum_loss_arr[s - s_start])
     
     return
 
@@ -226,12 +603,12 @@ _spec_func_vtsf = numba.types.float32(
                     numba.int32, )
 
 _locals_vtsf = {
-        'multiplier':   numba.float32,
-        'multiplier_2': numba.float32,
+        'multiplier':   numba.float64,
         'diff':         numba.float32,
-        'accum_gain':   numba.float32,
-        'accum_loss':   numba.float32,
-        'accum_range':  numba.float32,
+        'd_prev':       numba.float32,
+        'd_curr':       numba.float32,
+        'accum_gain':   numba.float64,
+        'accum_loss':   numba.float64,
         'res_val':      numba.float32, }
 
 @numba.njit(_spec_func_vtsf,
@@ -250,6 +627,10 @@ def get_rsi_vtsf(
     
     Thread Safe Function.
     
+    NOTE: Recalculates from the start of `data` - O(data_indx) per call.
+        NOT for bulk use, for many indexes use `get_rsi_tsf()` ( whole array ) 
+        or `get_rsi_state_step()` ( O(1) per call, walk-forward ).
+    
     ---
     
     Parameters:
@@ -263,43 +644,124 @@ def get_rsi_vtsf(
     (`np.float32`) : RSI Single Value.
     '''    
 
-    multiplier:   np.float32 = 1.0 / float(period)
-    multiplier_2: np.float32 = 1.0 - multiplier
+    multiplier: np.float64 = 1.0 / float(period)
     
     # Calculate initial average gain and loss.
-    accum_gain: np.float32 = 0.0
-    accum_loss: np.float32 = 0.0
+    accum_gain: np.float64 = 0.0
+    accum_loss: np.float64 = 0.0
+    
+    d_prev = data[0]  # NOTE: Previous value carried in a register - one load per step.
     
     for i in range(1, period):
         
-        diff = data[i] - data[i - 1]
-        if diff > 0.0:
-            accum_gain += diff
-        else:
-            accum_loss -= diff
-            
+        d_curr = data[i]
+        diff   = d_curr - d_prev
+        d_prev = d_curr
+        
+        accum_gain += max(diff, np.float32(0.0))   # Branchless split ( maxss ).
+        accum_loss += max(-diff, np.float32(0.0))
 
     accum_gain *= multiplier
     accum_loss *= multiplier
     
     for i in range(period, data_indx + 1):
-        diff = data[i] - data[i - 1]
+        d_curr = data[i]
+        diff   = d_curr - d_prev
+        d_prev = d_curr
         
-        accum_gain *= multiplier_2
-        accum_loss *= multiplier_2                
-        diff       *= multiplier  # NOTE: Diff scaled in advanced here.
+        # Two independent first-order IIR filters - no shared dependency, issued back-to-back.
+        # Wilder EMA: accum = accum * (1 - m) + x * m  ==  accum + (x - accum) * m
+        accum_gain += (max(diff, np.float32(0.0)) - accum_gain) * multiplier
+        accum_loss += (max(-diff, np.float32(0.0)) - accum_loss) * multiplier
         
-        if diff > 0.0:
-            accum_gain += diff
-        else:
-            accum_loss -= diff
+    res_val = _rsi_value(accum_gain, accum_loss)
         
-    res_val     = 50.0        
-    accum_range = accum_gain + accum_loss
+    return res_val
+
+# -----------------------------------------------------------------------------------
+#
+#             RSI (state step) - Incremental Single Value, O(1) per call
+#
+# -----------------------------------------------------------------------------------
+
+_spec_func_step = numba.types.float32(
+                    numba.types.Array(numba.float32, 1, 'C', readonly = True,  aligned = True),
+                    numba.int32,
+                    numba.int32,
+                    numba.types.Array(numba.float64, 1, 'C', readonly = False, aligned = True), )
+
+_locals_step = {
+        'multiplier':   numba.float64,
+        'diff':         numba.float32,
+        'accum_gain':   numba.float64,
+        'accum_loss':   numba.float64,
+        'res_val':      numba.float32, }
+
+@numba.njit(_spec_func_step,
+            cache       = True, 
+            fastmath    = True, 
+            nogil       = True,
+            boundscheck = False,
+            locals      = _locals_step, )
+def get_rsi_state_step(
+                        data:      np.ndarray[np.float32],
+                        period:    np.int32,
+                        data_indx: np.int32,
+                        state:     np.ndarray[np.float64],
+                            ) -> np.float32:
+    '''
+    Get RSI Single Value incrementally, in O(1).
+    Gain / loss accumulators are kept by the caller in `state`, between calls.
+    
+    Call for `data_indx = 0, 1, 2, ...` in order, with the same `state` - 
+    a walk-forward sweep is O(N), instead of O(N^2) with `get_rsi_vtsf()`.
+    Returned values are the same as `get_rsi()[data_indx]`.
+    
+    Thread Safe Function ( one `state` per thread ).
+    
+    ---
+    
+    Parameters:
+    -----------
+    data:      (`np.ndarray[np.float32]`) : array of values.
+    period:    (`np.int32`)               : period of RSI.
+    data_indx: (`np.int32`)               : Data index, previous call MUST be for `data_indx - 1`.
+        `data_indx = 0` resets the state.
+    state:     (`np.ndarray[np.float64]`) : [accum_gain, accum_loss], size 2, updated in place.
+    
+    Returns:
+    --------
+    (`np.float32`) : RSI Single Value.
+    '''
+    
+    if data_indx == 0:
+        state[0] = 0.0
+        state[1] = 0.0
+        return 50.0     # Default value for the first period.
+    
+    multiplier: np.float64 = 1.0 / float(period)
+    
+    diff       = data[data_indx] - data[data_indx - 1]
+    accum_gain = state[0]
+    accum_loss = state[1]
+    
+    if data_indx < period:
+        state[0] = accum_gain + max(diff, np.float32(0.0))
+        state[1] = accum_loss + max(-diff, np.float32(0.0))
+        return 50.0     # Default value for the first period.
+    
+    if data_indx == period:
+        accum_gain *= multiplier    # Warmup sums to averages.
+        accum_loss *= multiplier
+    
+    accum_gain += (max(diff, np.float32(0.0)) - accum_gain) * multiplier
+    accum_loss += (max(-diff, np.float32(0.0)) - accum_loss) * multiplier
+    
+    state[0] = accum_gain
+    state[1] = accum_loss
+    
+    res_val = _rsi_value(accum_gain, accum_loss)
     
-    if accum_range > 0:
-        res_val: np.float32 = 100.0 * accum_gain / accum_range
-        
     return res_val
 
 # -----------------------------------------------------------------------------------
@@ -327,10 +789,8 @@ def get_rsi_vtsf_cuda(
     for i in range(1, period):
         
         diff = data[i] - data[i - 1]
-        if diff > 0.0:
-            accum_gain += diff
-        else:
-            accum_loss -= diff
+        accum_gain += max(diff, 0.0)   # Branchless split ( maxss ).
+        accum_loss += max(-diff, 0.0)
 
     accum_gain *= multiplier
     accum_loss *= multiplier
@@ -342,10 +802,8 @@ def get_rsi_vtsf_cuda(
         accum_loss *= multiplier_2                
         diff       *= multiplier    # NOTE: Diff scaled in advanced here.
         
-        if diff > 0.0:
-            accum_gain += diff
-        else:
-            accum_loss -= diff
+        accum_gain += max(diff, 0.0)   # Branchless split ( maxss ).
+        accum_loss += max(-diff, 0.0)
         
     res_val     = 50.0    
     accum_range = accum_gain + accum_loss
@@ -357,4 +815,107 @@ def get_rsi_vtsf_cuda(
     
     return 
 
+# -----------------------------------------------------------------------------------
+#
+#             RSI (GPU) - Many Indexes, Shared Memory Tiles
+#
+# -----------------------------------------------------------------------------------
+
+_RSI_CUDA_TILE: int = 256     # Values per shared memory tile, max threads per block of get_rsi_indexes_cuda().
+
+@cuda.jit()
+def get_rsi_indexes_cuda(
+                        data:     np.ndarray[np.float32],
+                        period:   np.int32,
+                        indx_arr: np.ndarray[np.int32],
+                        res_arr:  np.ndarray[np.float32],
+                            ) -> None:
+    '''
+    Get RSI values for data indexes `indx_arr[k]`, `res_arr[k]` for `indx_arr[k]`.
+    One thread per index, same results as `get_rsi_vtsf_cuda()`.
+    
+    Every thread runs the recurrence from the start of `data`, so threads of a block read the same prefix.
+    The block stages `data` into shared memory tiles cooperatively, 
+    every value is read from global memory once per block, instead of once per thread.
+    
+    Launch:
+    -------
+    >>> blocks = (indx_arr.shape[0] + threads - 1) // threads     # threads <= _RSI_CUDA_TILE
+    >>> get_rsi_indexes_cuda[blocks, threads](d_data, period, d_indx_arr, d_res_arr)
+    
+    Parameters:
+    -----------
+    data:     (`np.ndarray[np.float32]`) : Input data array ( device array ).
+    period:   (`np.int32`)               : period of RSI.
+    indx_arr: (`np.ndarray[np.int32]`)   : Data indexes ( device array ).
+        Best sorted - threads of a block run until the largest index of the block.
+    res_arr:  (`np.ndarray[np.float32]`) : Result Array ( device array ).
+    '''
+    
+    tile      = cuda.shared.array(_RSI_CUDA_TILE + 1, dtype = numba.float32)    # tile[0] - last value of the previous tile.
+    block_max = cuda.shared.array(1, dtype = numba.int32)
+    
+    thread_indx: int = cuda.threadIdx.x
+    threads:     int = cuda.blockDim.x
+    k:           int = cuda.grid(1)
+    
+    i_last: int = 0
+    if k < indx_arr.shape[0]:
+        i_last = max(indx_arr[k], period - 1)   # Warmup is always complete, as in get_rsi_vtsf_cuda().
+    
+    if thread_indx == 0:
+        block_max[0] = 0
+    cuda.syncthreads()
+    cuda.atomic.max(block_max, 0, i_last)
+    cuda.syncthreads()
+    block_last: int = block_max[0]
+    
+    multiplier:   float = 1.0 / float(period)
+    multiplier_2: float = 1.0 - multiplier
+    
+    accum_gain: float = 0.0
+    accum_loss: float = 0.0
+    
+    # Loop over tiles - same for all threads of the block, `cuda.syncthreads()` is safe.
+    for tile_first in range(0, block_last + 1, _RSI_CUDA_TILE):
+        
+        for j in range(thread_indx, _RSI_CUDA_TILE + 1, threads):
+            src_indx = tile_first - 1 + j
+            if src_indx >= 0 and src_indx <= block_last:
+                tile[j] = data[src_indx]
+        cuda.syncthreads()
+        
+        for i in range(max(tile_first, 1), min(tile_first + _RSI_CUDA_TILE, i_last + 1)):
+            t    = i - tile_first
+            diff = tile[t + 1] - tile[t]
+            
+            if i < period:
+                accum_gain += max(diff, 0.0)
+                accum_loss += max(-diff, 0.0)
+            else:
+                if i == period:
+                    accum_gain *= multiplier
+                    accum_loss *= multiplier
+                
+                diff       *= multiplier    # NOTE: Diff scaled in advanced here.
+                accum_gain  = accum_gain * multiplier_2 + max(diff, 0.0)
+                accum_loss  = accum_loss * multiplier_2 + max(-diff, 0.0)
+        
+        cuda.syncthreads()     # Tile is reused by the next loop.
+    
+    if i_last < period:
+        accum_gain *= multiplier
+        accum_loss *= multiplier
+    
+    if k < indx_arr.shape[0]:
+        res_val     = 50.0
+        accum_range = accum_gain + accum_loss
+        
+        if accum_range > 0.0:
+            res_val = 100.0 * accum_gain / accum_range
+        
+        res_arr[k] = res_val
+    
+    return
+
 # -----------------------------------------------------------------------------------
\ No newline at end of file
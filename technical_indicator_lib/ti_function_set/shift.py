@@ -1,18 +1,85 @@
+from __future__ import annotations
+
 import numpy as np
 import numba
 
 # -----------------------------------------------------------------------------------
 
 _name_:           str = 'Shift - TI Lib'
-__version__:      str = '0.0.1'
-__version_date__: str = '2024-09-16'
+__version__:      str = '0.0.2'
+__version_date__: str = '2026-10-15'
 VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}' 
 
 # --- VERSION HISTORY: --------------------------------------------------------------
 
 # v0.0.1 @ 2024-09-16 : Initial Release.
+# v0.0.2 @ 2026-10-15 : Single copy of the kept values + zero fill, instead of np.roll() ( copy of the whole array ).
+#                       Direction of shift as in docstring, shift = 0 returns a copy, |shift| >= len returns zeros.
+#                       Added get_shift_tsf() - writes into a given array ( no allocation ), used by get_shift().
 #
 
+# -----------------------------------------------------------------------------------
+#
+#             SHIFT (tsf) - Thread Safe Function
+#             NOTE: Defined first, get_shift() calls it ( eager compilation ).
+#
+# -----------------------------------------------------------------------------------
+
+_signature_tsf = numba.void(
+                    numba.types.Array(numba.float32, 1, 'C', readonly = True,  aligned = True),
+                    numba.int32,
+                    numba.int32,
+                    numba.types.Array(numba.float32, 1, 'C', readonly = False, aligned = True), )
+
+@numba.njit(_signature_tsf,
+            cache       = True, 
+            fastmath    = True, 
+            nogil       = True,
+            boundscheck = False, )
+def get_shift_tsf(
+                    data:       np.ndarray[np.float32],
+                    shift:      np.int32,
+                    data_size:  np.int32,
+                    result_arr: np.ndarray[np.float32],
+                        ) -> None:
+    '''
+    Get shifted array, written into `result_arr`.
+    No allocation - one contiguous copy ( memmove ) of the kept values + zero fill.
+    
+    Thread Safe Function.
+    
+    ---
+    
+    Parameters:
+    -----------
+    data:       (`np.ndarray[np.float32]`) : array of values.
+    shift:      (`np.int32`)               : shift period.
+        ( shift > 0 : shifts to right >>, shift < 0 : shifts to left << )
+    data_size:  (`np.int32`)               : size of data array.
+        If `data_size < 0`, `data.shape[0]` is used.
+    result_arr: (`np.ndarray[np.float32]`) : Result array, `result_arr[:data_size]` is rewritten.
+        Must NOT overlap `data`.
+    '''
+    
+    if data_size < 0:
+        data_size = data.shape[0]
+    
+    if abs(shift) >= data_size:
+        result_arr[:data_size] = 0.0                        # fill unknown values with zeros.
+    
+    elif shift > 0:
+        result_arr[:shift]          = 0.0                   # fill unknown values with zeros.
+        result_arr[shift:data_size] = data[:data_size - shift]
+    
+    elif shift < 0:
+        result_arr[:data_size + shift]          = data[-shift:data_size]
+        result_arr[data_size + shift:data_size] = 0.0       # fill unknown values with zeros.
+    
+    else:
+        result_arr[:data_size] = data[:data_size]
+    
+    return
+
 # -----------------------------------------------------------------------------------
 #
 #               SHIFT
@@ -60,15 +127,9 @@ def get_shift(
         # Return: np.array([3.0, 4.0, 5.0, 0.0, 0.0], dtype = np.float32)
     '''
     
-    if shift > 0:
-        res_arr: np.ndarray[np.float32] = np.roll(data, -shift)
-        res_arr[-shift:] = 0.0  # fill unknown values with zeros.
-        return res_arr
+    res_arr: np.ndarray[np.float32] = np.empty(len(data), dtype = np.float32)
     
-    elif shift < 0:
-        res_arr: np.ndarray[np.float32] = np.roll(data, -shift)
-        res_arr[:shift] = 0.0   # fill unknown values with zeros.
-        return res_arr
+    get_shift_tsf(data, shift, len(data), res_arr)
     
     return res_arr
 
@@ -1,18 +1,39 @@
+from __future__ import annotations
+
 import numpy as np
 import numba
 from numba import cuda
 
+from ._constants import L2_TILE_SIZE
+
 
 # -----------------------------------------------------------------------------------
 
 _name_:           str = 'William %R OC - TI Lib'
-__version__:      str = '0.0.1'
-__version_date__: str = '2024-09-16'
+__version__:      str = '0.0.2'
+__version_date__: str = '2026-10-15'
 VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}' 
 
 # --- VERSION HISTORY: --------------------------------------------------------------
 
 # v0.0.1 @ 2024-09-16 : Initial Release.
+# v0.0.2 @ 2026-10-15 : Lowest Low / Highest High with monotonic deques ( _william_oc_range() ), 
+#                           amortized O(1) per value - no window rescan on trending data.
+#                       Added get_william_oc_tsf_parallel() - multi-core version of get_william_oc_tsf().
+#                       Added get_william_oc_np() - NumPy sliding window min / max for short periods.
+#                       Deques keep values next to indexes - no indirect data[] reloads in _william_oc_range().
+#                       Branchless head expiry and result select in _william_oc_range().
+#                       Added get_william_oc_range_cuda() - GPU kernel ( shared memory tile ), get_william_oc_cuda() - host function.
+#                       Warm-up defaults written with a slice fill, no warm-up loop in get_william_oc*_tsf().
+#                       Added get_william_oc_multi_tsf() - several periods in one pass over data.
+#                       Branchless zero range guard ( clamped divide + select ) in vtsf and GPU versions too.
+#                       Added get_william_oc_into() - no allocation, preallocated result array, get_william_oc() wraps it.
+#                       Added get_william_oc_tsf_q16() - int16 tick input ( half memory traffic ).
+#                       get_william_oc_range_cuda(): window Min / Max by doubling in shared memory, log2(period) steps.
+#                       Added get_william_oc_sweep() - many periods from one Sparse Table, multi-core.
+#                       int32 loop indexes pinned in locals ( no int64 mixing ), multi_tsf deque heads kept in registers.
+#                       Added get_william_oc_vtsf_cuda_dev() - device function, get_william_oc_vtsf_cuda() is a shim of it.
+#                       error_model = 'numpy' in all njit functions ( no ZeroDivisionError checks ).
 #
 
 # --- CALCULATION DESCRIPTION: -------------------------------------------------------
@@ -28,6 +49,104 @@ VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date_
 #                           Lowest Low = Lowest Low for the period.
 #                           n = 14 [period]
 
+# -----------------------------------------------------------------------------------
+#
+#               William %R OC - Range Kernel ( Private )
+#
+# -----------------------------------------------------------------------------------
+
+_locals_range = {
+        'i':                numba.int32,
+        'buf_size':         numba.int32,
+        'buf_mask':         numba.int32,
+        'min_head':         numba.int32,
+        'min_tail':         numba.int32,
+        'max_head':         numba.int32,
+        'max_tail':         numba.int32,
+        'i_expired':        numba.int32,
+        'data_temp':        numba.float32,
+        'lowest_low':       numba.float32,
+        'highest_high':     numba.float32,
+        'high_low_range':   numba.float32,
+        'res_val':          numba.float32,  }
+
+@numba.njit(cache       = True, 
+            fastmath    = True, 
+            nogil       = True,
+            boundscheck = False,
+            error_model = 'numpy',
+            inline      = 'always',
+            locals      = _locals_range, )
+def _william_oc_range(
+                        data:       np.ndarray[np.float32],
+                        period:     np.int32,
+                        i_first:    np.int32,
+                        i_end:      np.int32,
+                        result_arr: np.ndarray[np.float32],
+                            ) -> None:
+    '''
+    William OC values for indexes `[i_first, i_end)`, window `data[i - period + 1 .. i]`.
+    Warning: **( i_first >= period - 1 )**
+    
+    Lowest Low / Highest High are the heads of two monotonic deques of indexes 
+    ( ascending minima / descending maxima ), every index is pushed and popped at most once - 
+    amortized O(1) per value, independent of `period` and of the trend.
+    Deques are ring buffers, power of 2 size ( index wrap by mask ), 
+    values are stored next to indexes, so compares and results read the deque only ( no `data[idx]` gathers ).
+    Extremes expire by index ( `idx <= i - period` ), never by a float equality test on the removed value - 
+    repeated / flat values can not trigger false rescans.
+    '''
+    
+    buf_size: np.int32 = 1
+    while buf_size < period + 1:
+        buf_size *= 2
+    buf_mask = buf_size - 1
+    
+    min_buf = np.empty(buf_size, dtype = np.int32)     # Indexes, ascending values.
+    max_buf = np.empty(buf_size, dtype = np.int32)     # Indexes, descending values.
+    min_val = np.empty(buf_size, dtype = np.float32)   # Values of min_buf indexes.
+    max_val = np.empty(buf_size, dtype = np.float32)   # Values of max_buf indexes.
+    
+    min_head = 0
+    min_tail = 0
+    max_head = 0
+    max_tail = 0
+    
+    for i in range(i_first - period + 1, i_end):
+        
+        data_temp = data[i]
+        i_expired = i - period     # Index leaving the window.
+        
+        # --- Lowest Low: drop values >= new value from the tail, push, drop expired head.
+        while min_tail != min_head and min_val[(min_tail - 1) & buf_mask] >= data_temp:
+            min_tail -= 1
+        min_buf[min_tail & buf_mask] = i
+        min_val[min_tail & buf_mask] = data_temp
+        min_tail += 1
+        
+        min_head += np.int32(min_buf[min_head & buf_mask] <= i_expired)     # Branchless, at most one expires.
+        
+        # --- Highest High: drop values <= new value from the tail, push, drop expired head.
+        while max_tail != max_head and max_val[(max_tail - 1) & buf_mask] <= data_temp:
+            max_tail -= 1
+        max_buf[max_tail & buf_mask] = i
+        max_val[max_tail & buf_mask] = data_temp
+        max_tail += 1
+        
+        max_head += np.int32(max_buf[max_head & buf_mask] <= i_expired)
+        
+        if i >= i_first:     # NOTE: Predictable, false only for the first `period - 1` values.
+            lowest_low     = min_val[min_head & buf_mask]
+            highest_high   = max_val[max_head & buf_mask]
+            high_low_range = highest_high - lowest_low
+            
+            # Division by a clamped range is always safe, result is selected ( no branch ).
+            # NOTE: Scalar `vdivss` - the deque loop is NOT vectorizable ( data dependent pops ), no `vdivps`.
+            res_val       = (highest_high - data_temp) / max(high_low_range, np.float32(1e-30))
+            result_arr[i] = res_val if high_low_range > 0 else np.float32(0.0)
+    
+    return
+
 # -----------------------------------------------------------------------------------
 #
 #               William %R OC: william_oc
@@ -38,19 +157,66 @@ _spec_func_numba = numba.types.Array(numba.float32, 1, 'C', aligned = True)(
                                     numba.types.Array(numba.float32, 1, 'C', readonly = True, aligned = True), 
                                     numba.int32)
 
-_locals_func_numba = {
-        'lowest_low':       numba.float32,
-        'highest_high':     numba.float32,
-        'high_low_range':   numba.float32,  
-        'i_shifted':        numba.int32,    }
+_spec_func_into = numba.types.Array(numba.float32, 1, 'C', aligned = True)(
+                                    numba.types.Array(numba.float32, 1, 'C', readonly = True,  aligned = True), 
+                                    numba.int32,
+                                    numba.types.Array(numba.float32, 1, 'C', readonly = False, aligned = True), )
+
+_locals_into = {
+        'data_size':        numba.int32,  }
+
+@numba.njit(_spec_func_into,
+            cache       = True, 
+            fastmath    = True, 
+            nogil       = True,
+            boundscheck = False,
+            error_model = 'numpy',
+            locals      = _locals_into, )
+def get_william_oc_into(
+                        data_arr: np.ndarray[np.float32],
+                        period:   np.int32,
+                        out_arr:  np.ndarray[np.float32],
+                            ) -> np.ndarray[np.float32]:
+    '''
+    Get William OC of the given array into preallocated `out_arr`.
+    
+    No allocation - for repeated calls ( e.g. backtest loop ) reuse one `out_arr`, 
+    malloc of a new result array is paid only once ( `aligned_f32(len(data_arr))` ).
+    
+    ---
+    
+    Parameters:
+    -----------
+    data_arr: (`np.ndarray[np.float32]`) : array of values.
+    period:   (`np.int32`)               : period of William OC.
+        '(period >= 2)'
+    out_arr:  (`np.ndarray[np.float32]`) : result array, `len(out_arr) >= len(data_arr)`.
+        Results will be rewritten in this array.
+    
+    Returns:
+    --------
+    (`np.ndarray[np.float32]`) : `out_arr[:len(data_arr)]` - view, array of Willian OC.
+    '(result[i] - in range [0.0 .. 1.0])'
+    
+    '''
+    
+    data_size: np.int32 = len(data_arr)
+    
+    out_arr[:min(period, data_size)] = 0.5  # Default value for the first period.
+    
+    # Calculate William %R.
+    if period < data_size:
+        _william_oc_range(data_arr, period, period, data_size, out_arr)
+    
+    return out_arr[:data_size]
 
 @numba.njit(_spec_func_numba,
             cache       = True, 
             fastmath    = True, 
             nogil       = True,
             boundscheck = False,
-            inline      = 'always',
-            locals      = _locals_func_numba, )
+            error_model = 'numpy',
+            inline      = 'always', )
 def get_william_oc(
                     data_arr: np.ndarray[np.float32],
                     period:   np.int32,
@@ -60,6 +226,9 @@ def get_william_oc(
     
     OC:  Only Close Flag. Only Close prices will be used.
     
+    Allocates a new result array on every call, 
+        see `get_william_oc_into()` to reuse one buffer.
+    
     ---
     
     Parameters:
@@ -75,52 +244,60 @@ def get_william_oc(
     
     '''
     
-    result_arr: np.ndarray[np.float32] = np.empty_like(data_arr, dtype = np.float32)
+    return get_william_oc_into(data_arr, period, np.empty_like(data_arr, dtype = np.float32))
+
+_WILLIAM_NP_MAX_PERIOD: int = 32     # Max period of the NumPy sliding window path, longer periods use the deque kernel.
+
+def get_william_oc_np(
+                        data_arr: np.ndarray[np.float32],
+                        period:   int,
+                            ) -> np.ndarray[np.float32]:
+    '''
+    Get William OC of the given array.
+    Same results as `get_william_oc()`.
     
-    # Calculate initial values.
-    lowest_low:   np.float32 = data_arr[0]
-    highest_high: np.float32 = data_arr[0]
+    For `period <= _WILLIAM_NP_MAX_PERIOD` calculated with NumPy on a sliding window view 
+    ( `sliding_window_view().min() / .max()`, no copy ) - packed SIMD min / max over short windows 
+    beats the deque bookkeeping. Longer periods are passed to `get_william_oc()`.
     
-    result_arr[0] = 0.5  # Default value for the first period. # NOTE: It's assigned later as well for the rest of the period.
+    ---
     
-    for i in range(1, period):
-        
-        result_arr[i] = 0.5    # Default value for the first period.
-        lowest_low    = min(lowest_low, data_arr[i])
-        highest_high  = max(highest_high, data_arr[i])
-
-    # Calculate William %R.
-    for i in range(period, len(data_arr)):
-        
-        i_shifted: np.int32 = i - period
-        
-        # --- Check for update Lowest Low:
-        if data_arr[i] < lowest_low:
-            # If new value is lower than lowest_low, then update lowest_low.
-            lowest_low = data_arr[i]
-        elif data_arr[i_shifted] == lowest_low:
-            # If removed value was lowest_low, then recalculate lowest_low.            
-            # Recalculate Lowest Low.
-            lowest_low = data_arr[i_shifted + 1]
-            for j in range(i_shifted + 2, i + 1):                
-                lowest_low = min(lowest_low, data_arr[j])
-                
-        # --- Check for update Highest High:
-        if data_arr[i] > highest_high:
-            # If new value is higher than highest_high, then update highest_high.
-            highest_high = data_arr[i]
-        elif data_arr[i_shifted] == highest_high:
-            # If removed value was highest_high, then recalculate highest_high.            
-            # Recalculate Highest High.
-            highest_high = data_arr[i_shifted + 1]
-            for j in range(i_shifted + 2, i + 1):
-                highest_high = max(highest_high, data_arr[j])
-        
-        high_low_range: np.float32 = highest_high - lowest_low
-        
-        result_arr[i] = 0.0
-        if high_low_range > 0:
-            result_arr[i] = (highest_high - data_arr[i]) / high_low_range
+    Parameters:
+    -----------
+    data_arr: (`np.ndarray[np.float32]`) : array of values.
+    period:   (`int`)                    : period of William OC.
+        '(period >= 2)'
+    
+    Returns:
+    --------
+    (`np.ndarray[np.float32]`) : array of Willian OC.
+    '(result[i] - in range [0.0 .. 1.0])'
+    '''
+    
+    data_arr = np.ascontiguousarray(data_arr, dtype = np.float32)
+    period   = int(period)
+    
+    if period > _WILLIAM_NP_MAX_PERIOD:
+        return get_william_oc(data_arr, period)
+    
+    result_arr          = np.empty_like(data_arr, dtype = np.float32)
+    result_arr[:period] = 0.5       # Default value for the first period.
+    
+    if period >= data_arr.shape[0]:
+        return result_arr
+    
+    # Windows data[i - period + 1 .. i] for i >= period.
+    win_view     = np.lib.stride_tricks.sliding_window_view(data_arr[1:], period)
+    highest_high = win_view.max(axis = 1)
+    lowest_low   = win_view.min(axis = 1)
+    
+    high_low_range = np.subtract(highest_high, lowest_low, out = lowest_low)
+    np.subtract(highest_high, data_arr[period:], out = highest_high)
+    
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        np.divide(highest_high, high_low_range, out = highest_high)
+    
+    result_arr[period:] = np.where(high_low_range > 0, highest_high, np.float32(0.0))
     
     return result_arr
 
@@ -136,22 +313,12 @@ _signature_tsf = numba.void(
                     numba.int32,
                     numba.types.Array(numba.float32, 1, 'C', readonly = False, aligned = True), )
 
-_locals_tsf = {
-        'lowest_low':       numba.float32,
-        'highest_high':     numba.float32,
-        'high_low_range':   numba.float32,
-        'i_shifted':        numba.int32,
-        'data_temp':        numba.float32,
-        'data_temp_shft':   numba.float32,
-        'data_temp_j':      numba.float32,
-        'res_val':          numba.float32,  }
-
 @numba.njit(_signature_tsf,
             cache       =True, 
             fastmath    =True, 
             nogil       =True,
             boundscheck =False,
-            locals      =_locals_tsf,   )
+            error_model ='numpy', )
 def get_william_oc_tsf( 
                         data:       np.ndarray[np.float32], 
                         period:     np.int32,
@@ -181,55 +348,361 @@ def get_william_oc_tsf(
     if data_size < 0:
         data_size = data.shape[0]
     
-    # Calculate initial values.
-    lowest_low:   np.float32 = data[0]
-    highest_high: np.float32 = data[0]
+    result_arr[:min(period, data_size)] = 0.5    # Default value for the first period ( slice fill ).
     
-    result_arr[0] = 0.5  # Default value for the first period. # NOTE: It's assigned later as well for the rest of the period.
+    # Calculate William %R.
+    if period < data_size:
+        _william_oc_range(data, period, period, data_size, result_arr)
     
-    for i in range(1, period):
-        result_arr[i]         = 0.5    # Default value for the first period.        
-        data_temp: np.float32 = data[i]        
-        lowest_low            = min(lowest_low, data_temp)
-        highest_high          = max(highest_high, data_temp)            
-        pass
+    return
 
-    # Calculate William %R.
-    for i in range(period, data_size):
-        
-        i_shifted:      np.int32    = i - period        
-        data_temp:      np.float32  = data[i]
-        data_temp_shft: np.float32  = data[i_shifted]
-        
-        # --- Check for update Lowest Low:
-        lowest_low = min(lowest_low, data_temp)
+# -----------------------------------------------------------------------------------
+#
+#               William %R OC (tsf) - Thread Safe Function, Multi-Core
+#
+# -----------------------------------------------------------------------------------
+
+_WILLIAM_TILE_SIZE: int = L2_TILE_SIZE     # Minimum values per tile, at least `8 * period`.
+
+_locals_tsf_parallel = {
+    'tile_size': numba.int32,
+    'n_tiles':   numba.int32,
+    'i_start':   numba.int32,
+    'i_end':     numba.int32, }
+
+@numba.njit(_signature_tsf,
+            cache       = True, 
+            fastmath    = True, 
+            nogil       = True,
+            boundscheck = False,
+            error_model = 'numpy',
+            parallel    = True,
+            locals      = _locals_tsf_parallel, )
+def get_william_oc_tsf_parallel( 
+                                data:       np.ndarray[np.float32], 
+                                period:     np.int32,
+                                data_size:  np.int32,
+                                result_arr: np.ndarray[np.float32],
+                                    ) -> None:
+    '''
+    Get William OC of the given array.
+    Parallel version of `get_william_oc_tsf()`, runs on all cores.
+    
+    Value at `i` depends only on the window `data[i - period + 1 .. i]`, 
+    so data is split into tiles ( at least `8 * period` values, warmup of `period - 1` values is amortized ), 
+    every tile builds its own deques from the window of its first index 
+    and is calculated independently in `numba.prange()`.
+    
+    Parameters:
+    -----------
+    data:       (`np.ndarray[np.float32]`) : array of values.
+    period:     (`np.int32`)               : period of William OC.
+        '(period >= 2)'
+    data_size:  (`np.int32`)               : size of data array.
+    result_arr: (`np.ndarray[np.float32]`) : array of William OC.
+        Results will be rewritten in this array.
+    '''
+    
+    if data_size < 0:
+        data_size = data.shape[0]
+    
+    result_arr[:min(period, data_size)] = 0.5    # Default value for the first period ( slice fill ).
+    
+    tile_size: np.int32 = max(_WILLIAM_TILE_SIZE, 8 * period)
+    n_tiles:   np.int32 = (data_size + tile_size - 1) // tile_size
+    
+    for t in numba.prange(n_tiles):
+        i_start: np.int32 = max(t * tile_size, period)
+        i_end:   np.int32 = min((t + 1) * tile_size, data_size)
         
-        if data_temp_shft == lowest_low:
-            # If removed value was lowest_low, then recalculate lowest_low.            
-            # Recalculate Lowest Low.
-            lowest_low = data[i_shifted + 1]
-            for j in range(i_shifted + 2, i + 1):
-                data_temp_j: np.float32 = data[j]
-                lowest_low = min(lowest_low, data_temp_j)
-            pass
+        if i_start < i_end:
+            _william_oc_range(data, period, i_start, i_end, result_arr)
+    
+    return
+
+# -----------------------------------------------------------------------------------
+#
+#               William %R OC (tsf) - Thread Safe Function, int16 Tick Input
+#
+# -----------------------------------------------------------------------------------
+
+_signature_tsf_q16 = numba.void(
+                    numba.types.Array(numba.int16,   1, 'C', readonly = True,  aligned = True),     # data_q16
+                    numba.int32,                                                                    # period
+                    numba.int32,                                                                    # data_size
+                    numba.types.Array(numba.float32, 1, 'C', readonly = False, aligned = True), )   # result_arr
+
+@numba.njit(_signature_tsf_q16,
+            cache       = True, 
+            fastmath    = True, 
+            nogil       = True,
+            boundscheck = False,
+            error_model = 'numpy', )
+def get_william_oc_tsf_q16( 
+                            data_q16:   np.ndarray[np.int16], 
+                            period:     np.int32,
+                            data_size:  np.int32,
+                            result_arr: np.ndarray[np.float32],
+                                ) -> None:
+    '''
+    Get William OC of the given array, 
+    for int16 fixed-point ( tick ) input ( see `as_q16()` ).
+    
+    Half of the memory traffic of `get_william_oc_tsf()` for exchange tick data.
+    William %R is invariant to `(data - offset) / tick` encoding, 
+    so results are equal to `get_william_oc_tsf()` of the tick-rounded data - no decoding needed.
+    int16 ticks are exact in float32, extremes are tracked by the same deque kernel.
+    
+    Thread Safe Function.
+    
+    ---
+    
+    Parameters:
+    -----------
+    data_q16:   (`np.ndarray[np.int16]`)   : array of values, ticks from `as_q16()`.
+    period:     (`np.int32`)               : period of William OC.
+        '(period >= 2)'
+    data_size:  (`np.int32`)               : size of data array.
+    result_arr: (`np.ndarray[np.float32]`) : array of William OC.
+        Results will be rewritten in this array.
+    
+    '''
+    
+    if data_size < 0:
+        data_size = data_q16.shape[0]
+    
+    result_arr[:min(period, data_size)] = 0.5    # Default value for the first period ( slice fill ).
+    
+    # Calculate William %R.
+    if period < data_size:
+        _william_oc_range(data_q16, period, period, data_size, result_arr)
+    
+    return
+
+# -----------------------------------------------------------------------------------
+#
+#               William %R OC (multi tsf) - Many periods, one pass over data
+#
+# -----------------------------------------------------------------------------------
+
+_signature_multi_tsf = numba.void(
+                    numba.types.Array(numba.float32, 1, 'C', readonly = True,  aligned = True),     # data
+                    numba.types.Array(numba.int32,   1, 'C', readonly = True,  aligned = True),     # periods
+                    numba.int32,                                                                    # data_size
+                    numba.types.Array(numba.float32, 2, 'C', readonly = False, aligned = True), )   # result_mat
+
+_locals_multi_tsf = {
+        'i':                numba.int32,
+        'k':                numba.int32,
+        'n_periods':        numba.intp,
+        'buf_size':         numba.int32,
+        'buf_mask':         numba.int32,
+        'period':           numba.int32,
+        'i_expired':        numba.int32,
+        'head':             numba.int32,
+        'tail':             numba.int32,
+        'data_temp':        numba.float32,
+        'lowest_low':       numba.float32,
+        'highest_high':     numba.float32,
+        'high_low_range':   numba.float32,
+        'res_val':          numba.float32,  }
+
+@numba.njit(_signature_multi_tsf,
+            cache       = True, 
+            fastmath    = True, 
+            nogil       = True,
+            boundscheck = False,
+            error_model = 'numpy',
+            locals      = _locals_multi_tsf, )
+def get_william_oc_multi_tsf(
+                            data:       np.ndarray[np.float32], 
+                            periods:    np.ndarray[np.int32],
+                            data_size:  np.int32,
+                            result_mat: np.ndarray[np.float32],
+                                ) -> None:
+    '''
+    Get William OC for several periods ( e.g. 7, 14, 28 ) in one pass over data.
+    Row `result_mat[k]` is equal to `get_william_oc_tsf()` with `periods[k]`.
+    
+    One pair of monotonic deques per period ( as in `_william_oc_range()` ), 
+    every `data[i]` is read once and pushed to all of them - 
+    instead of one pass over data per period.
+    
+    Thread Safe Function.
+    
+    ---
+    
+    Parameters:
+    -----------
+    data:       (`np.ndarray[np.float32]`) : array of values.
+    periods:    (`np.ndarray[np.int32]`)   : Periods, K values.
+        '(periods[k] >= 2)'
+    data_size:  (`np.int32`)               : size of data array.
+    result_mat: (`np.ndarray[np.float32]`) : 2D Result array, shape ( K, data_size ).
+        Results will be rewritten in this array.
+    '''
+    
+    if data_size < 0:
+        data_size = data.shape[0]
+    
+    n_periods: int = periods.shape[0]
+    
+    buf_size = 1
+    for k in range(n_periods):
+        result_mat[k, :min(periods[k], data_size)] = 0.5    # Default value for the first period.
+        while buf_size < periods[k] + 1:
+            buf_size *= 2
+    buf_mask = buf_size - 1
+    
+    # Deques of every period: indexes and values, ring buffers ( see _william_oc_range() ).
+    min_buf  = np.empty((n_periods, buf_size), dtype = np.int32)
+    max_buf  = np.empty((n_periods, buf_size), dtype = np.int32)
+    min_val  = np.empty((n_periods, buf_size), dtype = np.float32)
+    max_val  = np.empty((n_periods, buf_size), dtype = np.float32)
+    min_head = np.zeros(n_periods, dtype = np.int32)
+    min_tail = np.zeros(n_periods, dtype = np.int32)
+    max_head = np.zeros(n_periods, dtype = np.int32)
+    max_tail = np.zeros(n_periods, dtype = np.int32)
+    
+    for i in range(data_size):
         
-        # --- Check for update Highest High:
-        highest_high = max(highest_high, data_temp)
+        data_temp = data[i]
         
-        if data_temp_shft == highest_high:
-            # If removed value was highest_high, then recalculate highest_high.            
-            # Recalculate Highest High.
-            highest_high = data[i_shifted + 1]
-            for j in range(i_shifted + 2, i + 1):
-                data_temp_j: np.float32 = data[j]
-                highest_high = max(highest_high, data_temp_j)
-            pass
+        for k in range(n_periods):
+            period    = periods[k]
+            i_expired = i - period
+            
+            # --- Lowest Low ( head / tail in registers, stored back once ).
+            head = min_head[k]
+            tail = min_tail[k]
+            while tail != head and min_val[k, (tail - 1) & buf_mask] >= data_temp:
+                tail -= 1
+            min_buf[k, tail & buf_mask] = i
+            min_val[k, tail & buf_mask] = data_temp
+            min_tail[k]                 = tail + 1
+            head                       += np.int32(min_buf[k, head & buf_mask] <= i_expired)
+            min_head[k]                 = head
+            lowest_low                  = min_val[k, head & buf_mask]
+            
+            # --- Highest High.
+            head = max_head[k]
+            tail = max_tail[k]
+            while tail != head and max_val[k, (tail - 1) & buf_mask] <= data_temp:
+                tail -= 1
+            max_buf[k, tail & buf_mask] = i
+            max_val[k, tail & buf_mask] = data_temp
+            max_tail[k]                 = tail + 1
+            head                       += np.int32(max_buf[k, head & buf_mask] <= i_expired)
+            max_head[k]                 = head
+            highest_high                = max_val[k, head & buf_mask]
+            
+            if i >= period:
+                high_low_range = highest_high - lowest_low
+                
+                res_val          = (highest_high - data_temp) / max(high_low_range, np.float32(1e-30))
+                result_mat[k, i] = res_val if high_low_range > 0 else np.float32(0.0)
+    
+    return
+
+# -----------------------------------------------------------------------------------
+#
+#               William %R OC (sweep tsf) - Many periods, Sparse Table, Multi-Core
+#
+# -----------------------------------------------------------------------------------
+
+_locals_sweep = {
+        'max_period':       numba.int32,
+        'n_levels':         numba.int32,
+        'half':             numba.int32,
+        'period':           numba.int32,
+        'level':            numba.int32,
+        'width':            numba.int32,
+        'data_temp':        numba.float32,
+        'lowest_low':       numba.float32,
+        'highest_high':     numba.float32,
+        'high_low_range':   numba.float32,
+        'res_val':          numba.float32,  }
+
+@numba.njit(_signature_multi_tsf,
+            cache       = True, 
+            fastmath    = True, 
+            nogil       = True,
+            boundscheck = False,
+            error_model = 'numpy',
+            parallel    = True,
+            locals      = _locals_sweep, )
+def get_william_oc_sweep(
+                        data:       np.ndarray[np.float32], 
+                        periods:    np.ndarray[np.int32],
+                        data_size:  np.int32,
+                        result_mat: np.ndarray[np.float32],
+                            ) -> None:
+    '''
+    Get William OC for a sweep of many periods ( e.g. 5 .. 50 ), runs on all cores.
+    Row `result_mat[k]` is equal to `get_william_oc_tsf()` with `periods[k]`.
+    
+    Sparse Table of window Min / Max ( windows 1, 2, 4 .. up to max period ) is built once, 
+    O(N log(max period)), then every ( period, i ) value is O(1) - 
+    Min / Max of two overlapping windows of `2^floor(log2(period))`, independent values in `numba.prange()`.
+    For a few periods `get_william_oc_multi_tsf()` is cheaper ( no table ).
+    
+    Memory: `2 * (floor(log2(max period)) + 1) * data_size` float32 values.
+    
+    ---
+    
+    Parameters:
+    -----------
+    data:       (`np.ndarray[np.float32]`) : array of values.
+    periods:    (`np.ndarray[np.int32]`)   : Periods, K values.
+        '(periods[k] >= 2)'
+    data_size:  (`np.int32`)               : size of data array.
+    result_mat: (`np.ndarray[np.float32]`) : 2D Result array, shape ( K, data_size ).
+        Results will be rewritten in this array.
+    '''
+    
+    if data_size < 0:
+        data_size = data.shape[0]
+    
+    n_periods: int = periods.shape[0]
+    
+    max_period = 1
+    for k in range(n_periods):
+        result_mat[k, :min(periods[k], data_size)] = 0.5    # Default value for the first period.
+        max_period = max(max_period, periods[k])
+    
+    # Levels 0 .. n_levels - 1, window of level `lvl` is `2^lvl` values, `st[lvl, i]` - window starting at `i`.
+    n_levels = 1
+    while (1 << n_levels) <= max_period:
+        n_levels += 1
+    
+    st_min = np.empty((n_levels, data_size), dtype = np.float32)
+    st_max = np.empty((n_levels, data_size), dtype = np.float32)
+    
+    st_min[0, :] = data[:data_size]
+    st_max[0, :] = data[:data_size]
+    
+    for lvl in range(1, n_levels):
+        half = 1 << (lvl - 1)
+        for i in numba.prange(max(data_size - 2 * half + 1, 0)):
+            st_min[lvl, i] = min(st_min[lvl - 1, i], st_min[lvl - 1, i + half])
+            st_max[lvl, i] = max(st_max[lvl - 1, i], st_max[lvl - 1, i + half])
+    
+    for k in range(n_periods):
+        period = periods[k]
         
-        high_low_range: np.float32 = highest_high - lowest_low
+        level = 0
+        while (2 << level) <= period:
+            level += 1
+        width = 1 << level
         
-        result_arr[i] = 0.0
-        if high_low_range > 0:
-            result_arr[i] = (highest_high - data_temp) / high_low_range
+        for i in numba.prange(period, data_size):
+            data_temp      = data[i]
+            lowest_low     = min(st_min[level, i - period + 1], st_min[level, i - width + 1])
+            highest_high   = max(st_max[level, i - period + 1], st_max[level, i - width + 1])
+            high_low_range = highest_high - lowest_low
+            
+            res_val          = (highest_high - data_temp) / max(high_low_range, np.float32(1e-30))
+            result_mat[k, i] = res_val if high_low_range > 0 else np.float32(0.0)
     
     return
 
@@ -245,6 +718,8 @@ _spec_func_vtsf = numba.types.float32(
                     numba.int32, )
 
 _locals_vtsf = {
+        'i':                numba.int32,
+        'star_indx':        numba.int32,
         'lowest_low':       numba.float32,
         'highest_high':     numba.float32,
         'high_low_range':   numba.float32,                
@@ -255,7 +730,8 @@ _locals_vtsf = {
             cache       = True, 
             fastmath    = True, 
             nogil       = True,
-            boundscheck = False,            
+            boundscheck = False,
+            error_model = 'numpy',            
             locals      = _locals_vtsf, )
 def get_william_oc_vtsf(
                     data:       np.ndarray[np.float32],
@@ -292,12 +768,10 @@ def get_william_oc_vtsf(
     # Calculate William %R.
     high_low_range: np.float32 = highest_high - lowest_low
     
-    if high_low_range < 0.0000000001:
-        return 0.0
+    # Division by a clamped range is always safe, result is selected ( no branch ).
+    res_val: np.float32 = (highest_high - data_temp) / max(high_low_range, np.float32(0.0000000001))
     
-    res_val: np.float32 = (highest_high - data_temp) / high_low_range
-    
-    return res_val
+    return res_val if high_low_range >= np.float32(0.0000000001) else np.float32(0.0)
 
 # -----------------------------------------------------------------------------------
 #
@@ -305,6 +779,45 @@ def get_william_oc_vtsf(
 #
 # -----------------------------------------------------------------------------------
 
+@cuda.jit(device = True, inline = True)
+def get_william_oc_vtsf_cuda_dev(
+                                data:      np.ndarray[np.float32],
+                                period:    np.int32,
+                                data_indx: np.int32,
+                                    ) -> np.float32:
+    '''
+    Returns single value of William OC, CUDA device function.
+    Call it per thread from your own kernel ( many indexes / periods / symbols in one launch ), 
+    window is read from global memory ( read only cache ).
+    
+    Parameters:
+    -----------
+    data:      (`np.ndarray[np.float32]`) : array of values ( device array ).
+    period:    (`np.int32`)               : period of William OC.
+    data_indx: (`np.int32`)               : index of value.
+        Warning: **( data_indx >= period - 1 )**
+    
+    Returns:
+    --------
+    (`np.float32`) : William OC value.
+    '''
+    
+    data_temp:    float = cuda.ldca(data, data_indx)
+    lowest_low:   float = data_temp
+    highest_high: float = data_temp
+    
+    for j in range(data_indx - period + 1, data_indx):
+        data_j: float = cuda.ldca(data, j)
+        lowest_low    = min(lowest_low, data_j)
+        highest_high  = max(highest_high, data_j)
+    
+    high_low_range: float = highest_high - lowest_low
+    
+    # Division by a clamped range is always safe, result is selected ( no branch ).
+    res_val: float = (highest_high - data_temp) / max(high_low_range, 1e-30)
+    
+    return res_val if high_low_range > 0.0 else 0.0
+
 @cuda.jit()
 def get_william_oc_vtsf_cuda(
                 data:       np.ndarray[np.float32],
@@ -313,28 +826,163 @@ def get_william_oc_vtsf_cuda(
                 res_indx:   np.int32,
                 res_arr:    np.ndarray[np.float32],
                     ) -> None:
+    '''
+    Updates `res_arr[res_indx]` with single value of William OC, GPU Kernel.
+    
+    Deprecated: one launch per value, launch latency dominates - 
+        use `get_william_oc_vtsf_cuda_dev()` inside a kernel, or `get_william_oc_cuda()` for the whole array.
+    '''
+    
+    res_arr[res_indx] = get_william_oc_vtsf_cuda_dev(data, period, data_indx)
+    
+    return
 
-    star_indx:    int   = data_indx - period + 1
-    data_temp:    float = data[star_indx]
-    lowest_low:   float = data_temp
-    highest_high: float = data_temp
+# -----------------------------------------------------------------------------------
+#
+#               William %R OC (GPU) - Whole Array, one launch
+#
+# -----------------------------------------------------------------------------------
+
+_WILLIAM_CUDA_THREADS:    int = 256     # Max threads per block of get_william_oc_range_cuda().
+_WILLIAM_CUDA_MAX_PERIOD: int = 256     # Max period for the shared memory tile, longer periods read global memory.
+_WILLIAM_CUDA_TILE:       int = _WILLIAM_CUDA_THREADS + _WILLIAM_CUDA_MAX_PERIOD - 1     # ( float32 ) 2 KB of shared memory, x5 buffers.
+
+@cuda.jit()
+def get_william_oc_range_cuda(
+                                data:    np.ndarray[np.float32],
+                                period:  np.int32,
+                                i_start: np.int32,
+                                i_end:   np.int32,
+                                res_arr: np.ndarray[np.float32],
+                                    ) -> None:
+    '''
+    William OC for indexes `[i_start, i_end)`, by updating `res_arr[]`, one thread per index.
+    GPU Kernel, grid stride loop: any grid size covers the whole range with one launch.
     
-    for i in range(star_indx + 1, data_indx + 1):
+    For `period <= _WILLIAM_CUDA_MAX_PERIOD` the block loads its windows ( `threads + period - 1` values ) 
+    into shared memory once, cooperatively, every value is read from global memory once per block, 
+    instead of `period` times.
+    Window Min / Max are built in shared memory by doubling ( windows 2, 4, 8 .. ), 
+    every thread then reads two overlapping windows - `log2(period)` steps instead of a `period` scan.
+    
+    Launch:
+    -------
+    >>> blocks = (i_end - i_start + threads - 1) // threads     # threads <= _WILLIAM_CUDA_THREADS
+    >>> get_william_oc_range_cuda[blocks, threads](d_data, period, i_start, i_end, d_res_arr)
+    
+    Parameters:
+    -----------
+    data:    (`np.ndarray[np.float32]`) : Input data array ( device array ).
+    period:  (`np.int32`)               : period of William OC.
+    i_start: (`np.int32`)               : First index.
+        Warning: **( i_start >= period - 1 )**
+    i_end:   (`np.int32`)               : End index ( exclusive ).
+    res_arr: (`np.ndarray[np.float32]`) : Result array ( device array ).
+        Array updated with William OC values, `res_arr[i]` for `data[i]`.
+    '''
+    
+    tile  = cuda.shared.array(_WILLIAM_CUDA_TILE, dtype = numba.float32)
+    min_a = cuda.shared.array(_WILLIAM_CUDA_TILE, dtype = numba.float32)
+    max_a = cuda.shared.array(_WILLIAM_CUDA_TILE, dtype = numba.float32)
+    min_b = cuda.shared.array(_WILLIAM_CUDA_TILE, dtype = numba.float32)
+    max_b = cuda.shared.array(_WILLIAM_CUDA_TILE, dtype = numba.float32)
+    
+    thread_indx: int  = cuda.threadIdx.x
+    threads:     int  = cuda.blockDim.x
+    use_tile:    bool = period <= _WILLIAM_CUDA_MAX_PERIOD
+    
+    # Loop over first indexes of the block - same for all threads of the block, `cuda.syncthreads()` is safe.
+    for block_first in range(i_start + cuda.blockIdx.x * threads, i_end, cuda.gridsize(1)):
+        i: int = block_first + thread_indx
+        
+        if use_tile:
+            tile_first: int = block_first - period + 1
+            tile_size:  int = min(threads, i_end - block_first) + period - 1
+            
+            for k in range(thread_indx, tile_size, threads):
+                tile[k] = cuda.ldca(data, tile_first + k)
+            
+            cuda.syncthreads()
+            
+            # Min / Max of windows `2 * width` from windows `width`, ping-pong buffers ( level 0 is the tile ).
+            width: int = 1
+            level: int = 0
+            while 2 * width <= period:
+                src_min = tile if level == 0 else (min_b if level % 2 == 0 else min_a)
+                src_max = tile if level == 0 else (max_b if level % 2 == 0 else max_a)
+                dst_min = min_a if level % 2 == 0 else min_b
+                dst_max = max_a if level % 2 == 0 else max_b
+                
+                for k in range(thread_indx, tile_size - 2 * width + 1, threads):
+                    dst_min[k] = min(src_min[k], src_min[k + width])
+                    dst_max[k] = max(src_max[k], src_max[k + width])
+                
+                cuda.syncthreads()
+                width *= 2
+                level += 1
+            
+            if i < i_end:
+                fin_min = tile if level == 0 else (min_a if level % 2 == 1 else min_b)
+                fin_max = tile if level == 0 else (max_a if level % 2 == 1 else max_b)
+                
+                # Window [thread_indx, thread_indx + period - 1] is covered by two ( overlapping ) `width` windows.
+                data_temp:    float = tile[thread_indx + period - 1]
+                lowest_low:   float = min(fin_min[thread_indx], fin_min[thread_indx + period - width])
+                highest_high: float = max(fin_max[thread_indx], fin_max[thread_indx + period - width])
+                
+                high_low_range: float = highest_high - lowest_low
+                res_val:        float = (highest_high - data_temp) / max(high_low_range, 1e-30)
+                
+                res_arr[i] = res_val if high_low_range > 0.0 else 0.0
+            
+            cuda.syncthreads()     # Tile is reused by the next loop.
         
-        data_temp: float = data[i]        
-        lowest_low       = min(lowest_low, data_temp)
-        highest_high     = max(highest_high, data_temp)
+        elif i < i_end:
+            res_arr[i] = get_william_oc_vtsf_cuda_dev(data, period, i)
     
-    # Calculate William %R.
-    high_low_range: float = highest_high - lowest_low
+    return
 
-    res_val = 0.0
+def get_william_oc_cuda(
+                        data:              np.ndarray[np.float32],
+                        period:            int,
+                        threads_per_block: int = _WILLIAM_CUDA_THREADS,
+                            ) -> np.ndarray[np.float32]:
+    '''
+    Get William OC of the given array, calculated on GPU.
+    Same layout as `get_william_oc()`, first `period` values are 0.5.
+    
+    Launches `get_william_oc_range_cuda()` once for the whole array, 
+    instead of one `get_william_oc_vtsf_cuda()` launch per value.
+    
+    Parameters:
+    -----------
+    data:              (`np.ndarray[np.float32]`) : Input data array.
+        Host array, or CUDA device array.
+    period:            (`int`)                    : period of William OC.
+    threads_per_block: (`int`)                    : CUDA block size, up to `_WILLIAM_CUDA_THREADS`.
+    
+    Returns:
+    --------
+    (`np.ndarray[np.float32]`) : William OC array.
+        If `data` is a device array, result is a device array too.
+    '''
     
-    if high_low_range > 0.0000000001:
-        res_val: float = (highest_high - data_temp) / high_low_range
+    is_device: bool = hasattr(data, '__cuda_array_interface__')
+    d_data          = data if is_device else cuda.to_device(np.ascontiguousarray(data, dtype = np.float32))
+    data_size: int  = d_data.shape[0]
     
-    res_arr[res_indx] = res_val
+    res_arr: np.ndarray[np.float32] = np.full(data_size, 0.5, dtype = np.float32)   # Default value for the first period.
+    d_res_arr                       = cuda.to_device(res_arr)
     
-    return
+    threads_per_block = min(threads_per_block, _WILLIAM_CUDA_THREADS)
+    blocks: int       = (data_size - period + threads_per_block - 1) // threads_per_block
+    
+    if blocks > 0:
+        get_william_oc_range_cuda[blocks, threads_per_block](d_data, period, period, data_size, d_res_arr)
+    
+    if is_device:
+        return d_res_arr
+    
+    return d_res_arr.copy_to_host()
 
 # -----------------------------------------------------------------------------------
\ No newline at end of file
@@ -5,13 +5,15 @@ import numba
 # -----------------------------------------------------------------------------------
 
 _name_:           str = 'Types - TI Lib'
-__version__:      str = '0.0.1'
-__version_date__: str = '2024-09-16'
+__version__:      str = '0.0.2'
+__version_date__: str = '2026-10-15'
 VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}' 
 
 # --- VERSION HISTORY: --------------------------------------------------------------
 
 # v0.0.1 @ 2024-09-16 : Initial Release.
+# v0.0.2 @ 2026-10-15 : get_ti_type_str() - constant tuple lookup instead of if chain.
+#                       get_ti_type_str() inlined into njit callers.
 #
 
 # -----------------------------------------------------------------------------------
@@ -41,32 +43,30 @@ class TI_ID(IntEnum):
 #
 # -----------------------------------------------------------------------------------
 
-@numba.njit(cache = True)
+# NOTE: Names indexed by `ti_ID + 1`, order MUST follow TI_ID.
+_TI_NAMES: tuple = ( 'NONE', 
+                     'PCNT_CH', 
+                     'ONES', 
+                     'RSI', 
+                     'BB', 
+                     'AROON', 
+                     'WILLIAM_OC', 
+                     'MABOP_OC', 
+                     'LR_SLOPE', 
+                     'LR_EXP_DEV', )
+
+@numba.njit(cache       = True,
+            error_model = 'numpy',
+            inline      = 'always', )
 def get_ti_type_str(ti_ID: np.int64) -> str:
     '''
     Returns TI Type Name ('str') by ID ('int').
     '''
     
-    if ti_ID == -1:
-        return 'NONE'
-    if ti_ID == 0:
-        return 'PCNT_CH'
-    if ti_ID == 1:
-        return 'ONES'
-    if ti_ID == 2:
-        return 'RSI'
-    if ti_ID == 3:
-        return 'BB'
-    if ti_ID == 4:
-        return 'AROON'
-    if ti_ID == 5:
-        return 'WILLIAM_OC'
-    if ti_ID == 6:
-        return 'MABOP_OC'
-    if ti_ID == 7:
-        return 'LR_SLOPE'
-    if ti_ID == 8:
-        return 'LR_EXP_DEV'
+    names_indx = ti_ID + 1
+    
+    if 0 <= names_indx < len(_TI_NAMES):
+        return _TI_NAMES[names_indx]
     
     return 'UNKNOWN'
 
@@ -0,0 +1,26 @@
+'''
+Aroon Indicator: machine code of the njit kernels.
+'''
+
+import numba
+import pytest
+
+from technical_indicator_lib.ti_function_set import aroon
+
+
+_KERNELS = sorted(name for name in dir(aroon)
+                    if isinstance(getattr(aroon, name), numba.core.registry.CPUDispatcher))
+
+
+def _fresh_asm(dispatcher) -> str:
+    # `inspect_asm()` is empty for kernels loaded from the on-disk cache - recompile without it.
+    options = {key: val for key, val in dispatcher.targetoptions.items() if key not in ('cache', 'nopython')}
+    fresh   = numba.njit(dispatcher.signatures[0], **options)(dispatcher.py_func)
+
+    return next(iter(fresh.inspect_asm().values()))
+
+
+@pytest.mark.parametrize('name', _KERNELS)
+def test_aroon_no_division_checks(name: str) -> None:
+    # `1 / period` raises ZeroDivisionError under the Python error model ( check and branch in every kernel ).
+    assert 'ZeroDivisionError' not in _fresh_asm(getattr(aroon, name))
@@ -0,0 +1,106 @@
+'''
+Bollinger Bands: rolling kernels against a float64 reference.
+'''
+
+import numpy as np
+import pytest
+
+import technical_indicator_lib as ti_lib
+
+
+def _bb_reference(data_arr: np.ndarray, period: int) -> np.ndarray:
+    '''
+    float64 two pass Bollinger Bands value, same layout as `get_bb()`.
+    '''
+    data_f64 = data_arr.astype(np.float64)
+    win_view = np.lib.stride_tricks.sliding_window_view(data_f64, period)
+    mean     = win_view.mean(axis = 1)
+    std      = win_view.std(axis = 1)
+
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        z_val = np.where(std > 0.0, (data_f64[period - 1:] - mean) / std, 0.0)
+
+    res_arr              = np.zeros(len(data_f64))
+    res_arr[period - 1:] = np.clip(z_val, -3.0, 3.0)
+    res_arr[:period]     = 0.0
+
+    return res_arr
+
+
+def _random_walk(data_size: int, level: float = 1000.0, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+
+    return (level + np.cumsum(rng.normal(0.0, 1.0, data_size))).astype(np.float32)
+
+
+@pytest.mark.parametrize('period', [2, 14, 50])
+def test_bb_long_series_matches_float64_reference(period: int) -> None:
+    data_arr = _random_walk(400_000)
+
+    res_arr = ti_lib.get_bb(data_arr, period)
+    ref_arr = _bb_reference(data_arr, period)
+
+    assert np.abs(res_arr - ref_arr).max() < 1e-4
+
+
+def test_bb_two_phase_kernel_on_benchmark_series() -> None:
+    # Series of benchmarks/bench_aroon_kernels.py, 2M values, levels up to several thousands.
+    rng      = np.random.default_rng(0)
+    data_arr = (100.0 + np.cumsum(rng.standard_normal(2_000_000))).astype(np.float32)
+    period   = 14
+
+    ref_arr = _bb_reference(data_arr, period)
+
+    res_arr = np.empty_like(data_arr)
+    ti_lib.tsf_bb(data_arr, period, data_arr.shape[0], res_arr)
+
+    assert np.abs(res_arr - ref_arr).max() < 1e-4
+    assert np.abs(ti_lib.get_bb_dispatch(data_arr, period) - ref_arr).max() < 1e-4
+
+
+@pytest.mark.parametrize('period', [14, 17_000])
+def test_bb_tsf_parallel_equals_serial(period: int) -> None:
+    # period 17_000: tile is `4 * period`, not a multiple of the 64K default tile.
+    data_arr  = _random_walk(400_000, seed = 1)
+    data_size = data_arr.shape[0]
+
+    serial_arr   = np.empty_like(data_arr)
+    parallel_arr = np.empty_like(data_arr)
+    ti_lib.tsf_bb(data_arr, period, data_size, serial_arr)
+    ti_lib.tsf_bb_parallel(data_arr, period, data_size, parallel_arr)
+
+    np.testing.assert_array_equal(parallel_arr, serial_arr)
+
+
+def test_bb_full_tsf_long_series_matches_float64_reference() -> None:
+    data_arr  = _random_walk(400_000)
+    data_size = data_arr.shape[0]
+    period    = 14
+
+    upper_arr, mid_arr, lower_arr, bandw_arr, pctb_arr = (np.empty_like(data_arr) for _ in range(5))
+    ti_lib.tsf_bb_full(data_arr, period, data_size, upper_arr, mid_arr, lower_arr, bandw_arr, pctb_arr)
+
+    win_view = np.lib.stride_tricks.sliding_window_view(data_arr.astype(np.float64), period)[1:]
+    mean     = win_view.mean(axis = 1)
+    std      = win_view.std(axis = 1)
+
+    # float32 output at price ~1000: ulp is 6e-5.
+    assert np.abs(mid_arr[period:]   - mean).max()           < 2e-4
+    assert np.abs(upper_arr[period:] - (mean + 2.0 * std)).max() < 5e-4
+    assert np.abs(lower_arr[period:] - (mean - 2.0 * std)).max() < 5e-4
+    assert np.abs(pctb_arr[period:]  - (0.5 + (data_arr[period:] - mean) / (4.0 * std))).max() < 1e-4
+
+
+def test_bb_vtsf_long_series_matches_float64_reference() -> None:
+    data_arr = _random_walk(400_000)
+    period   = 14
+    indx_arr = np.arange(period, data_arr.shape[0], 97, dtype = np.int32)
+
+    ref_arr = _bb_reference(data_arr, period)[indx_arr]
+
+    res_arr = np.empty(indx_arr.shape[0], dtype = np.float32)
+    ti_lib.vtsf_bb_batch(data_arr, period, indx_arr, res_arr)
+
+    assert np.abs(res_arr - ref_arr).max() < 1e-4
+    assert max(abs(ti_lib.vtsf_bb(data_arr, period, indx) - ref_val) 
+                    for indx, ref_val in zip(indx_arr[::50], ref_arr[::50])) < 1e-4
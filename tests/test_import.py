@@ -0,0 +1,54 @@
+'''
+Import smoke tests.
+
+All `@numba.njit` functions with signatures are compiled at import time,
+so a lowering error in any kernel fails `import technical_indicator_lib`.
+'''
+
+import importlib
+
+import pytest
+
+
+_MODULES = (
+    'technical_indicator_lib',
+    'technical_indicator_lib._ti_methods',
+    'technical_indicator_lib.ti_type_ID',
+    'technical_indicator_lib.ti_function_set',
+    'technical_indicator_lib.ti_function_set._constants',
+    'technical_indicator_lib.ti_function_set.aroon',
+    'technical_indicator_lib.ti_function_set.bb',
+    'technical_indicator_lib.ti_function_set.lr_exp_dev',
+    'technical_indicator_lib.ti_function_set.lr_slope',
+    'technical_indicator_lib.ti_function_set.mabop_oc',
+    'technical_indicator_lib.ti_function_set.ones',
+    'technical_indicator_lib.ti_function_set.pcnt_ch',
+    'technical_indicator_lib.ti_function_set.rsi',
+    'technical_indicator_lib.ti_function_set.shift',
+    'technical_indicator_lib.ti_function_set.william_oc', )
+
+
+@pytest.mark.parametrize('module_name', _MODULES)
+def test_import_module(module_name: str) -> None:
+    module = importlib.import_module(module_name)
+
+    assert module is not None
+
+
+def test_public_names_are_callable() -> None:
+    ti_lib = importlib.import_module('technical_indicator_lib')
+
+    public_names = [name for name in dir(ti_lib)
+                        if name.startswith(('get_', 'tsf_', 'vtsf_', 'aot_'))]
+
+    assert public_names
+    for name in public_names:
+        assert callable(getattr(ti_lib, name)), name
+
+
+def test_aot_build_module_imports() -> None:
+    pytest.importorskip('numba.pycc')
+
+    aot_build = importlib.import_module('technical_indicator_lib._aot_build')
+
+    assert aot_build.cc is not None
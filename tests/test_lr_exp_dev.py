@@ -0,0 +1,57 @@
+'''
+Linear Regression - Deviation from expected value: rolling kernels against a float64 reference.
+'''
+
+import numpy as np
+import pytest
+
+import technical_indicator_lib as ti_lib
+
+
+def _lr_exp_dev_reference(data_arr: np.ndarray, period: int, expected_period: int) -> np.ndarray:
+    '''
+    float64 window sums, same layout as `get_lr_exp_dev()`.
+    '''
+    data_f64    = data_arr.astype(np.float64)
+    period_calc = period + expected_period
+
+    win_view  = np.lib.stride_tricks.sliding_window_view(data_f64, period)
+    x_arr     = np.arange(1, period + 1, dtype = np.float64)
+    sum_x     = x_arr.sum()
+    sum_y     = win_view.sum(axis = 1)
+    slope     = (period * (win_view @ x_arr) - sum_x * sum_y) * 12.0 / (period**2 * (period - 1.0)**2)
+    intercept = (sum_y - slope * sum_x) / period
+    expected  = slope * period_calc + intercept
+
+    res_arr = np.zeros(len(data_f64))
+    indx    = np.arange(period_calc, len(data_f64))
+    res_arr[period_calc:] = np.clip(1.0 - expected[indx - period_calc + 1] / data_f64[indx], -1.0, 1.0)
+
+    return res_arr
+
+
+def _random_walks(n_bars: int, n_symbols: int, level: float = 1000.0, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+
+    return (level + np.cumsum(rng.normal(0.0, 1.0, (n_bars, n_symbols)), axis = 0)).astype(np.float32)
+
+
+@pytest.mark.parametrize('period_mix', [14, 5_014, 20_100])
+def test_lr_exp_dev_mini_long_series_matches_float64_reference(period_mix: int) -> None:
+    data_arr = _random_walks(400_000, 1)[:, 0].copy()
+
+    ref_arr = _lr_exp_dev_reference(data_arr, period_mix % 1000, period_mix // 1000)
+
+    assert np.abs(ti_lib.get_lr_exp_dev_mini(data_arr, period_mix) - ref_arr).max() < 1e-5
+
+
+def test_lr_exp_dev_batch_symbols_matches_float64_reference() -> None:
+    # 8192 bars: two full seed blocks, rolling sums drift the most at the end of a block.
+    data_mat   = _random_walks(8192, 16)
+    result_mat = np.empty_like(data_mat)
+    ti_lib.tsf_lr_exp_dev_batch_symbols(data_mat, 5_014, result_mat)
+
+    for s in range(data_mat.shape[1]):
+        ref_arr = _lr_exp_dev_reference(np.ascontiguousarray(data_mat[:, s]), 14, 5)
+
+        assert np.abs(result_mat[:, s] - ref_arr).max() < 1e-5, s
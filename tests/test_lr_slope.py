@@ -0,0 +1,82 @@
+'''
+Linear Regression Slope: rolling kernels against a float64 reference, parallel tiles against serial.
+'''
+
+import numpy as np
+import pytest
+
+import technical_indicator_lib as ti_lib
+
+
+def _lr_slope_reference(data_arr: np.ndarray, period: int) -> np.ndarray:
+    '''
+    float64 window sums, same slope scale and layout as `get_lr_slope()`.
+    '''
+    win_view = np.lib.stride_tricks.sliding_window_view(data_arr.astype(np.float64), period)
+    x_arr    = np.arange(1, period + 1, dtype = np.float64)
+    slope    = (period * (win_view @ x_arr) - x_arr.sum() * win_view.sum(axis = 1)) * 12.0 / (period**2 * (period - 1.0)**2)
+
+    res_arr              = np.zeros(len(data_arr))
+    res_arr[period - 1:] = np.arctan(slope) / (0.5 * np.pi)
+    res_arr[:period]     = 0.0
+
+    return res_arr
+
+
+@pytest.mark.parametrize('period', [2, 14, 100])
+def test_lr_slope_long_series_matches_float64_reference(period: int) -> None:
+    # Price level ~1000: float32 sums of raw values would cancel in `period * sum_xy - sum_x * sum_y`.
+    rng      = np.random.default_rng(0)
+    data_arr = (1000.0 + np.cumsum(rng.normal(0.0, 1.0, 400_000))).astype(np.float32)
+
+    ref_arr = _lr_slope_reference(data_arr, period)
+
+    assert np.abs(ti_lib.get_lr_slope(data_arr, period)          - ref_arr).max() < 1e-5
+    assert np.abs(ti_lib.get_lr_slope_dispatch(data_arr, period) - ref_arr).max() < 1e-5
+    assert max(abs(ti_lib.vtsf_lr_slope(data_arr, period, i) - ref_arr[i]) for i in range(period, 400_000, 997)) < 1e-5
+
+
+@pytest.mark.parametrize('period', [2, 14, 100])
+def test_lr_slope_tsf_parallel_equals_serial(period: int) -> None:
+    rng       = np.random.default_rng(0)
+    data_arr  = (1000.0 + np.cumsum(rng.normal(0.0, 1.0, 400_000))).astype(np.float32)
+    data_size = data_arr.shape[0]
+
+    serial_arr   = np.empty_like(data_arr)
+    parallel_arr = np.empty_like(data_arr)
+    ti_lib.tsf_lr_slope(data_arr, period, data_size, serial_arr)
+    ti_lib.tsf_lr_slope_parallel(data_arr, period, data_size, parallel_arr)
+
+    np.testing.assert_array_equal(parallel_arr, serial_arr)
+
+
+@pytest.mark.parametrize('period', [2, 3])
+def test_lr_slope_zero_crossing_matches_float64_reference(period: int) -> None:
+    # Walk crossing zero, short periods: a float32 block seed `sum_y` would drift `sum_xy` through the block.
+    rng       = np.random.default_rng(1)
+    data_arr  = np.cumsum(rng.normal(0.0, 5.0, 300_000)).astype(np.float32)
+    data_size = data_arr.shape[0]
+
+    ref_arr = _lr_slope_reference(data_arr, period)
+
+    serial_arr   = np.empty_like(data_arr)
+    parallel_arr = np.empty_like(data_arr)
+    ti_lib.tsf_lr_slope(data_arr, period, data_size, serial_arr)
+    ti_lib.tsf_lr_slope_parallel(data_arr, period, data_size, parallel_arr)
+
+    assert np.abs(ti_lib.get_lr_slope(data_arr, period)          - ref_arr).max() < 1e-6
+    assert np.abs(ti_lib.get_lr_slope_dispatch(data_arr, period) - ref_arr).max() < 1e-6
+    assert np.abs(serial_arr[period:] - ref_arr[period:]).max() < 1e-6
+    np.testing.assert_array_equal(parallel_arr, serial_arr)
+
+
+@pytest.mark.parametrize('level', [0.0, 50_000.0])
+@pytest.mark.parametrize('period', [2, 3])
+def test_lr_slope_np_short_period_matches_float64_reference(period: int, level: float) -> None:
+    # Short periods: float32 dot products of raw values cancel in `period * sum_xy - sum_x * sum_y`.
+    rng      = np.random.default_rng(2)
+    data_arr = (level + np.cumsum(rng.normal(0.0, 5.0, 300_000))).astype(np.float32)
+
+    ref_arr = _lr_slope_reference(data_arr, period)
+
+    assert np.abs(ti_lib.get_lr_slope_np(data_arr, period) - ref_arr).max() < 1e-6
@@ -0,0 +1,335 @@
+'''
+Every variant of a TI function against its baseline ( serial / single series ) result, random data.
+
+Series are longer than 100K values, so tiled ( `_parallel` ), re-seeded ( `_LR_SEED_BLOCK`, `_BB_SIMD_BLOCK` )
+and chunked ( `_batch*` ) code paths run several blocks / tiles.
+'''
+
+import numpy as np
+import pytest
+from numba import cuda
+
+import technical_indicator_lib as ti_lib
+from technical_indicator_lib.ti_function_set.bb import _CUDA_REDUCE_THREADS
+
+
+DATA_SIZE: int = 200_000
+
+_PERIODS = (14, 200)
+
+
+def _random_walk(data_size: int, level: float = 1000.0, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+
+    return (level + np.cumsum(rng.normal(0.0, 1.0, data_size))).astype(np.float32)
+
+
+def _random_walks(n_bars: int, n_series: int, level: float = 1000.0, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+
+    return (level + np.cumsum(rng.normal(0.0, 1.0, (n_bars, n_series)), axis = 0)).astype(np.float32)
+
+
+def _from_bf16(data_bf16: np.ndarray) -> np.ndarray:
+    return (data_bf16.astype(np.uint32) << 16).view(np.float32)
+
+
+def _tsf(func, data_arr: np.ndarray, period: int) -> np.ndarray:
+    result_arr = np.empty(data_arr.shape[0], dtype = np.float32)
+    func(data_arr, period, data_arr.shape[0], result_arr)
+
+    return result_arr
+
+
+def _assert_close(res_arr, ref_arr, atol: float) -> None:
+    if atol == 0.0:
+        np.testing.assert_array_equal(res_arr, ref_arr)
+    else:
+        np.testing.assert_allclose(res_arr, ref_arr, rtol = 0.0, atol = atol)
+
+
+@pytest.fixture(scope = 'module')
+def data_arr() -> np.ndarray:
+    return _random_walk(DATA_SIZE)
+
+
+# -----------------------------------------------------------------------------------
+#
+#       Single series: ( variant, baseline, atol ), `period` argument of both.
+#
+# -----------------------------------------------------------------------------------
+
+# NOTE: `period_mix` of lr_exp_dev_mini is `period` for expected_period = 0.
+_TSF_VARIANTS = (
+    ('tsf_aroon',                    'get_aroon',           0.0),
+    ('tsf_aroon_parallel',           'get_aroon',           0.0),
+    ('tsf_bb',                       'get_bb',              0.0),
+    ('tsf_bb_parallel',              'get_bb',              0.0),
+    ('tsf_lr_exp_dev_mini',          'get_lr_exp_dev_mini', 0.0),
+    ('tsf_lr_exp_dev_mini_parallel', 'get_lr_exp_dev_mini', 0.0),
+    ('tsf_lr_slope',                 'get_lr_slope',        0.0),
+    ('tsf_lr_slope_parallel',        'get_lr_slope',        0.0),
+    ('tsf_mabop_oc',                 'get_mabop_oc',        1e-6),
+    ('tsf_mabop_oc_parallel',        'get_mabop_oc',        1e-6),
+    ('tsf_ones',                     'get_ones',            0.0),
+    ('tsf_pcnt_ch',                  'get_pcnt_ch',         0.0),
+    ('tsf_pcnt_ch_parallel',         'get_pcnt_ch',         1e-6),
+    ('tsf_rsi',                      'get_rsi',             0.0),
+    ('tsf_shift',                    'get_shift',           0.0),
+    ('tsf_william_oc',               'get_william_oc',      0.0),
+    ('tsf_william_oc_parallel',      'get_william_oc',      0.0),
+    ('aot_tsf_aroon',                'get_aroon',           1e-6),
+    ('aot_tsf_bb',                   'get_bb',              1e-6),
+    ('aot_tsf_lr_exp_dev_mini',      'get_lr_exp_dev_mini', 1e-6),
+    ('aot_tsf_lr_slope',             'get_lr_slope',        1e-6),
+    ('aot_tsf_mabop_oc',             'get_mabop_oc',        1e-6),
+    ('aot_tsf_ones',                 'get_ones',            0.0),
+    ('aot_tsf_william_oc',           'get_william_oc',      1e-6), )
+
+_GET_VARIANTS = (
+    ('get_aroon_dispatch',    'get_aroon',           0.0),
+    ('get_bb_dispatch',       'get_bb',              0.0),
+    ('get_lr_slope_dispatch', 'get_lr_slope',        0.0),
+    ('get_lr_slope_np',       'get_lr_slope',        1e-6),
+    ('get_mabop_oc_dispatch', 'get_mabop_oc',        0.0),
+    ('get_pcnt_ch_np',        'get_pcnt_ch',         0.0),
+    ('get_pcnt_ch_mul',       'get_pcnt_ch',         1e-6),
+    ('get_pcnt_ch_v',         'get_pcnt_ch',         1e-6),
+    ('get_rsi_np',            'get_rsi',             1e-4),
+    ('get_william_oc_np',     'get_william_oc',      0.0),
+    ('get_ones_view',         'get_ones',            0.0),
+    ('aot_aroon',             'get_aroon',           1e-6),
+    ('aot_bb',                'get_bb',              1e-6),
+    ('aot_lr_exp_dev_mini',   'get_lr_exp_dev_mini', 1e-6),
+    ('aot_lr_slope',          'get_lr_slope',        1e-6),
+    ('aot_mabop_oc',          'get_mabop_oc',        1e-6),
+    ('aot_ones',              'get_ones',            0.0),
+    ('aot_william_oc',        'get_william_oc',      1e-6), )
+
+_VTSF_VARIANTS = (
+    ('vtsf_aroon',                'get_aroon',           1e-6),
+    ('vtsf_bb',                   'get_bb',              1e-5),
+    ('vtsf_lr_exp_dev_mini',      'get_lr_exp_dev_mini', 1e-5),
+    ('vtsf_lr_slope',             'get_lr_slope',        1e-5),
+    ('vtsf_mabop_oc',             'get_mabop_oc',        1e-6),
+    ('vtsf_ones',                 'get_ones',            0.0),
+    ('vtsf_pcnt_ch',              'get_pcnt_ch',         1e-6),
+    ('vtsf_rsi',                  'get_rsi',             1e-4),
+    ('vtsf_william_oc',           'get_william_oc',      0.0),
+    ('aot_vtsf_aroon',            'get_aroon',           1e-6),
+    ('aot_vtsf_bb',               'get_bb',              1e-5),
+    ('aot_vtsf_lr_exp_dev_mini',  'get_lr_exp_dev_mini', 1e-5),
+    ('aot_vtsf_lr_slope',         'get_lr_slope',        1e-5),
+    ('aot_vtsf_mabop_oc',         'get_mabop_oc',        1e-6),
+    ('aot_vtsf_ones',             'get_ones',            0.0),
+    ('aot_vtsf_william_oc',       'get_william_oc',      1e-6), )
+
+
+@pytest.mark.parametrize('period', _PERIODS)
+@pytest.mark.parametrize('variant, baseline, atol', _TSF_VARIANTS)
+def test_tsf_variant_equals_baseline(data_arr: np.ndarray, variant: str, baseline: str, atol: float, period: int) -> None:
+    res_arr = _tsf(getattr(ti_lib, variant), data_arr, period)
+
+    _assert_close(res_arr, getattr(ti_lib, baseline)(data_arr, period), atol)
+
+
+@pytest.mark.parametrize('period', _PERIODS)
+@pytest.mark.parametrize('variant, baseline, atol', _GET_VARIANTS)
+def test_get_variant_equals_baseline(data_arr: np.ndarray, variant: str, baseline: str, atol: float, period: int) -> None:
+    res_arr = getattr(ti_lib, variant)(data_arr, period)
+
+    _assert_close(res_arr, getattr(ti_lib, baseline)(data_arr, period), atol)
+
+
+@pytest.mark.parametrize('period', _PERIODS)
+@pytest.mark.parametrize('variant, baseline, atol', _VTSF_VARIANTS)
+def test_vtsf_variant_equals_baseline(data_arr: np.ndarray, variant: str, baseline: str, atol: float, period: int) -> None:
+    func     = getattr(ti_lib, variant)
+    indx_arr = np.r_[np.arange(period, DATA_SIZE, 997), DATA_SIZE - 1]
+
+    res_arr = np.array([func(data_arr, period, indx) for indx in indx_arr], dtype = np.float32)
+
+    _assert_close(res_arr, getattr(ti_lib, baseline)(data_arr, period)[indx_arr], atol)
+
+
+@pytest.mark.parametrize('period, expected_period', [(14, 0), (14, 5), (100, 20)])
+def test_lr_exp_dev_variants_equal_baseline(data_arr: np.ndarray, period: int, expected_period: int) -> None:
+    period_mix = expected_period * 1000 + period
+    ref_arr    = ti_lib.get_lr_exp_dev(data_arr, period, expected_period)
+
+    _assert_close(ti_lib.get_lr_exp_dev_mini(data_arr, period_mix),                        ref_arr, 0.0)
+    _assert_close(ti_lib.get_lr_exp_dev_np(data_arr, period, expected_period),             ref_arr, 1e-5)
+    _assert_close(_tsf(ti_lib.tsf_lr_exp_dev_mini_parallel, data_arr, period_mix),         ref_arr, 0.0)
+    _assert_close(ti_lib.aot_lr_exp_dev(data_arr, period, expected_period),                ref_arr, 1e-6)
+
+
+def test_william_oc_into_equals_baseline(data_arr: np.ndarray) -> None:
+    out_arr = np.empty_like(data_arr)
+    res_arr = ti_lib.get_william_oc_into(data_arr, 14, out_arr)
+
+    assert res_arr is out_arr
+    _assert_close(out_arr, ti_lib.get_william_oc(data_arr, 14), 0.0)
+
+    aot_out_arr = np.empty_like(data_arr)
+    ti_lib.aot_william_oc_into(data_arr, 14, aot_out_arr)
+    _assert_close(aot_out_arr, out_arr, 1e-6)
+
+
+# -----------------------------------------------------------------------------------
+#
+#       Compressed input ( bfloat16, int16 ticks ): baseline of the decoded data.
+#
+# -----------------------------------------------------------------------------------
+
+@pytest.mark.parametrize('period', _PERIODS)
+def test_bf16_variants_equal_baseline_of_decoded_data(data_arr: np.ndarray, period: int) -> None:
+    data_bf16 = ti_lib.as_bf16(data_arr)
+    data_dec  = _from_bf16(data_bf16)
+
+    _assert_close(_tsf(ti_lib.tsf_bb_bf16,              data_bf16, period), ti_lib.get_bb(data_dec, period),              1e-5)
+    _assert_close(_tsf(ti_lib.tsf_lr_exp_dev_mini_bf16, data_bf16, period), ti_lib.get_lr_exp_dev_mini(data_dec, period), 1e-6)
+
+
+@pytest.mark.parametrize('period', _PERIODS)
+def test_q16_variant_equals_baseline_of_tick_data(data_arr: np.ndarray, period: int) -> None:
+    data_q16 = ti_lib.as_q16(data_arr, 0.25)
+    ref_arr  = ti_lib.get_william_oc(data_q16.astype(np.float32), period)
+
+    _assert_close(_tsf(ti_lib.tsf_william_oc_q16,     data_q16, period), ref_arr, 0.0)
+    _assert_close(_tsf(ti_lib.aot_tsf_william_oc_q16, data_q16, period), ref_arr, 1e-6)
+
+
+# -----------------------------------------------------------------------------------
+#
+#       Many series / many periods: row ( column ) of a batch against a single call.
+#
+# -----------------------------------------------------------------------------------
+
+@pytest.mark.parametrize('variant, baseline', [('get_aroon_batch',   'get_aroon'),
+                                                 ('get_pcnt_ch_batch', 'get_pcnt_ch'),
+                                                 ('get_rsi_batch',     'get_rsi'), ])
+def test_batch_rows_equal_baseline(variant: str, baseline: str) -> None:
+    data_mat = np.ascontiguousarray(_random_walks(120_000, 4, seed = 1).T)     # ( n_assets, n_bars )
+
+    res_mat = getattr(ti_lib, variant)(data_mat, 14)
+
+    for row in range(data_mat.shape[0]):
+        _assert_close(res_mat[row], getattr(ti_lib, baseline)(data_mat[row], 14), 0.0)
+
+
+@pytest.mark.parametrize('variant, baseline, param, atol', [('tsf_rsi_batch_symbols',        'get_rsi',             14,    0.0),
+                                                              ('tsf_lr_exp_dev_batch_symbols', 'get_lr_exp_dev_mini', 5_014, 1e-5), ])
+def test_batch_symbols_columns_equal_baseline(variant: str, baseline: str, param: int, atol: float) -> None:
+    # 20 symbols: not a multiple of the symbol chunk.
+    data_mat = _random_walks(120_000, 20, seed = 2)     # ( n_bars, n_symbols )
+
+    res_mat = np.empty_like(data_mat)
+    getattr(ti_lib, variant)(data_mat, param, res_mat)
+
+    for s in range(data_mat.shape[1]):
+        _assert_close(res_mat[:, s], getattr(ti_lib, baseline)(np.ascontiguousarray(data_mat[:, s]), param), atol)
+
+
+@pytest.mark.parametrize('variant, baseline, atol', [('tsf_pcnt_ch_multi',    'get_pcnt_ch',         0.0),
+                                                       ('tsf_william_oc_multi', 'get_william_oc',      0.0),
+                                                       ('tsf_william_oc_sweep', 'get_william_oc',      1e-6),
+                                                       ('tsf_lr_exp_dev_batch', 'get_lr_exp_dev_mini', 0.0), ])
+def test_multi_period_rows_equal_baseline(data_arr: np.ndarray, variant: str, baseline: str, atol: float) -> None:
+    periods = np.array([2, 5, 14, 50, 200], dtype = np.int32)
+    if variant == 'tsf_lr_exp_dev_batch':
+        periods = np.array([2, 14, 5_014, 20_100], dtype = np.int32)     # period_mix codes.
+
+    res_mat = np.empty((periods.shape[0], DATA_SIZE), dtype = np.float32)
+    getattr(ti_lib, variant)(data_arr, periods, DATA_SIZE, res_mat)
+
+    for k, period in enumerate(periods):
+        _assert_close(res_mat[k], getattr(ti_lib, baseline)(data_arr, int(period)), atol)
+
+
+def test_bb_vtsf_batch_equals_vtsf(data_arr: np.ndarray) -> None:
+    indx_arr = np.arange(14, DATA_SIZE, 101, dtype = np.int32)
+
+    res_arr = np.empty(indx_arr.shape[0], dtype = np.float32)
+    ti_lib.vtsf_bb_batch(data_arr, 14, indx_arr, res_arr)
+
+    _assert_close(res_arr, [ti_lib.vtsf_bb(data_arr, 14, indx) for indx in indx_arr], 0.0)
+
+
+# -----------------------------------------------------------------------------------
+#
+#       RSI: incremental and quantized versions.
+#
+# -----------------------------------------------------------------------------------
+
+def test_rsi_step_equals_baseline(data_arr: np.ndarray) -> None:
+    state = np.zeros(2, dtype = np.float64)
+
+    res_arr = np.array([ti_lib.vtsf_rsi_step(data_arr, 14, indx, state) for indx in range(DATA_SIZE)], dtype = np.float32)
+
+    _assert_close(res_arr, ti_lib.get_rsi(data_arr, 14), 0.0)
+
+
+def test_rsi_u8_and_mask_equal_baseline(data_arr: np.ndarray) -> None:
+    rsi_u8 = ti_lib.get_rsi_u8(data_arr, 14)
+
+    assert np.abs(rsi_u8.astype(np.float64) - ti_lib.get_rsi(data_arr, 14)).max() <= 0.5
+    np.testing.assert_array_equal(ti_lib.get_rsi_mask_lt(rsi_u8, 30), rsi_u8 < 30)
+
+
+# -----------------------------------------------------------------------------------
+#
+#       GPU: host functions and single value kernels ( CUDA device required ).
+#
+# -----------------------------------------------------------------------------------
+
+_CUDA_HOST_VARIANTS = (
+    ('cuda_aroon',      'get_aroon',           1e-5),
+    ('cuda_bb',         'get_bb',              1e-4),
+    ('cuda_lr_exp_dev', 'get_lr_exp_dev_mini', 1e-5),
+    ('cuda_lr_slope',   'get_lr_slope',        1e-4),
+    ('cuda_pcnt_ch',    'get_pcnt_ch',         1e-6),
+    ('cuda_william_oc', 'get_william_oc',      1e-6), )
+
+_CUDA_V_VARIANTS = (
+    ('cuda_v_aroon',           'get_aroon',           1e-5),
+    ('cuda_v_bb',              'get_bb',              1e-4),
+    ('cuda_v_lr_exp_dev_mini', 'get_lr_exp_dev_mini', 1e-5),
+    ('cuda_v_lr_slope',        'get_lr_slope',        1e-4),
+    ('cuda_v_mabop_oc',        'get_mabop_oc',        1e-5),
+    ('cuda_v_pcnt_ch',         'get_pcnt_ch',         1e-6),
+    ('cuda_v_rsi',             'get_rsi',             1e-3),
+    ('cuda_v_william_oc',      'get_william_oc',      1e-6), )
+
+_cuda_required = pytest.mark.skipif(not cuda.is_available(), reason = 'CUDA device is not available')
+
+
+@_cuda_required
+@pytest.mark.parametrize('variant, baseline, atol', _CUDA_HOST_VARIANTS)
+def test_cuda_host_variant_equals_baseline(data_arr: np.ndarray, variant: str, baseline: str, atol: float) -> None:
+    res_arr = getattr(ti_lib, variant)(data_arr, 14)
+
+    _assert_close(res_arr, getattr(ti_lib, baseline)(data_arr, 14), atol)
+
+
+@_cuda_required
+@pytest.mark.parametrize('variant, baseline, atol', _CUDA_V_VARIANTS)
+def test_cuda_v_variant_equals_baseline(data_arr: np.ndarray, variant: str, baseline: str, atol: float) -> None:
+    kernel   = getattr(ti_lib, variant)
+    indx_arr = np.arange(14, DATA_SIZE, 9973)
+    d_data   = cuda.to_device(data_arr)
+    d_res    = cuda.to_device(np.zeros(indx_arr.shape[0], dtype = np.float32))
+
+    for k, indx in enumerate(indx_arr):
+        kernel[1, 1](d_data, 14, indx, k, d_res)
+
+    _assert_close(d_res.copy_to_host(), getattr(ti_lib, baseline)(data_arr, 14)[indx_arr], atol)
+
+
+@_cuda_required
+def test_cuda_v_bb_block_equals_baseline(data_arr: np.ndarray) -> None:
+    indx_arr = np.arange(14, DATA_SIZE, 997, dtype = np.int32)
+    d_res    = cuda.to_device(np.zeros(indx_arr.shape[0], dtype = np.float32))
+
+    ti_lib.cuda_v_bb_block[indx_arr.shape[0], _CUDA_REDUCE_THREADS](cuda.to_device(data_arr), 14, cuda.to_device(indx_arr), d_res)
+
+    _assert_close(d_res.copy_to_host(), ti_lib.get_bb(data_arr, 14)[indx_arr], 1e-4)
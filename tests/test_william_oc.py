@@ -0,0 +1,29 @@
+'''
+William %R OC: machine code of the njit kernels.
+'''
+
+import numba
+import pytest
+
+from technical_indicator_lib.ti_function_set import william_oc
+
+
+_KERNELS = sorted(name for name in dir(william_oc)
+                    if name.startswith('get_william_oc')
+                        and isinstance(getattr(william_oc, name), numba.core.registry.CPUDispatcher))
+
+
+def _fresh_asm(dispatcher) -> str:
+    # `inspect_asm()` is empty for kernels loaded from the on-disk cache - recompile without it.
+    options = {key: val for key, val in dispatcher.targetoptions.items() if key not in ('cache', 'nopython')}
+    fresh   = numba.njit(dispatcher.signatures[0], **options)(dispatcher.py_func)
+
+    return next(iter(fresh.inspect_asm().values()))
+
+
+@pytest.mark.parametrize('name', _KERNELS)
+def test_william_oc_no_division_checks(name: str) -> None:
+    asm = _fresh_asm(getattr(william_oc, name))
+
+    assert 'ZeroDivisionError' not in asm     # error_model = 'numpy'
+    assert '__divss3'          not in asm     # float32 division is a hardware instruction